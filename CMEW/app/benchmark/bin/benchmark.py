@@ -0,0 +1,544 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Benchmark the configuration stages of CMEW with synthetic workflows.
+
+Synthetic inputs (see ``synthetic.py``) are generated for each number of
+datasets, and the time and peak memory taken by each stage are measured:
+
+``scrape_ini``
+    Read the datasets, reference and experiment from ``rose-suite.conf``,
+    as the Jinja2 in ``flow.cylc`` does.
+``add_datasets_to_share``
+    Convert the namelist files to ``model_runs.yml`` and
+    ``cmip6_datasets.yml``.
+``update_recipe_file``
+    Add every dataset to a recipe.
+``get_variables_from_recipe``
+    List the variables needed by the recipe.
+``create_variables_file``
+    Combine the variables of several recipes and split them by stream.
+``create_request``
+    Build and write the CDDS request for one stream of one model run.
+
+The time is the fastest of a number of repeats, with the caches of parsed
+files cleared before each. The peak memory is that traced by
+:mod:`tracemalloc` in a separate run, so it doesn't slow down the timed
+runs, and doesn't include the memory allocated by libyaml.
+
+The results are written as JSON, along with the scaling exponent of each
+stage, i.e. ``k`` where the time taken grows as ``datasets ** k`` between
+the two largest numbers of datasets. Comparing them with the results of an
+earlier run finds the stages which have become slower, use more memory or
+scale worse.
+"""
+import contextlib
+import datetime
+import importlib
+import io
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import scrape_ini
+import synthetic
+import yaml_io
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The stages benchmarked, in the order they run in the workflow
+BENCHMARKS = (
+    "scrape_ini",
+    "add_datasets_to_share",
+    "update_recipe_file",
+    "get_variables_from_recipe",
+    "create_variables_file",
+    "create_request",
+)
+
+# The defaults for the size of the synthetic workflows
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_DIAGNOSTICS = 50
+DEFAULT_VARIABLES = 2000
+DEFAULT_REPEATS = 3
+
+# The number of recipes whose variables are combined
+NUMBER_OF_RECIPES = 4
+
+# A stage has regressed if it takes this many times the time or memory of
+# the baseline, and more than the minimum, which allows for noise
+REGRESSION_FACTOR = 1.5
+MINIMUM_SECONDS = 0.05
+MINIMUM_KB = 1024
+
+# A stage scales worse if its scaling exponent grows by more than this
+SCALING_TOLERANCE = 0.25
+
+# The apps whose functions are benchmarked
+APP_DIR = Path(__file__).resolve().parent.parent.parent
+BENCHMARKED_APPS = ("configure_for", "configure_standardise", "copy_datasets")
+
+# The recipe ID used in the dictionary of recipes
+RECIPE_ID = "synthetic"
+
+
+def import_app_module(name):
+    """
+    Import a module from the ``bin`` directory of a benchmarked app.
+
+    The directories are added to the module search path, as they are only
+    on ``PATH`` when the apps run.
+    """
+    for app in BENCHMARKED_APPS:
+        bin_dir = str(APP_DIR / app / "bin")
+        if bin_dir not in sys.path:
+            sys.path.append(bin_dir)
+    return importlib.import_module(name)
+
+
+def clear_caches():
+    """Forget the files parsed by earlier runs, so every run reads them."""
+    yaml_io._load_file.cache_clear()
+    scrape_ini._load_sections.cache_clear()
+
+
+@contextlib.contextmanager
+def quiet():
+    """Hide the messages printed and logged by a benchmarked stage."""
+    logging.disable(logging.INFO)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+@contextlib.contextmanager
+def environment(**variables):
+    """Set environment variables, restoring their values afterwards."""
+    original = {name: os.environ.get(name) for name in variables}
+    os.environ.update(variables)
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def measure(run, setup=None, repeats=DEFAULT_REPEATS):
+    """
+    Measure the time and peak memory taken by a function.
+
+    Parameters
+    ----------
+    run: callable
+        The function to measure, called without arguments.
+    setup: callable, optional
+        A function called, untimed, before each call to ``run``, e.g. to
+        restore a file which ``run`` overwrites.
+    repeats: int
+        The number of times to time ``run``, at least one.
+
+    Returns
+    -------
+    dict
+        The fastest and median seconds taken, and the peak memory traced
+        in kB.
+    """
+    times = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        clear_caches()
+        with quiet():
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+    # The memory is traced in a separate run, as tracing slows it down
+    if setup:
+        setup()
+    clear_caches()
+    with quiet():
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "seconds": round(min(times), 6),
+        "median_seconds": round(statistics.median(times), 6),
+        "peak_memory_kb": peak // 1024,
+    }
+
+
+def prepare_inputs(work_dir, number_of_datasets, diagnostics, variables):
+    """
+    Write the synthetic inputs of every stage.
+
+    Parameters
+    ----------
+    work_dir: Path
+        The directory to write the inputs, and the outputs of the stages, to.
+    number_of_datasets: int
+        The total number of model runs and CMIP6 datasets.
+    diagnostics: int
+        The number of diagnostics in the recipe.
+    variables: int
+        The number of different variables in the recipe, and in the
+        variables files of the recipes.
+
+    Returns
+    -------
+    dict
+        The full paths to the inputs and outputs, by name.
+    """
+    paths = {
+        "rose_suite": work_dir / "rose-suite.conf",
+        "namelists": work_dir / "namelists",
+        "datasets": work_dir / "datasets",
+        "recipe_original": work_dir / "recipe_original.yml",
+        "recipe": work_dir / f"{RECIPE_ID}.yml",
+        "recipe_dict": work_dir / "recipe_paths.yml",
+        "recipe_variables": work_dir / f"{RECIPE_ID}_variables.txt",
+        "variables_files": work_dir / "variables_files",
+        "streams": work_dir / "streams.yml",
+        "variables": work_dir / "variables.txt",
+        "request": work_dir / "request.cfg",
+    }
+    work_dir.mkdir(parents=True, exist_ok=True)
+    synthetic.write_rose_suite_conf(paths["rose_suite"], number_of_datasets)
+    synthetic.write_namelists(paths["namelists"], number_of_datasets)
+    synthetic.write_recipe(paths["recipe_original"], diagnostics, variables)
+    synthetic.write_recipe_dict(paths["recipe_dict"], RECIPE_ID)
+    synthetic.write_variables_files(
+        paths["variables_files"], NUMBER_OF_RECIPES, variables
+    )
+    synthetic.write_streams_yml(paths["streams"], variables)
+    return paths
+
+
+def stages(paths, number_of_datasets):
+    """
+    Return the stages to benchmark, for the inputs written by
+    :func:`prepare_inputs`.
+
+    Returns
+    -------
+    dict
+        The function to measure, and the function to call before each run,
+        or None, by the name of each stage in ``BENCHMARKS``.
+    """
+    add_datasets_to_share = import_app_module("add_datasets_to_share")
+    create_request_file = import_app_module("create_request_file")
+    create_variables_file = import_app_module("create_variables_file")
+    get_variables_from_recipe = import_app_module("get_variables_from_recipe")
+    update_recipe_file = import_app_module("update_recipe_file")
+
+    def run_scrape_ini():
+        scrape_ini.list_datasets(paths["rose_suite"])
+        scrape_ini.find_ref(paths["rose_suite"])
+        scrape_ini.find_eval(paths["rose_suite"])
+        scrape_ini.find_ref_label(paths["rose_suite"])
+        scrape_ini.find_eval_label(paths["rose_suite"])
+
+    def run_add_datasets_to_share():
+        add_datasets_to_share.add_datasets_to_share(
+            str(paths["namelists"]),
+            str(paths["datasets"]),
+            str(synthetic.START_YEAR),
+            "10",
+            "MOHC",
+            paths["rose_suite"],
+        )
+
+    def restore_recipe():
+        shutil.copyfile(paths["recipe_original"], paths["recipe"])
+
+    def run_update_recipe_file():
+        update_recipe_file.update_recipe_file(
+            str(paths["recipe"]),
+            str(paths["datasets"] / "model_runs.yml"),
+            str(paths["datasets"] / "cmip6_datasets.yml"),
+            RECIPE_ID,
+            str(paths["recipe_dict"]),
+        )
+
+    def run_get_variables_from_recipe():
+        get_variables_from_recipe.get_variables_from_recipe(
+            str(paths["recipe"]), str(paths["recipe_variables"])
+        )
+
+    def run_create_variables_file():
+        create_variables_file.create_variables_file(
+            str(paths["variables_files"]),
+            str(paths["streams"]),
+            str(paths["variables"]),
+        )
+
+    def run_create_request():
+        # The last model run is the slowest to find, if that matters
+        number_of_model_runs, _ = synthetic.split_datasets(number_of_datasets)
+        request = create_request_file.create_request(
+            synthetic.suite_id(number_of_model_runs - 1),
+            "apm",
+            (synthetic.START_YEAR, synthetic.START_YEAR + 9),
+            variables_path=str(paths["variables"]),
+        )
+        create_request_file.write_request(request, paths["request"])
+
+    return {
+        "scrape_ini": (run_scrape_ini, None),
+        "add_datasets_to_share": (run_add_datasets_to_share, None),
+        "update_recipe_file": (run_update_recipe_file, restore_recipe),
+        "get_variables_from_recipe": (run_get_variables_from_recipe, None),
+        "create_variables_file": (run_create_variables_file, None),
+        "create_request": (run_create_request, None),
+    }
+
+
+def request_environment(paths):
+    """Return the environment ``create_request`` reads its inputs from."""
+    return {
+        "DATASETS_LIST_DIR": str(paths["datasets"]),
+        "MIP_TABLE_DIR": "/path/to/mip_tables",
+        "RAW_DATA_DIR_MODE": "off",
+        "REQUEST_DEFAULTS_PATH": str(
+            APP_DIR / "configure_standardise" / "etc" / "request_defaults.yml"
+        ),
+        "ROOT_DATA_DIR": "/path/to/data/dir",
+        "ROOT_PROC_DIR": "/path/to/proc/dir",
+        "VARIABLES_PATH": str(paths["variables"]),
+    }
+
+
+def scaling_exponents(results):
+    """
+    Return how the time taken by each stage grows with the number of
+    datasets.
+
+    Parameters
+    ----------
+    results: list of dicts
+        The results of each stage for each number of datasets.
+
+    Returns
+    -------
+    dict
+        The exponent ``k``, where the time taken grows as
+        ``datasets ** k`` between the two largest numbers of datasets, by
+        stage. Stages measured for fewer than two numbers of datasets are
+        left out.
+    """
+    exponents = {}
+    for name in BENCHMARKS:
+        measured = sorted(
+            (result["datasets"], result["seconds"])
+            for result in results
+            if result["benchmark"] == name and result["seconds"]
+        )
+        if len(measured) < 2:
+            continue
+        (small, small_seconds), (large, large_seconds) = measured[-2:]
+        exponents[name] = round(
+            math.log(large_seconds / small_seconds) / math.log(large / small),
+            3,
+        )
+    return exponents
+
+
+def run_benchmarks(
+    sizes,
+    work_dir,
+    diagnostics=DEFAULT_DIAGNOSTICS,
+    variables=DEFAULT_VARIABLES,
+    repeats=DEFAULT_REPEATS,
+    benchmarks=BENCHMARKS,
+):
+    """
+    Benchmark the configuration stages for each number of datasets.
+
+    Parameters
+    ----------
+    sizes: list of int
+        The total numbers of model runs and CMIP6 datasets.
+    work_dir: str
+        The directory to write the synthetic inputs and outputs to.
+    diagnostics: int
+        The number of diagnostics in the recipe.
+    variables: int
+        The number of different variables in the recipe.
+    repeats: int
+        The number of times each stage is timed.
+    benchmarks: list of str
+        The names of the stages to benchmark, from ``BENCHMARKS``. Stages
+        which others depend on are run, untimed, if needed.
+
+    Returns
+    -------
+    dict
+        The results, as written to the results file.
+    """
+    results = []
+    for number_of_datasets in sizes:
+        paths = prepare_inputs(
+            Path(work_dir) / f"datasets_{number_of_datasets}",
+            number_of_datasets,
+            diagnostics,
+            variables,
+        )
+        with environment(**request_environment(paths)):
+            for name, (run, setup) in stages(
+                paths, number_of_datasets
+            ).items():
+                if name not in benchmarks:
+                    # The later stages read the outputs of the earlier ones
+                    with quiet():
+                        if setup:
+                            setup()
+                        run()
+                    continue
+                result = {"benchmark": name, "datasets": number_of_datasets}
+                result.update(measure(run, setup, repeats))
+                logger.info(
+                    "%s with %s datasets: %ss, %s kB",
+                    name,
+                    number_of_datasets,
+                    result["seconds"],
+                    result["peak_memory_kb"],
+                )
+                results.append(result)
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "sizes": list(sizes),
+            "diagnostics": diagnostics,
+            "variables": variables,
+            "repeats": repeats,
+        },
+        "results": results,
+        "scaling": scaling_exponents(results),
+    }
+
+
+def compare_results(baseline, current):
+    """
+    Find the stages which have become slower, use more memory or scale
+    worse than in the baseline.
+
+    Parameters
+    ----------
+    baseline: dict
+        The results of an earlier run, as written to the results file.
+    current: dict
+        The results of this run.
+
+    Returns
+    -------
+    list of str
+        A description of each regression.
+    """
+    regressions = []
+    earlier = {
+        (result["benchmark"], result["datasets"]): result
+        for result in baseline["results"]
+    }
+    for result in current["results"]:
+        before = earlier.get((result["benchmark"], result["datasets"]))
+        if before is None:
+            continue
+        for measurement, unit, minimum in (
+            ("seconds", "s", MINIMUM_SECONDS),
+            ("peak_memory_kb", " kB", MINIMUM_KB),
+        ):
+            old, new = before[measurement], result[measurement]
+            if (
+                old is not None
+                and new is not None
+                and new > old * REGRESSION_FACTOR
+                and new - old > minimum
+            ):
+                regressions.append(
+                    f"{result['benchmark']} with {result['datasets']} "
+                    f"datasets: {measurement} {old}{unit} -> {new}{unit}"
+                )
+    for name, exponent in current["scaling"].items():
+        old = baseline.get("scaling", {}).get(name)
+        if old is not None and exponent > old + SCALING_TOLERANCE:
+            regressions.append(f"{name}: scaling exponent {old} -> {exponent}")
+    return regressions
+
+
+def benchmark(
+    sizes,
+    output_path,
+    work_dir=None,
+    diagnostics=DEFAULT_DIAGNOSTICS,
+    variables=DEFAULT_VARIABLES,
+    repeats=DEFAULT_REPEATS,
+    baseline_path=None,
+):
+    """
+    Benchmark the configuration stages and write the results.
+
+    Parameters
+    ----------
+    sizes: list of int
+        The total numbers of model runs and CMIP6 datasets.
+    output_path: str
+        The full path to the JSON file to write the results to.
+    work_dir: str, optional
+        The directory to write the synthetic inputs and outputs to; by
+        default, a temporary directory which is removed afterwards.
+    diagnostics: int
+        The number of diagnostics in the recipe.
+    variables: int
+        The number of different variables in the recipe.
+    repeats: int
+        The number of times each stage is timed.
+    baseline_path: str, optional
+        The full path to the results of an earlier run to compare with.
+
+    Returns
+    -------
+    list of str
+        A description of each regression from the baseline.
+    """
+    with contextlib.ExitStack() as stack:
+        if not work_dir:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory())
+        results = run_benchmarks(
+            sizes, work_dir, diagnostics, variables, repeats
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    yaml_io.write_text(json.dumps(results, indent=2) + "\n", output_path)
+    logger.info("Wrote the results to %s", output_path)
+    for name, exponent in results["scaling"].items():
+        logger.info("%s scales as datasets ** %s", name, exponent)
+
+    regressions = []
+    if baseline_path:
+        with open(baseline_path) as file_handle:
+            regressions = compare_results(json.load(file_handle), results)
+        for regression in regressions:
+            logger.warning("Regression: %s", regression)
+    return regressions
@@ -0,0 +1,118 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+import sys
+from benchmark import (
+    DEFAULT_DIAGNOSTICS,
+    DEFAULT_REPEATS,
+    DEFAULT_SIZES,
+    DEFAULT_VARIABLES,
+    benchmark,
+)
+from profiling import profile_entry_point
+
+
+def parse_args_for_benchmark(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_benchmark`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Benchmark the configuration stages of CMEW with synthetic "
+            "workflows."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="The numbers of datasets in the synthetic workflows.",
+    )
+    parser.add_argument(
+        "--output_path",
+        help="The full path to the JSON file to write the results to.",
+    )
+    parser.add_argument(
+        "--work_dir",
+        help=(
+            "The directory to write the synthetic workflows to. If not "
+            "given, a temporary directory is used."
+        ),
+    )
+    parser.add_argument(
+        "--diagnostics",
+        type=int,
+        default=DEFAULT_DIAGNOSTICS,
+        help="The number of diagnostics in the synthetic recipe.",
+    )
+    parser.add_argument(
+        "--variables",
+        type=int,
+        default=DEFAULT_VARIABLES,
+        help="The number of variables in the synthetic recipe.",
+    )
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=DEFAULT_REPEATS,
+        help="The number of times each stage is timed.",
+    )
+    parser.add_argument(
+        "--baseline_path",
+        help=(
+            "The full path to the results of an earlier run. If given, "
+            "the command fails if any stage has regressed."
+        ),
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_benchmark(arguments=None):
+    """
+    Benchmark the configuration stages of CMEW with synthetic workflows.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_benchmark(arguments)
+
+    # Run the code.
+    print(f"sizes: {args.sizes}")
+    print(f"output_path: {args.output_path}")
+    print(f"work_dir: {args.work_dir}")
+    print(f"diagnostics: {args.diagnostics}")
+    print(f"variables: {args.variables}")
+    print(f"repeats: {args.repeats}")
+    print(f"baseline_path: {args.baseline_path}")
+    regressions = benchmark(
+        args.sizes,
+        args.output_path,
+        args.work_dir,
+        args.diagnostics,
+        args.variables,
+        args.repeats,
+        args.baseline_path,
+    )
+    if regressions:
+        print(
+            f"{len(regressions)} regressions from {args.baseline_path}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
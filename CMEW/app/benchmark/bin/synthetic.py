@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Generate synthetic CMEW inputs of any size, for benchmarking.
+
+The files have the same layout as those of a real workflow: the model runs
+and CMIP6 datasets of ``rose-suite.conf``, the namelist files Rose writes
+from them, an ESMValTool recipe, the variables files written for each
+recipe and ``streams.yml``. Only the number of datasets, diagnostics and
+variables changes.
+"""
+import os
+
+from yaml_io import write_yaml
+
+# The MIP tables of the variables, with the stream each is standardised from
+MIP_STREAMS = {
+    "Amon": "apm",
+    "Emon": "apm",
+    "Lmon": "apm",
+    "day": "apd",
+    "Omon": "onm",
+    "SImon": "inm",
+}
+
+# The indicators of the model runs which the recipes compare
+REFERENCE = "reference"
+EXPERIMENT = "experiment"
+
+# The first year of every dataset
+START_YEAR = 1993
+
+
+def suite_id(index):
+    """Return the suite ID of the model run with the given index."""
+    return f"u-s{index:05d}"
+
+
+def model_run(index):
+    """Return the facets of a model run, as in ``rose-suite.conf``."""
+    return {
+        "calendar": "360_day" if index % 2 else "gregorian",
+        "experiment_id": "historical" if index % 3 else "amip",
+        "label_for_plots": f"Synthetic model run {index}",
+        "model_id": f"HadGEM3-GC{index % 7}-LL",
+        "suite_id": suite_id(index),
+        "variant_label": f"r{index % 10 + 1}i1p1f3",
+    }
+
+
+def cmip6_dataset(index):
+    """Return the facets of a CMIP6 dataset, as in ``rose-suite.conf``."""
+    return {
+        "experiment_id": "historical",
+        "grid": "gn",
+        "institute": "MOHC",
+        "label_for_plots": f"CMIP6 model {index}",
+        "model_id": f"CMIP6-MODEL-{index:05d}",
+        "variant_label": "r1i1p1f1",
+    }
+
+
+def split_datasets(number_of_datasets):
+    """
+    Return the number of model runs and CMIP6 datasets in a synthetic
+    workflow.
+
+    Half of the datasets, rounded up, are model runs, and there are at
+    least two, the reference and the experiment.
+    """
+    model_runs = max(2, number_of_datasets - number_of_datasets // 2)
+    return model_runs, max(0, number_of_datasets - model_runs)
+
+
+def model_run_indicator(index):
+    """Return the indicator of a model run in ``rose-suite.conf``."""
+    return {0: REFERENCE, 1: EXPERIMENT}.get(index, str(index))
+
+
+def write_rose_suite_conf(target_path, number_of_datasets):
+    """
+    Write a ``rose-suite.conf`` file with the given number of datasets.
+
+    Parameters
+    ----------
+    target_path: str
+        The full path to the file to write.
+    number_of_datasets: int
+        The total number of model runs and CMIP6 datasets.
+    """
+    number_of_model_runs, number_of_cmip6 = split_datasets(number_of_datasets)
+    lines = [
+        "[file:cmip6_datasets.nl]",
+        "source=(namelist:cmip6_datasets(:))",
+        "",
+        "[file:model_runs.nl]",
+        "source=(namelist:model_runs(:))",
+        "",
+    ]
+    sections = [
+        (f"namelist:cmip6_datasets({index + 1})", cmip6_dataset(index))
+        for index in range(number_of_cmip6)
+    ] + [
+        (
+            f"namelist:model_runs({model_run_indicator(index)})",
+            model_run(index),
+        )
+        for index in range(number_of_model_runs)
+    ]
+    for name, facets in sections:
+        lines.append(f"[{name}]")
+        lines.extend(f'{key}="{value}"' for key, value in facets.items())
+        lines.append("")
+    lines.extend(
+        [
+            "[template variables]",
+            "NUMBER_OF_YEARS=10",
+            f"START_YEAR={START_YEAR}",
+        ]
+    )
+    with open(target_path, "w") as file_handle:
+        file_handle.write("\n".join(lines) + "\n")
+
+
+def write_namelist(target_path, group, datasets):
+    """Write datasets to a namelist file, in the format written by Rose."""
+    lines = []
+    for facets in datasets:
+        lines.append(f"&{group}")
+        lines.extend(f"{key}='{value}'," for key, value in facets.items())
+        lines.append("/")
+    with open(target_path, "w") as file_handle:
+        file_handle.write("\n".join(lines) + "\n")
+
+
+def write_namelists(target_dir, number_of_datasets):
+    """
+    Write the ``model_runs.nl`` and ``cmip6_datasets.nl`` namelist files.
+
+    Parameters
+    ----------
+    target_dir: str
+        The directory to write the namelist files to.
+    number_of_datasets: int
+        The total number of model runs and CMIP6 datasets.
+    """
+    number_of_model_runs, number_of_cmip6 = split_datasets(number_of_datasets)
+    os.makedirs(target_dir, exist_ok=True)
+    write_namelist(
+        os.path.join(target_dir, "model_runs.nl"),
+        "model_runs",
+        (model_run(index) for index in range(number_of_model_runs)),
+    )
+    write_namelist(
+        os.path.join(target_dir, "cmip6_datasets.nl"),
+        "cmip6_datasets",
+        (cmip6_dataset(index) for index in range(number_of_cmip6)),
+    )
+
+
+def variable_names(number_of_variables):
+    """
+    Return the variables of a synthetic recipe, as ``<mip>/<variable>``.
+    """
+    mips = list(MIP_STREAMS)
+    return [
+        f"{mips[index % len(mips)]}/var{index:05d}"
+        for index in range(number_of_variables)
+    ]
+
+
+def recipe(number_of_diagnostics, number_of_variables):
+    """
+    Return the content of an ESMValTool recipe.
+
+    The variables are shared out between the diagnostics, and every
+    diagnostic also uses the first variable, so that some variables are
+    needed by several diagnostics, as in real recipes.
+
+    Parameters
+    ----------
+    number_of_diagnostics: int
+        The number of diagnostics.
+    number_of_variables: int
+        The number of different variables.
+
+    Returns
+    -------
+    dict
+        The content of the recipe.
+    """
+    variables = variable_names(number_of_variables)
+    diagnostics = {}
+    for diagnostic_index in range(number_of_diagnostics):
+        diagnostic_variables = {}
+        for variable in [variables[0]] + variables[
+            diagnostic_index::number_of_diagnostics
+        ]:
+            mip, short_name = variable.split("/")
+            diagnostic_variables[short_name] = {
+                "mip": mip,
+                "preprocessor": "global_mean",
+            }
+            if diagnostic_index % 2:
+                diagnostic_variables[short_name]["additional_datasets"] = [
+                    {
+                        "dataset": "CERES-EBAF",
+                        "project": "obs4MIPs",
+                        "tier": 1,
+                    }
+                ]
+        diagnostics[f"diagnostic_{diagnostic_index:03d}"] = {
+            "description": f"Synthetic diagnostic {diagnostic_index}",
+            "variables": diagnostic_variables,
+            "scripts": {
+                "plot": {"script": "synthetic/plot.py", "quickplot": True}
+            },
+        }
+    return {
+        "documentation": {
+            "title": "Synthetic recipe",
+            "description": "A recipe generated for benchmarking CMEW.",
+            "authors": ["cmew"],
+        },
+        "datasets": [
+            {
+                "dataset": "UKESM1-0-LL",
+                "project": "CMIP6",
+                "exp": "historical",
+                "ensemble": "r1i1p1f2",
+                "grid": "gn",
+                "start_year": START_YEAR,
+                "end_year": START_YEAR + 9,
+            }
+        ],
+        "preprocessors": {
+            "global_mean": {
+                "climate_statistics": {"operator": "mean"},
+                "area_statistics": {"operator": "mean"},
+            }
+        },
+        "diagnostics": diagnostics,
+    }
+
+
+def write_recipe(target_path, number_of_diagnostics, number_of_variables):
+    """Write an ESMValTool recipe, see :func:`recipe`."""
+    write_yaml(
+        recipe(number_of_diagnostics, number_of_variables),
+        target_path,
+        sort_keys=False,
+    )
+
+
+def write_recipe_dict(target_path, recipe_id):
+    """Write the dictionary of recipes, as in ``etc/recipe_paths.yml``."""
+    write_yaml(
+        {
+            recipe_id: {
+                "recipe_name": f"{recipe_id}.yml",
+                "recipe_fp": f"{recipe_id}.yml",
+                "empty_additional_datasets": False,
+            }
+        },
+        target_path,
+    )
+
+
+def write_variables_files(target_dir, number_of_recipes, number_of_variables):
+    """
+    Write the variables file of each recipe, as written by
+    ``get_variables_from_recipe``.
+
+    Each recipe uses two thirds of the variables, overlapping with the
+    others, so the combined list has duplicates to remove.
+
+    Parameters
+    ----------
+    target_dir: str
+        The directory to write the variables files to.
+    number_of_recipes: int
+        The number of variables files.
+    number_of_variables: int
+        The total number of different variables.
+    """
+    variables = variable_names(number_of_variables)
+    os.makedirs(target_dir, exist_ok=True)
+    for recipe_index in range(number_of_recipes):
+        recipe_variables = [
+            variable
+            for index, variable in enumerate(variables)
+            if (index + recipe_index) % 3
+        ]
+        target_path = os.path.join(
+            target_dir, f"recipe_{recipe_index:02d}_variables.txt"
+        )
+        with open(target_path, "w") as file_handle:
+            file_handle.write("\n".join(recipe_variables) + "\n")
+
+
+def write_streams_yml(target_path, number_of_variables):
+    """Write the stream of every variable, as in ``etc/streams.yml``."""
+    streams = {}
+    for variable in variable_names(number_of_variables):
+        mip = variable.split("/")[0]
+        streams.setdefault(MIP_STREAMS[mip], []).append(variable)
+    write_yaml(streams, target_path)
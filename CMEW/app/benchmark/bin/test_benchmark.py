@@ -0,0 +1,105 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for benchmark.py"""
+import json
+import benchmark
+import pytest
+
+
+def results(seconds, peak_memory_kb=1000, sizes=(10, 100)):
+    """Return the results of one stage, taking the given seconds."""
+    return [
+        {
+            "benchmark": "create_request",
+            "datasets": datasets,
+            "seconds": duration,
+            "peak_memory_kb": peak_memory_kb,
+        }
+        for datasets, duration in zip(sizes, seconds)
+    ]
+
+
+def test_measure():
+    calls = []
+    measured = benchmark.measure(
+        lambda: calls.append("run"), lambda: calls.append("setup"), 2
+    )
+
+    # Each run is set up, and the memory is traced in a separate run
+    assert calls == ["setup", "run"] * 3
+    assert measured["seconds"] <= measured["median_seconds"]
+    assert measured["peak_memory_kb"] >= 0
+
+
+def test_scaling_exponents():
+    stage_results = results([0.5, 1.0, 10.0], sizes=(10, 100, 1000))
+    assert benchmark.scaling_exponents(stage_results) == {
+        "create_request": 1.0
+    }
+    assert benchmark.scaling_exponents(results([0.5])) == {}
+
+
+@pytest.mark.parametrize(
+    "seconds, peak_memory_kb, expected",
+    [
+        ([0.1, 1.0], 1000, []),
+        # Within the noise
+        ([0.12, 1.2], 1000, []),
+        ([0.1, 2.0], 1000, ["seconds 1.0s -> 2.0s", "exponent 1.0 -> 1.301"]),
+        ([0.1, 1.0], 5000, ["peak_memory_kb 1000 kB -> 5000 kB"] * 2),
+    ],
+)
+def test_compare_results(seconds, peak_memory_kb, expected):
+    baseline = {
+        "results": results([0.1, 1.0]),
+        "scaling": benchmark.scaling_exponents(results([0.1, 1.0])),
+    }
+    current = {
+        "results": results(seconds, peak_memory_kb),
+        "scaling": benchmark.scaling_exponents(results(seconds)),
+    }
+    regressions = benchmark.compare_results(baseline, current)
+
+    assert len(regressions) == len(expected)
+    for regression, text in zip(regressions, expected):
+        assert text in regression
+
+
+def test_benchmark(tmp_path):
+    output_path = tmp_path / "results" / "results.json"
+    regressions = benchmark.benchmark(
+        [4, 8],
+        output_path,
+        tmp_path / "work",
+        diagnostics=3,
+        variables=12,
+        repeats=1,
+    )
+    written = json.loads(output_path.read_text())
+
+    assert regressions == []
+    assert [
+        (result["benchmark"], result["datasets"])
+        for result in written["results"]
+    ] == [(name, 4) for name in benchmark.BENCHMARKS] + [
+        (name, 8) for name in benchmark.BENCHMARKS
+    ]
+    assert set(written["scaling"]) == set(benchmark.BENCHMARKS)
+    # The request is written for the last model run
+    assert (
+        "u-s00003"
+        in (tmp_path / "work" / "datasets_8" / "request.cfg").read_text()
+    )
+
+    # Comparing with itself finds no regressions
+    assert (
+        benchmark.benchmark(
+            [4],
+            tmp_path / "again.json",
+            diagnostics=3,
+            variables=12,
+            repeats=1,
+            baseline_path=output_path,
+        )
+        == []
+    )
@@ -0,0 +1,77 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for synthetic.py"""
+import scrape_ini
+import synthetic
+from yaml_io import load_yaml
+import pytest
+
+
+@pytest.mark.parametrize(
+    "number_of_datasets, expected", [(1, (2, 0)), (10, (5, 5)), (11, (6, 5))]
+)
+def test_split_datasets(number_of_datasets, expected):
+    assert synthetic.split_datasets(number_of_datasets) == expected
+
+
+def test_write_rose_suite_conf(tmp_path):
+    rose_suite_fp = tmp_path / "rose-suite.conf"
+    synthetic.write_rose_suite_conf(rose_suite_fp, 9)
+
+    datasets = scrape_ini.list_datasets(rose_suite_fp).split(", ")
+    assert len(datasets) == 5
+    assert scrape_ini.find_ref(rose_suite_fp) == synthetic.suite_id(0)
+    assert scrape_ini.find_eval(rose_suite_fp) == synthetic.suite_id(1)
+
+
+def test_write_namelists(tmp_path):
+    synthetic.write_namelists(tmp_path, 9)
+    model_runs = (tmp_path / "model_runs.nl").read_text().splitlines()
+    cmip6_datasets = (tmp_path / "cmip6_datasets.nl").read_text()
+
+    assert model_runs[:2] == ["&model_runs", "calendar='gregorian',"]
+    assert model_runs.count("/") == 5
+    assert cmip6_datasets.count("&cmip6_datasets") == 4
+
+
+def test_recipe():
+    recipe = synthetic.recipe(4, 10)
+    diagnostics = recipe["diagnostics"]
+
+    assert len(diagnostics) == 4
+    # Every diagnostic also uses the first variable
+    assert list(diagnostics["diagnostic_001"]["variables"]) == [
+        "var00000",
+        "var00001",
+        "var00005",
+        "var00009",
+    ]
+    assert {
+        short_name
+        for diagnostic in diagnostics.values()
+        for short_name in diagnostic["variables"]
+    } == {f"var{index:05d}" for index in range(10)}
+
+
+def test_write_variables_files(tmp_path):
+    synthetic.write_variables_files(tmp_path, 3, 9)
+    files = sorted(tmp_path.iterdir())
+
+    assert [fp.name for fp in files] == [
+        "recipe_00_variables.txt",
+        "recipe_01_variables.txt",
+        "recipe_02_variables.txt",
+    ]
+    assert len(files[0].read_text().splitlines()) == 6
+
+
+def test_write_streams_yml(tmp_path):
+    streams_fp = tmp_path / "streams.yml"
+    synthetic.write_streams_yml(streams_fp, 6)
+
+    assert load_yaml(streams_fp) == {
+        "apm": ["Amon/var00000", "Emon/var00001", "Lmon/var00002"],
+        "apd": ["day/var00003"],
+        "onm": ["Omon/var00004"],
+        "inm": ["SImon/var00005"],
+    }
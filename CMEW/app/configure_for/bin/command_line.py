@@ -1,8 +1,10 @@
 # (C) Crown Copyright 2026, Met Office.
 # The LICENSE.md file contains full licensing details.
 import argparse
+from configure_for import configure_for
 from get_variables_from_recipe import get_variables_from_recipe
 from fetch_recipe import fetch_recipe
+from profiling import profile_entry_point
 from update_recipe_file import update_recipe_file
 
 
@@ -36,9 +38,18 @@ def parse_args_for_get_variables_from_recipe(arguments):
             "variables from the ESMValTool recipe will be written."
         ),
     )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help=(
+            "Load the recipe with ESMValCore, which validates it, "
+            "rather than reading it as plain YAML."
+        ),
+    )
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_get_variables_from_recipe(arguments=None):
     """
     Retrieve variables from an ESMValTool recipe.
@@ -55,7 +66,10 @@ def main_for_get_variables_from_recipe(arguments=None):
     print("Retrieving variables from recipe.")
     print(f"Recipe path: {args.recipe_path}")
     print(f"Output filepath: {args.output_filepath}")
-    get_variables_from_recipe(args.recipe_path, args.output_filepath)
+    print(f"Validate: {args.validate}")
+    get_variables_from_recipe(
+        args.recipe_path, args.output_filepath, args.validate
+    )
 
 
 def parse_args_for_fetch_recipe(arguments):
@@ -99,9 +113,19 @@ def parse_args_for_fetch_recipe(arguments):
             "ESMValTool recipe will be written."
         ),
     )
+    parser.add_argument(
+        "--cache_dir",
+        default=None,
+        help=(
+            "The full path to the directory in which to cache recipes "
+            "for each version of ESMValTool. If not given, recipes are "
+            "not cached."
+        ),
+    )
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_fetch_recipe(arguments=None):
     """
     Retrieve an ESMValTool recipe.
@@ -119,7 +143,13 @@ def main_for_fetch_recipe(arguments=None):
     print(f"Recipe ID: {args.recipe_id}")
     print(f"Recipe dict filepath: {args.recipe_dict_fp}")
     print(f"Output filepath: {args.output_filepath}")
-    fetch_recipe(args.recipe_id, args.recipe_dict_fp, args.output_filepath)
+    print(f"Cache directory: {args.cache_dir}")
+    fetch_recipe(
+        args.recipe_id,
+        args.recipe_dict_fp,
+        args.output_filepath,
+        args.cache_dir,
+    )
 
 
 def parse_args_for_update_recipe_file(arguments):
@@ -174,6 +204,7 @@ def parse_args_for_update_recipe_file(arguments):
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_update_recipe_file(arguments=None):
     """
     Update the datasets in an ESMValTool recipe.
@@ -200,3 +231,124 @@ def main_for_update_recipe_file(arguments=None):
         args.recipe_id,
         args.recipe_dict_fp,
     )
+
+
+def parse_args_for_configure_for(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_configure_for`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fetch and update an ESMValTool recipe, "
+            "then retrieve its variables."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--recipe_id",
+        help=(
+            "The short identifier of the recipe to retrieve, "
+            "as written in the `flow.cylc` file."
+        ),
+    )
+    parser.add_argument(
+        "--recipe_dict_fp",
+        help=(
+            "The full path to the YAML file containing the "
+            "name and location within esmvaltool.recipes "
+            "of the recipe to be fetched."
+        ),
+    )
+    parser.add_argument(
+        "--recipe_path",
+        help=(
+            "The full path to where the updated "
+            "ESMValTool recipe will be written."
+        ),
+    )
+    parser.add_argument(
+        "--model_runs_yml_fp",
+        help=(
+            "The full path to the YAML file "
+            "containing details of the model runs."
+        ),
+    )
+    parser.add_argument(
+        "--cmip6_datasets_yml_fp",
+        help=(
+            "The full path to the YAML file "
+            "containing details of the CMIP6 datasets to include."
+        ),
+    )
+    parser.add_argument(
+        "--variables_filepath",
+        help=(
+            "The full path to the file where the "
+            "variables from the ESMValTool recipe will be written."
+        ),
+    )
+    parser.add_argument(
+        "--cache_dir",
+        default=None,
+        help=(
+            "The full path to the directory in which to cache recipes "
+            "for each version of ESMValTool. If not given, recipes are "
+            "not cached."
+        ),
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=0,
+        help=(
+            "The number of shards to split the recipe into by diagnostic, "
+            "to run as separate jobs. If less than 2, the recipe isn't split."
+        ),
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_configure_for(arguments=None):
+    """
+    Fetch and update an ESMValTool recipe, then retrieve its variables.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_configure_for(arguments)
+
+    # Run the code.
+    print("Configuring recipe.")
+    print(f"Recipe ID: {args.recipe_id}")
+    print(f"Recipe dict filepath: {args.recipe_dict_fp}")
+    print(f"Recipe path: {args.recipe_path}")
+    print(f"Model runs YAML path: {args.model_runs_yml_fp}")
+    print(f"CMIP6 datasets YAML path: {args.cmip6_datasets_yml_fp}")
+    print(f"Variables filepath: {args.variables_filepath}")
+    print(f"Cache directory: {args.cache_dir}")
+    print(f"Shards: {args.shards}")
+    configure_for(
+        args.recipe_id,
+        args.recipe_dict_fp,
+        args.recipe_path,
+        args.model_runs_yml_fp,
+        args.cmip6_datasets_yml_fp,
+        args.variables_filepath,
+        args.cache_dir,
+        args.shards,
+    )
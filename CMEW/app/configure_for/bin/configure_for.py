@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Fetch, update and list the variables of an ESMValTool recipe in one step.
+
+This combines ``fetch_recipe``, ``update_recipe_file`` and
+``get_variables_from_recipe`` so that the recipe is read once and held in
+memory, and the recipe and its variables are each written once at the end.
+"""
+import os
+import sys
+import logging
+from fetch_recipe import locate_recipe
+from get_variables_from_recipe import extract_variables, write_variables
+from shard_recipe import write_shards
+from update_recipe_file import update_recipe, write_recipe
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+
+def configure_for(
+    recipe_id,
+    recipe_dict_fp,
+    recipe_path,
+    model_runs_yml_fp,
+    cmip6_datasets_yml_fp,
+    variables_filepath,
+    cache_dir=None,
+    shards=0,
+):
+    """
+    Write an updated ESMValTool recipe and the list of its variables.
+
+    Parameters
+    ----------
+    recipe_id:
+        The short identifier of the recipe, as written in the `flow.cylc`
+        file, which acts as a key in the recipe_dict_fp.
+    recipe_dict_fp:
+        The full path to the YAML file containing the name and location
+        within esmvaltool.recipes of the recipe, and whether to remove
+        additional datasets.
+    recipe_path:
+        The full path to where the updated ESMValTool recipe will be written.
+    model_runs_yml_fp:
+        The full path to the YAML file containing details of the model runs.
+    cmip6_datasets_yml_fp:
+        The full path to the YAML file containing details of the CMIP6
+        datasets to include.
+    variables_filepath:
+        The full path to where the variables from the recipe will be written.
+    cache_dir: optional
+        The directory in which to cache recipes.
+    shards: optional
+        If more than one, the recipe is also split into up to this many
+        shards by diagnostic, written next to the recipe.
+    """
+    original_recipe = locate_recipe(recipe_id, recipe_dict_fp, cache_dir)
+
+    logger.info("Updating recipe from %s", original_recipe)
+    recipe = update_recipe(
+        original_recipe,
+        model_runs_yml_fp,
+        cmip6_datasets_yml_fp,
+        recipe_id,
+        recipe_dict_fp,
+    )
+    variables = extract_variables(recipe["diagnostics"])
+
+    logger.info("Writing recipe to %s", recipe_path)
+    write_recipe(recipe, recipe_path)
+    if shards > 1:
+        write_shards(recipe, recipe_path, shards)
+    logger.info("Writing variables to %s", variables_filepath)
+    write_variables(variables, variables_filepath)
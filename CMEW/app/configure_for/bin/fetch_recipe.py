@@ -1,11 +1,13 @@
 #!/usr/bin/env python
 # (C) Crown Copyright 2026, Met Office.
 # The LICENSE.md file contains full licensing details.
+import importlib.metadata
+import importlib.util
 import os
-import subprocess
-import yaml
 import sys
 import logging
+from pathlib import Path
+from yaml_io import load_yaml, write_text
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 filename = os.path.basename(__file__)
@@ -37,8 +39,7 @@ def retrieve_name_and_fp(recipe_id, recipe_dict_fp):
     logger.info("Fetching recipe %s", recipe_id)
 
     # Load the yaml config file from ../etc
-    with open(recipe_dict_fp, "r") as f:
-        recipe_dict = yaml.safe_load(f)
+    recipe_dict = load_yaml(recipe_dict_fp)
     logger.debug("Recipe dict:\n%s", recipe_dict)
 
     # Read specific recipe names and filepaths from the yaml config file
@@ -58,9 +59,120 @@ def retrieve_name_and_fp(recipe_id, recipe_dict_fp):
     return recipe_name, recipe_internal_loc
 
 
-def fetch_recipe(recipe_id, recipe_dict_fp, output_filepath):
+def find_esmvaltool_package():
     """
-    Fetch a recipe from ESMValTool and copy it to the output filepath.
+    Return the directory of the ``esmvaltool`` package.
+
+    The branch of ESMValTool cloned into ``ESMVALTOOL_DIR`` is used if it
+    exists, otherwise the package is located on the Python path without
+    importing it.
+
+    Returns
+    -------
+    Path
+        The directory of the ``esmvaltool`` package.
+
+    Raises
+    ------
+    ModuleNotFoundError
+        If ESMValTool is not installed.
+    """
+    esmvaltool_dir = os.environ.get("ESMVALTOOL_DIR")
+    if esmvaltool_dir:
+        package_dir = Path(esmvaltool_dir) / "esmvaltool"
+        if package_dir.is_dir():
+            logger.debug("Using ESMValTool branch in %s", package_dir)
+            return package_dir
+
+    spec = importlib.util.find_spec("esmvaltool")
+    if spec is None or not spec.submodule_search_locations:
+        raise ModuleNotFoundError("Unable to find the esmvaltool package")
+    package_dir = Path(spec.submodule_search_locations[0])
+    logger.debug("Using installed ESMValTool in %s", package_dir)
+    return package_dir
+
+
+def read_git_commit(repo_dir):
+    """
+    Return the commit checked out in a git repository, without running git.
+
+    Parameters
+    ----------
+    repo_dir: Path
+        The top level directory of the repository.
+
+    Returns
+    -------
+    str or None
+        The commit hash, or None if it can't be determined.
+    """
+    git_dir = Path(repo_dir) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    # A detached HEAD contains the commit itself
+    if not head.startswith("ref:"):
+        return head
+
+    # Otherwise look up the branch, which may have been packed
+    ref = head.split(":", 1)[1].strip()
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        pass
+    try:
+        packed_refs = (git_dir / "packed-refs").read_text().splitlines()
+    except OSError:
+        return None
+    for line in packed_refs:
+        if line.endswith(f" {ref}"):
+            return line.split(" ", 1)[0]
+    return None
+
+
+def esmvaltool_version_key(package_dir):
+    """
+    Return a key identifying the version of ESMValTool's recipes.
+
+    Parameters
+    ----------
+    package_dir: Path
+        The directory of the ``esmvaltool`` package.
+
+    Returns
+    -------
+    str or None
+        The git commit of a clone of ESMValTool, or the version of an
+        installed package; None if neither can be determined.
+    """
+    commit = read_git_commit(Path(package_dir).parent)
+    if commit:
+        return f"git-{commit}"
+    try:
+        return importlib.metadata.version("ESMValTool")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def copy_file(source, target):
+    """
+    Atomically copy the text file ``source`` to ``target``, creating the
+    parent directory of ``target`` if needed.
+    """
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    write_text(Path(source).read_text(encoding="utf-8"), target)
+
+
+def locate_recipe(recipe_id, recipe_dict_fp, cache_dir=None):
+    """
+    Return the location of a recipe from ESMValTool.
+
+    If ``cache_dir`` is given, the recipe is copied into a cache keyed by
+    the version of ESMValTool the first time it is requested, and read
+    from the cache thereafter.
 
     Parameters
     ----------
@@ -70,20 +182,64 @@ def fetch_recipe(recipe_id, recipe_dict_fp, output_filepath):
     recipe_dict_fp : str
         The filepath of the YAML file containing the name and location
         within esmvaltool.recipes of the recipe to be fetched.
-    output_filepath: str
-        The full path to the where the ESMValTool recipe will be written.
+    cache_dir: str, optional
+        The directory in which to cache recipes.
+
+    Returns
+    -------
+    Path
+        The location of the recipe.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the recipe does not exist in ESMValTool.
     """
     # Find the full name and location within ESMValTool
-    recipe_name, recipe_internal_loc = retrieve_name_and_fp(
-        recipe_id, recipe_dict_fp
-    )
-
-    # Build the command to fetch and move the recipe
-    command = f"""
-    esmvaltool recipes get {recipe_internal_loc}
-    mv {recipe_name} {output_filepath}
+    _, recipe_internal_loc = retrieve_name_and_fp(recipe_id, recipe_dict_fp)
+
+    package_dir = find_esmvaltool_package()
+    cached_recipe = None
+    if cache_dir:
+        version_key = esmvaltool_version_key(package_dir)
+        if version_key is None:
+            logger.warning("Unknown ESMValTool version, not using cache")
+        else:
+            cached_recipe = Path(cache_dir) / version_key / recipe_internal_loc
+            if cached_recipe.is_file():
+                logger.info("Using cached recipe %s", cached_recipe)
+                return cached_recipe
+
+    recipe = package_dir / "recipes" / recipe_internal_loc
+    if not recipe.is_file():
+        raise FileNotFoundError(
+            f"Recipe {recipe_internal_loc} not found in {package_dir}"
+        )
+
+    if cached_recipe is None:
+        return recipe
+    logger.info("Caching recipe %s in %s", recipe, cached_recipe)
+    copy_file(recipe, cached_recipe)
+    return cached_recipe
+
+
+def fetch_recipe(recipe_id, recipe_dict_fp, output_filepath, cache_dir=None):
     """
+    Fetch a recipe from ESMValTool and copy it to the output filepath.
 
-    # Run the command
-    logging.info("Running command: %s", command)
-    subprocess.run(command, shell=True)
+    Parameters
+    ----------
+    recipe_id : str
+        The short identifier of the recipe to retrieve,
+        as written in the `flow.cylc` file.
+    recipe_dict_fp : str
+        The filepath of the YAML file containing the name and location
+        within esmvaltool.recipes of the recipe to be fetched.
+    output_filepath: str
+        The full path to the where the ESMValTool recipe will be written.
+    cache_dir: str, optional
+        The directory in which to cache recipes.
+    """
+    recipe = locate_recipe(recipe_id, recipe_dict_fp, cache_dir)
+    logger.info("Copying %s to %s", recipe, output_filepath)
+    copy_file(recipe, output_filepath)
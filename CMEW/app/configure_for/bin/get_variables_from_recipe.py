@@ -3,18 +3,88 @@
 # The LICENSE.md file contains full licensing details.
 """
 Outputs the variables from an ESMValTool recipe.
+
+The recipe is read as plain YAML. Loading it with ESMValCore, which imports
+Iris, Dask and the CMOR tables, is only done when validation is requested.
 """
 import os
-from esmvalcore.experimental.recipe import Recipe
 import sys
 import logging
+from yaml_io import load_yaml
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
-def parse_variables_from_recipe(recipe_path):
+def load_diagnostics(recipe_path, validate=False):
+    """Return the diagnostics section of an ESMValTool recipe.
+
+    Parameters
+    ----------
+    recipe_path : str
+        Location of the ESMValTool recipe file.
+    validate : bool
+        Whether to load (and so validate) the recipe with ESMValCore
+        rather than reading it as plain YAML.
+
+    Returns
+    -------
+    dict
+        The diagnostics defined in the recipe.
+    """
+    logger.debug("Loading recipe %s", recipe_path)
+    if validate:
+        # Imported here as it is slow and uses a lot of memory
+        from esmvalcore.experimental.recipe import Recipe
+
+        return Recipe(recipe_path).data["diagnostics"]
+    return load_yaml(recipe_path)["diagnostics"]
+
+
+def extract_variables(diagnostics):
+    """Return the variables required by the diagnostics of a recipe.
+
+    Diagnostics without variables (e.g. those which only use the output of
+    other diagnostics) are skipped.
+
+    Parameters
+    ----------
+    diagnostics : dict
+        The diagnostics section of an ESMValTool recipe.
+
+    Returns
+    -------
+    list[str]
+        The unique variables, in the order they first appear,
+        formatted as ``<mip>/<variable>``.
+    """
+    # A dictionary is used as an ordered set
+    formatted_variables = {}
+    for diagnostic, diagnostic_items in diagnostics.items():
+        variables = diagnostic_items.get("variables") or {}
+        logger.debug("Diagnostic %s variables:\n%s", diagnostic, variables)
+        for variable, variable_items in variables.items():
+            log_text = "key"
+            if "short_name" in variable_items:
+                log_text = "short name"
+                variable = variable_items["short_name"]
+            logger.debug(f"Using {log_text} {variable}")
+
+            # Look up the mip key which is, so far, always present
+            mip = variable_items["mip"]
+
+            # Construct the string expected by CDDS
+            formatted_variable = f"{mip}/{variable}"
+
+            # Add only if not already present
+            if formatted_variable not in formatted_variables:
+                formatted_variables[formatted_variable] = None
+                logger.debug("Adding variable %s", formatted_variable)
+    return list(formatted_variables)
+
+
+def parse_variables_from_recipe(recipe_path, validate=False):
     """Retrieve variables from ESMValTool recipe.
 
     This function will first look to see if the variable's "short_name"
@@ -74,6 +144,8 @@ def parse_variables_from_recipe(recipe_path):
     ----------
     recipe_path : str
         Location of the ESMValTool recipe file.
+    validate : bool
+        Whether to load (and so validate) the recipe with ESMValCore.
 
     Returns
     -------
@@ -81,31 +153,8 @@ def parse_variables_from_recipe(recipe_path):
         List of variables from the ESMValTool recipe,
         formatted as ``<mip>/<variable>``.
     """
-    recipe = Recipe(recipe_path)
-    logger.debug("Loading recipe %s", recipe_path)
-    diagnostics = recipe.data["diagnostics"]
-    formatted_variables = []
-    for diagnostic in diagnostics:
-        variables = diagnostics[diagnostic]["variables"]
-        logger.debug("Diagnostic % variables:\n%s", diagnostic, variables)
-        for variable, variable_items in variables.items():
-            log_text = "key"
-            if "short_name" in variable_items:
-                log_text = "short name"
-                variable = variable_items["short_name"]
-            logger.debug(f"Using {log_text} {variable}")
-
-            # Look up the mip key which is, so far, always present
-            mip = variable_items["mip"]
-
-            # Construct the string expected by CDDS
-            formatted_variable = f"{mip}/{variable}"
-
-            # Add only if not already present
-            if formatted_variable not in formatted_variables:
-                formatted_variables.append(formatted_variable)
-                logger.debug("Adding variable %s", formatted_variable)
-    return formatted_variables
+    diagnostics = load_diagnostics(recipe_path, validate)
+    return extract_variables(diagnostics)
 
 
 def write_variables(variables, target_path):
@@ -125,6 +174,6 @@ def write_variables(variables, target_path):
         target_file.write(variables_str)
 
 
-def get_variables_from_recipe(recipe_path, output_filepath):
-    variables = parse_variables_from_recipe(recipe_path)
+def get_variables_from_recipe(recipe_path, output_filepath, validate=False):
+    variables = parse_variables_from_recipe(recipe_path, validate)
     write_variables(variables, output_filepath)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Split an ESMValTool recipe into shards, by diagnostic.
+
+Each shard is a copy of the recipe with some of its diagnostics, so the
+shards can be run as separate jobs at the same time. Diagnostics whose
+scripts use the output of another diagnostic (through ``ancestors``) are
+kept in the same shard. The groups of diagnostics are shared between the
+shards so that each has about the same number of variable groups and
+scripts.
+"""
+import copy
+import fnmatch
+import glob
+import heapq
+import logging
+import os
+import sys
+from pathlib import Path
+
+from update_recipe_file import write_recipe
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+
+def shard_path(recipe_path, shard):
+    """
+    Return the path of a shard of a recipe.
+
+    Parameters
+    ----------
+    recipe_path: str
+        The full path to the recipe, e.g. ``recipe_radiation_budget.yml``.
+    shard: int
+        The number of the shard, from 1.
+
+    Returns
+    -------
+    Path
+        The full path to the shard, e.g.
+        ``recipe_radiation_budget_shard1.yml``.
+    """
+    recipe_path = Path(recipe_path)
+    return recipe_path.with_name(
+        f"{recipe_path.stem}_shard{shard}{recipe_path.suffix}"
+    )
+
+
+def find_ancestors(diagnostic, diagnostic_names):
+    """
+    List the diagnostics whose output is used by a diagnostic.
+
+    Parameters
+    ----------
+    diagnostic: dict
+        The diagnostic, from the recipe.
+    diagnostic_names: list of str
+        The names of every diagnostic in the recipe.
+
+    Returns
+    -------
+    set of str
+        The names of the diagnostics matching the ancestors of any script,
+        e.g. "diagnostic/script" or "diagnostic/*".
+    """
+    ancestors = set()
+    for script in (diagnostic.get("scripts") or {}).values():
+        for ancestor in (script or {}).get("ancestors", []):
+            pattern = ancestor.split("/")[0]
+            ancestors.update(fnmatch.filter(diagnostic_names, pattern))
+    return ancestors
+
+
+def group_diagnostics(diagnostics):
+    """
+    Group the diagnostics which depend on each other.
+
+    Parameters
+    ----------
+    diagnostics: dict
+        The diagnostics of the recipe.
+
+    Returns
+    -------
+    list of lists
+        The names of the diagnostics in each group, in recipe order.
+    """
+    names = list(diagnostics)
+    group_of = {name: name for name in names}
+
+    def find(name):
+        while group_of[name] != name:
+            group_of[name] = group_of[group_of[name]]
+            name = group_of[name]
+        return name
+
+    for name, diagnostic in diagnostics.items():
+        for ancestor in find_ancestors(diagnostic or {}, names):
+            group_of[find(ancestor)] = find(name)
+
+    groups = {}
+    for name in names:
+        groups.setdefault(find(name), []).append(name)
+    return list(groups.values())
+
+
+def diagnostic_weight(diagnostic):
+    """Return the number of variable groups and scripts in a diagnostic."""
+    diagnostic = diagnostic or {}
+    return max(
+        1,
+        len(diagnostic.get("variables") or {})
+        + len(diagnostic.get("scripts") or {}),
+    )
+
+
+def shard_recipe(recipe, number_of_shards):
+    """
+    Split a recipe into shards.
+
+    Each group of diagnostics, largest first, goes into the shard with the
+    smallest total weight.
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe.
+    number_of_shards: int
+        The maximum number of shards.
+
+    Returns
+    -------
+    list of dicts
+        The recipe of each shard; there are no shards without diagnostics.
+    """
+    diagnostics = recipe["diagnostics"]
+    groups = group_diagnostics(diagnostics)
+    weights = [
+        sum(diagnostic_weight(diagnostics[name]) for name in group)
+        for group in groups
+    ]
+    number_of_shards = max(1, min(number_of_shards, len(groups)))
+    heap = [(0, shard) for shard in range(number_of_shards)]
+    shard_names = [set() for _ in range(number_of_shards)]
+    order = sorted(range(len(groups)), key=lambda i: weights[i], reverse=True)
+    for group_index in order:
+        total, shard = heapq.heappop(heap)
+        shard_names[shard].update(groups[group_index])
+        heapq.heappush(heap, (total + weights[group_index], shard))
+
+    shards = []
+    for names in shard_names:
+        shard = dict(recipe)
+        shard["diagnostics"] = {
+            name: copy.deepcopy(diagnostic)
+            for name, diagnostic in diagnostics.items()
+            if name in names
+        }
+        shards.append(shard)
+    return shards
+
+
+def write_shards(recipe, recipe_path, number_of_shards):
+    """
+    Write the shards of a recipe next to it.
+
+    Shards written for a previous version of the recipe, which aren't
+    needed any more, are removed.
+
+    Parameters
+    ----------
+    recipe: dict
+        The recipe.
+    recipe_path: str
+        The full path to the recipe.
+    number_of_shards: int
+        The maximum number of shards.
+
+    Returns
+    -------
+    list of Path
+        The full paths to the shards.
+    """
+    shards = shard_recipe(recipe, number_of_shards)
+    paths = []
+    for shard_number, shard in enumerate(shards, 1):
+        path = shard_path(recipe_path, shard_number)
+        logger.info(
+            "Writing diagnostics %s to %s", list(shard["diagnostics"]), path
+        )
+        write_recipe(shard, path)
+        paths.append(path)
+
+    for stale_path in glob.glob(str(shard_path(recipe_path, "*"))):
+        if Path(stale_path) not in paths:
+            logger.info("Removing %s", stale_path)
+            os.remove(stale_path)
+    return paths
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Unit tests for configure_for.py
+
+Test data files:
+/app/unittest/mock_data/original_recipe_radiation_budget.yml
+    input for test_configure_for
+/app/unittest/mock_data/model_runs.yml
+    input for test_configure_for
+/app/unittest/mock_data/cmip6_datasets.yml
+    input for test_configure_for
+/app/unittest/kgo/extended_radiation_budget_recipe.yml
+    kgo for test_configure_for
+/app/unittest/kgo/radiation_budget_variables.txt
+    kgo for test_configure_for
+"""
+import shutil
+from configure_for import configure_for
+from configure_for_conftest import (
+    recipe_paths_yml_fp,
+    model_runs_yml_fp,
+    cmip6_datasets_yml_fp,
+    original_recipe_radiation_budget_fp,
+    extended_radiation_budget_recipe_yml_fp,
+    kgo_dir,
+)
+
+
+def test_configure_for(tmp_path, monkeypatch):
+    # Provide the original recipe from a fake clone of ESMValTool
+    recipes_dir = tmp_path / "ESMValTool" / "esmvaltool" / "recipes"
+    recipes_dir.mkdir(parents=True)
+    shutil.copy(
+        str(original_recipe_radiation_budget_fp()),
+        recipes_dir / "recipe_radiation_budget.yml",
+    )
+    monkeypatch.setenv("ESMVALTOOL_DIR", str(tmp_path / "ESMValTool"))
+
+    recipe_path = tmp_path / "recipe_radiation_budget.yml"
+    variables_path = tmp_path / "radiation_budget_variables.txt"
+    configure_for(
+        "radiation_budget",
+        str(recipe_paths_yml_fp()),
+        str(recipe_path),
+        str(model_runs_yml_fp()),
+        str(cmip6_datasets_yml_fp()),
+        str(variables_path),
+    )
+
+    # Remove the five comment lines at the top of the KGO recipe
+    with open(str(extended_radiation_budget_recipe_yml_fp()), "r") as kgo:
+        expected_recipe = kgo.readlines()[5:]
+    with open(recipe_path, "r") as file_handle:
+        assert file_handle.readlines() == expected_recipe
+
+    expected_variables_path = kgo_dir() / "radiation_budget_variables.txt"
+    with open(expected_variables_path, "r") as kgo:
+        expected_variables = kgo.read()
+    assert variables_path.read_text() == expected_variables
@@ -2,7 +2,13 @@
 # (C) Crown Copyright 2026, Met Office.
 # The LICENSE.md file contains full licensing details.
 """Unit tests for fetch_recipe.py."""
-from fetch_recipe import retrieve_name_and_fp
+import pytest
+import fetch_recipe
+from fetch_recipe import (
+    retrieve_name_and_fp,
+    read_git_commit,
+    locate_recipe,
+)
 from configure_for_conftest import recipe_paths_yml_fp
 
 
@@ -20,3 +26,56 @@ def test_retrieve_defaults():
     actual = retrieve_name_and_fp(test_recipe_id, str(recipe_paths_yml_fp()))
 
     assert actual == expected
+
+
+@pytest.fixture
+def fake_esmvaltool(tmp_path, monkeypatch):
+    """A clone of ESMValTool containing a single recipe."""
+    package_dir = tmp_path / "ESMValTool" / "esmvaltool"
+    recipe = package_dir / "recipes" / "subdir_1" / "recipe_second_name.yml"
+    recipe.parent.mkdir(parents=True)
+    recipe.write_text("diagnostics: {}\n")
+    git_dir = tmp_path / "ESMValTool" / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("abc123\n")
+    monkeypatch.setenv("ESMVALTOOL_DIR", str(tmp_path / "ESMValTool"))
+    return recipe
+
+
+def test_read_git_commit_packed_refs(tmp_path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled\ndef456 refs/heads/main\n"
+    )
+    assert read_git_commit(tmp_path) == "def456"
+
+
+def test_locate_recipe_without_cache(fake_esmvaltool):
+    actual = locate_recipe("mock_entry", str(recipe_paths_yml_fp()))
+    assert actual == fake_esmvaltool
+
+
+def test_locate_recipe_uses_cache(fake_esmvaltool, tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected = cache_dir / "git-abc123" / "subdir_1" / "recipe_second_name.yml"
+
+    actual = locate_recipe("mock_entry", str(recipe_paths_yml_fp()), cache_dir)
+    assert actual == expected
+    assert expected.read_text() == "diagnostics: {}\n"
+
+    # Later requests for the same version don't need ESMValTool's copy
+    fake_esmvaltool.unlink()
+    actual = locate_recipe("mock_entry", str(recipe_paths_yml_fp()), cache_dir)
+    assert actual == expected
+
+
+def test_fetch_recipe_missing(fake_esmvaltool, tmp_path):
+    output_filepath = tmp_path / "recipe.yml"
+    with pytest.raises(FileNotFoundError, match="recipe_not_here.yml"):
+        fetch_recipe.fetch_recipe(
+            "not_here", str(recipe_paths_yml_fp()), str(output_filepath)
+        )
+    assert not output_filepath.exists()
@@ -13,6 +13,7 @@ Test data files:
     kgo for test_write_variables
 """
 from get_variables_from_recipe import (
+    extract_variables,
     parse_variables_from_recipe,
     write_variables,
 )
@@ -78,6 +79,29 @@ def test_parse_variables_from_short_name_key(path_to_zec_recipe):
     assert actual == expected
 
 
+def test_parse_variables_with_validation(path_to_zec_recipe):
+    pytest.importorskip("esmvalcore")
+    actual = parse_variables_from_recipe(path_to_zec_recipe, validate=True)
+    expected = ["Amon/tas"]
+    assert actual == expected
+
+
+def test_extract_variables_skips_diagnostics_without_variables():
+    diagnostics = {
+        "diag_1": {
+            "variables": {
+                "tas": {"mip": "Amon"},
+                "tas_again": {"short_name": "tas", "mip": "Amon"},
+            },
+        },
+        "diag_2": {"scripts": {"plot": {"ancestors": ["diag_1/tas"]}}},
+        "diag_3": {"variables": {"pr": {"mip": "Amon"}}},
+    }
+    actual = extract_variables(diagnostics)
+    expected = ["Amon/tas", "Amon/pr"]
+    assert actual == expected
+
+
 def test_write_variables(path_to_radiation_budget_variables):
     input = [
         "Emon/rss",
@@ -0,0 +1,67 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for shard_recipe.py"""
+from pathlib import Path
+from shard_recipe import group_diagnostics, shard_recipe, write_shards
+import yaml
+
+RECIPE = {
+    "documentation": {"title": "Test recipe"},
+    "datasets": [{"dataset": "HadGEM3-GC31-LL"}],
+    "diagnostics": {
+        "maps": {
+            "variables": {"tas": {}, "pr": {}, "rsut": {}},
+            "scripts": {"plot": {"script": "maps.py"}},
+        },
+        "timeseries": {
+            "variables": {"tas": {}},
+            "scripts": None,
+        },
+        "seasonal": {
+            "variables": {"tas": {}, "pr": {}},
+            "scripts": {"plot": {"script": "seasonal.py"}},
+        },
+        "summary": {
+            "scripts": {
+                "table": {
+                    "script": "summary.py",
+                    "ancestors": ["seasonal/plot", "timeseries*"],
+                }
+            },
+        },
+    },
+}
+
+
+def test_group_diagnostics():
+    actual = group_diagnostics(RECIPE["diagnostics"])
+    expected = [["maps"], ["timeseries", "seasonal", "summary"]]
+    assert actual == expected
+
+
+def test_shard_recipe():
+    shards = shard_recipe(RECIPE, 2)
+    actual = [list(shard["diagnostics"]) for shard in shards]
+    expected = [["timeseries", "seasonal", "summary"], ["maps"]]
+    assert actual == expected
+    assert all(shard["datasets"] == RECIPE["datasets"] for shard in shards)
+
+
+def test_shard_recipe_no_empty_shards():
+    shards = shard_recipe(RECIPE, 4)
+    assert len(shards) == 2
+
+
+def test_write_shards(tmp_path):
+    recipe_path = tmp_path / "recipe_test.yml"
+    stale_path = tmp_path / "recipe_test_shard3.yml"
+    stale_path.write_text("diagnostics: {}")
+    paths = write_shards(RECIPE, recipe_path, 3)
+
+    assert paths == [
+        Path(tmp_path / "recipe_test_shard1.yml"),
+        Path(tmp_path / "recipe_test_shard2.yml"),
+    ]
+    assert not stale_path.exists()
+    with open(paths[1]) as file_handle:
+        assert list(yaml.safe_load(file_handle)["diagnostics"]) == ["maps"]
@@ -8,15 +8,17 @@ Overwrite the ESMValTool recipe with an updated version. Include:
 * User configurable variables from the Rose suite configuration
 """
 import os
-import yaml
 import sys
 import logging
+from tracing import traced
+from yaml_io import load_yaml, write_yaml
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
+@traced
 def return_blank_recipe(recipe_path):
     """Empty the datasets section of an ESMValTool recipe.
 
@@ -30,8 +32,7 @@ def return_blank_recipe(recipe_path):
     recipe_content: dict
         The content of the ESMValTool recipe with an empty datasets section.
     """
-    with open(recipe_path, "r") as file_handle:
-        recipe_content = yaml.safe_load(file_handle)
+    recipe_content = load_yaml(recipe_path)
 
     # Empty the datasets section of the recipe
     logger.debug("Emptying datasets from %s", recipe_path)
@@ -40,6 +41,7 @@ def return_blank_recipe(recipe_path):
     return recipe_content
 
 
+@traced
 def add_extra_datasets(recipe_content, yaml_filepath):
     """
     Adds all datasets listed in a YAML file to an ESMValTool recipe.
@@ -60,8 +62,7 @@ def add_extra_datasets(recipe_content, yaml_filepath):
         with an extended datasets section.
     """
     # Read the extra datasets from the provided YAML file
-    with open(yaml_filepath, "r") as file_handle:
-        extra_datasets = yaml.safe_load(file_handle)
+    extra_datasets = load_yaml(yaml_filepath)
     logger.debug("Processing extra datasets:\n%s", extra_datasets)
 
     # ESMValTool recipes expect keys to be "dataset", "ensemble", "exp" etc.
@@ -94,6 +95,7 @@ def add_extra_datasets(recipe_content, yaml_filepath):
     return recipe_content
 
 
+@traced
 def remove_additional_datasets(recipe_content, recipe_id, recipe_dict_fp):
     """
     Optionally remove additional_datasets sections from an ESMValTool recipe.
@@ -119,8 +121,7 @@ def remove_additional_datasets(recipe_content, recipe_id, recipe_dict_fp):
     """
     # Load the yaml config file from ../etc
     logger.debug("Reading recipe dict from %s", recipe_dict_fp)
-    with open(recipe_dict_fp, "r") as f:
-        recipe_dict = yaml.safe_load(f)
+    recipe_dict = load_yaml(recipe_dict_fp)
     logger.debug("Recipe dict:\n%s", recipe_dict)
 
     # Don't empty by default
@@ -148,6 +149,7 @@ def remove_additional_datasets(recipe_content, recipe_id, recipe_dict_fp):
     return recipe_content
 
 
+@traced
 def write_recipe(updated_recipe, target_path):
     """Write updated ESMValTool recipe to a YAML file at ``target_path``.
 
@@ -159,16 +161,11 @@ def write_recipe(updated_recipe, target_path):
     target_path: str
         Location to write the updated ESMValTool recipe.
     """
-    with open(target_path, "w") as file_handle:
-        yaml.dump(
-            updated_recipe,
-            file_handle,
-            default_flow_style=False,
-            sort_keys=True,
-        )
+    write_yaml(updated_recipe, target_path)
 
 
-def update_recipe_file(
+@traced
+def update_recipe(
     recipe_path,
     model_runs_yml_fp,
     cmip6_datasets_yml_fp,
@@ -176,14 +173,12 @@ def update_recipe_file(
     recipe_dict_fp,
 ):
     """
-    Update the datasets in an ESMValTool recipe.
-
-    Overwrite the original recipe content with the updated recipe content.
+    Return the content of an ESMValTool recipe with updated datasets.
 
     Parameters
     ----------
     recipe_path:
-        The full path to the ESMValTool recipe.
+        The full path to the original ESMValTool recipe.
     model_runs_yml_fp:
         The full path to the YAML file containing details of the model runs.
     cmip6_datasets_yml_fp:
@@ -194,6 +189,11 @@ def update_recipe_file(
     recipe_dict_fp:
         The full path to the YAML file containing information
         about whether to remove additional datasets.
+
+    Returns
+    -------
+    dict
+        The content of the updated ESMValTool recipe.
     """
     blank_recipe = return_blank_recipe(recipe_path)
     logger.info("Amending recipe from %s", recipe_path)
@@ -211,4 +211,42 @@ def update_recipe_file(
     logger.info("Adding CMIP6 runs to recipe")
     extended_recipe = add_extra_datasets(updated_recipe, cmip6_datasets_yml_fp)
 
+    return extended_recipe
+
+
+@traced
+def update_recipe_file(
+    recipe_path,
+    model_runs_yml_fp,
+    cmip6_datasets_yml_fp,
+    recipe_id,
+    recipe_dict_fp,
+):
+    """
+    Update the datasets in an ESMValTool recipe.
+
+    Overwrite the original recipe content with the updated recipe content.
+
+    Parameters
+    ----------
+    recipe_path:
+        The full path to the ESMValTool recipe.
+    model_runs_yml_fp:
+        The full path to the YAML file containing details of the model runs.
+    cmip6_datasets_yml_fp:
+        The full path to the YAML file containing details of the CMIP6
+        datasets to include.
+    recipe_id:
+        The id that acts as a key in the recipe_dict_fp.
+    recipe_dict_fp:
+        The full path to the YAML file containing information
+        about whether to remove additional datasets.
+    """
+    extended_recipe = update_recipe(
+        recipe_path,
+        model_runs_yml_fp,
+        cmip6_datasets_yml_fp,
+        recipe_id,
+        recipe_dict_fp,
+    )
     write_recipe(extended_recipe, recipe_path)
@@ -3,6 +3,7 @@
 import argparse
 
 from configure_recipe import configure_recipe
+from profiling import profile_entry_point
 
 
 def parse_args_for_configure_recipe(arguments):
@@ -75,6 +76,7 @@ def parse_args_for_configure_recipe(arguments):
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_configure_recipe(arguments=None):
     """
     Setup the configuration for ESMValTool.
@@ -6,15 +6,17 @@ Generate the required user configuration file for ESMValTool.
 """
 
 import os
-import yaml
 import sys
 import logging
+from tracing import traced
+import yaml_io
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
+@traced
 def create_developer_config(
     mip_table_dir,
 ):
@@ -126,6 +128,7 @@ def create_developer_config(
     return developer_config_file_contents
 
 
+@traced
 def create_user_config(
     cmew_data_for_esmval_dir,
     dev_config_path,
@@ -207,6 +210,7 @@ def ensure_parent_dir(file_path):
         os.makedirs(parent_dir, exist_ok=True)
 
 
+@traced
 def write_yaml(file_path, contents):
     """
     Write ``contents`` to the YAML file at ``file_path``.
@@ -218,15 +222,10 @@ def write_yaml(file_path, contents):
     contents : dict
         The contents to write.
     """
-    with open(file_path, "w", encoding="utf-8") as file_handle:
-        yaml.safe_dump(
-            contents,
-            file_handle,
-            default_flow_style=False,
-            sort_keys=False,
-        )
+    yaml_io.write_yaml(contents, file_path, sort_keys=False)
 
 
+@traced
 def configure_recipe(
     cmew_data_for_esmval_dir,
     dev_config_path,
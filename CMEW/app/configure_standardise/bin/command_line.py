@@ -1,7 +1,9 @@
 # (C) Crown Copyright 2026, Met Office.
 # The LICENSE.md file contains full licensing details.
 import argparse
+from cdds_dirs import record_cdds_dirs
 from create_variables_file import create_variables_file
+from profiling import profile_entry_point
 
 
 def parse_args_for_create_variables_file(arguments):
@@ -49,6 +51,7 @@ def parse_args_for_create_variables_file(arguments):
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_create_variables_file(arguments=None):
     """
     Create a variables file to standardise model data with CDDS.
@@ -70,3 +73,75 @@ def main_for_create_variables_file(arguments=None):
         args.stream_config_fp,
         args.output_filepath,
     )
+
+
+def parse_args_for_record_cdds_dirs(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_record_cdds_dirs`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Record the directories CDDS uses for the requests "
+            "of a model run."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--request_path",
+        help=(
+            "The full path to the request configuration file "
+            "for all streams."
+        ),
+    )
+    parser.add_argument(
+        "--streams",
+        nargs="+",
+        help="The names of the streams.",
+    )
+    parser.add_argument(
+        "--chunks",
+        nargs="+",
+        help="The first year of each chunk of years.",
+    )
+    parser.add_argument(
+        "--index_path",
+        help="The full path to the file where the index will be written.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_record_cdds_dirs(arguments=None):
+    """
+    Record the directories CDDS uses for the requests of a model run.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_record_cdds_dirs(arguments)
+
+    # Run the code.
+    print(f"request_path: {args.request_path}")
+    print(f"streams: {args.streams}")
+    print(f"chunks: {args.chunks}")
+    print(f"index_path: {args.index_path}")
+    record_cdds_dirs(
+        args.index_path,
+        args.request_path,
+        args.streams,
+        args.chunks,
+    )
@@ -7,14 +7,32 @@ set -eux
 
 echo "Running configure_standardise"
 
-# Create request configuration file.
+# Create a request configuration file for each stream with variables
+# and each chunk of years.
 cmew-esmvaltool-env create_request_file.py
 
-# Create CDDS directory structure and variables list.
-cmew-standardise-env create_cdds_directory_structure "${REQUEST_PATH}"
-cmew-standardise-env prepare_generate_variable_list "${REQUEST_PATH}"
+# Create CDDS directory structure and variables list for each request.
+for stream in ${STREAMS}; do
+    for chunk in ${CHUNKS}; do
+        stream_request_path="${REQUEST_PATH%.cfg}_${stream}_${chunk}.cfg"
+        if [[ ! -f "${stream_request_path}" ]]; then
+            echo "[INFO] No variables to standardise from stream ${stream}"
+            continue
+        fi
 
-# If using saved data, symlink it to the workflow
-if [[ "${RAW_DATA_DIR_MODE}" == "use_saved" ]]; then
-    cmew-standardise-env cdds_arrange_input_data "${REQUEST_PATH}" "${RAW_DATA_DIR_SUITE}"
-fi
+        cmew-standardise-env create_cdds_directory_structure "${stream_request_path}"
+        cmew-standardise-env prepare_generate_variable_list "${stream_request_path}"
+
+        # If using saved data, symlink it to the workflow
+        if [[ "${RAW_DATA_DIR_MODE}" == "use_saved" ]]; then
+            cmew-standardise-env cdds_arrange_input_data "${stream_request_path}" "${RAW_DATA_DIR_SUITE}"
+        fi
+    done
+done
+
+# Record the directories of every request, so later tasks can look them up
+cmew-esmvaltool-env record_cdds_dirs \
+    --request_path "${REQUEST_PATH}" \
+    --streams ${STREAMS} \
+    --chunks ${CHUNKS} \
+    --index_path "${CDDS_DIRS_PATH}"
@@ -5,17 +5,31 @@
 Generate CDDS request configuration file.
 """
 import configparser
+import itertools
 import os
 import sys
 from pathlib import Path
-import yaml
 import logging
+from chunks import iter_chunks
+from create_variables_file import write_variables
+from profiling import profile_entry_point
+from standardised_store import (
+    index_drs_tree,
+    index_store,
+    link_stored_files,
+    merge_indexes,
+    plan_chunks,
+)
+from streams import stream_file_path
+from tracing import span, traced
+from yaml_io import load_yaml
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
 filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
+@traced
 def load_request_defaults():
     """
     Load default values for request file.
@@ -29,8 +43,7 @@ def load_request_defaults():
     defaults = os.environ["REQUEST_DEFAULTS_PATH"]
 
     # Read the defaults
-    with open(defaults, "r") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(defaults)
 
     logger.debug(
         "Default config:\n%s",
@@ -84,12 +97,36 @@ def list_streams(variables_file):
     return stream_str
 
 
-def create_request(model_run):
+@traced
+def create_request(
+    model_run, stream=None, chunk=None, years=None, variables_path=None
+):
     """
     Build a CDDS request configuration for a run identified by a suite_id.
 
     Uses information from the model_runs.yml file.
 
+    Parameters
+    ----------
+    model_run: str
+        The suite_id of the model run.
+    stream: str, optional
+        If given, the request only covers this stream. It reads the
+        variables file for the stream and uses a package named after the
+        stream, so that the requests for each stream can be processed by
+        CDDS at the same time without sharing any directories.
+    chunk: tuple of int, optional
+        If given, the first and last years (inclusive) of
+        the chunk of years covered by the request, which is added to the
+        package name. Otherwise, the request covers every year of the
+        model run.
+    years: tuple of int, optional
+        If given, the first and last years (inclusive) covered by the
+        request, when they are not those of the whole chunk.
+    variables_path: str, optional
+        If given, the full path to the variables file to use instead of
+        the variables file for the stream.
+
     Returns
     -------
     dict
@@ -101,14 +138,22 @@ def create_request(model_run):
 
     # Read the model run information from the model_runs.yml file
     model_runs_yaml = Path(os.environ["DATASETS_LIST_DIR"]) / "model_runs.yml"
-    with open(model_runs_yaml, "r") as f:
-        dataset_dict = yaml.safe_load(f)[model_run]
+    dataset_dict = load_yaml(model_runs_yaml)[model_run]
     logger.debug(
         "Dataset % config:\n%s",
         model_run,
         dataset_dict,
     )
 
+    if stream is None:
+        variables_path = variables_path or os.environ["VARIABLES_PATH"]
+        streams = list_streams(variables_path)
+    else:
+        variables_path = variables_path or stream_file_path(
+            os.environ["VARIABLES_PATH"], stream
+        )
+        streams = stream
+
     # Create the CDDS request
     request = {}
     request["metadata"] = {
@@ -128,13 +173,23 @@ def create_request(model_run):
         "root_data_dir": os.environ["ROOT_DATA_DIR"],
         "workflow_basename": dataset_dict["suite_id"],
     }
+    if stream is not None:
+        package = request["common"]["package"]
+        request["common"]["package"] = f"{package}-{stream}"
+    if chunk is None:
+        start_year = dataset_dict["start_year"]
+        end_year = dataset_dict["end_year"]
+    else:
+        start_year, end_year = years or chunk
+        package = request["common"]["package"]
+        request["common"]["package"] = f"{package}-{chunk[0]}"
     request["data"] = {
         **defaults["data"],
-        "start_date": f"{dataset_dict['start_year']}-01-01T00:00:00",
-        "end_date": f"{int(dataset_dict['end_year'])+1}-01-01T00:00:00",
+        "start_date": f"{start_year}-01-01T00:00:00",
+        "end_date": f"{int(end_year)+1}-01-01T00:00:00",
         "model_workflow_id": dataset_dict["suite_id"],
-        "streams": list_streams(os.environ["VARIABLES_PATH"]),
-        "variable_list_file": os.environ["VARIABLES_PATH"],
+        "streams": streams,
+        "variable_list_file": variables_path,
     }
     request["misc"] = dict(defaults["misc"])
     request["conversion"] = dict(defaults["conversion"])
@@ -148,6 +203,7 @@ def create_request(model_run):
     return request
 
 
+@traced
 def write_request(request, target_path):
     """Write the request configuration to a file at ``target_path``.
 
@@ -169,20 +225,141 @@ def write_request(request, target_path):
         cfg.write(file_handle)
 
 
-def main():
+def read_variables(variables_file):
+    """Return the lines of a variables file."""
+    with open(variables_file, "r") as file_handle:
+        return file_handle.read().splitlines()
+
+
+@traced
+def index_standardised_data(model_run):
     """
-    Generate and write the request file for the current task environment.
+    Index the data which has already been standardised for a model run.
+
+    Looks in ROOT_RESTRUCTURED_DIR, for data standardised by an earlier
+    run of the workflow, then in STANDARDISED_DATA_DIR and
+    STANDARDISED_DATA_STORE, if they are set.
+
+    Parameters
+    ----------
+    model_run: str
+        The suite_id of the model run.
 
-    The output file location is taken from the REQUEST_PATH environment
-    variable. All other required inputs are read from the environment
-    by ``create_request()``.
+    Returns
+    -------
+    dict
+        The combined index, as returned by ``merge_indexes()``.
+    """
+    model_runs_yaml = Path(os.environ["DATASETS_LIST_DIR"]) / "model_runs.yml"
+    dataset_dict = load_yaml(model_runs_yaml)[model_run]
+
+    indexes = [
+        index_drs_tree(os.environ["ROOT_RESTRUCTURED_DIR"], dataset_dict)
+    ]
+    if os.environ.get("STANDARDISED_DATA_DIR"):
+        indexes.append(
+            index_drs_tree(os.environ["STANDARDISED_DATA_DIR"], dataset_dict)
+        )
+    if os.environ.get("STANDARDISED_DATA_STORE"):
+        indexes.append(
+            index_store(os.environ["STANDARDISED_DATA_STORE"], dataset_dict)
+        )
+    return merge_indexes(*indexes)
+
+
+@profile_entry_point
+@traced
+def main():
+    """
+    Generate and write the request files for the current task environment.
+
+    One request file is written for each stream with variables to
+    standardise and each chunk of years. The output file locations are
+    based on the REQUEST_PATH environment variable, e.g.
+    ``request_u-cw673_apm_1993.cfg``. Any request file left from a previous
+    run for a stream which is no longer needed is removed. All other
+    required inputs are read from the environment by ``create_request()``.
+
+    Each request only covers the variables and years which haven't been
+    standardised already, by an earlier run of the workflow (in
+    ROOT_RESTRUCTURED_DIR), or in STANDARDISED_DATA_DIR or
+    STANDARDISED_DATA_STORE if they are set. Files found in the last two
+    are linked into ROOT_RESTRUCTURED_DIR.
     """
     dataset = os.environ["CYLC_TASK_PARAM_dataset"].strip()
-    logger.info("Creating CDDS request for dataset %s", dataset)
+    streams = list_streams(os.environ["VARIABLES_PATH"]).split()
+    configured_streams = load_yaml(os.environ["STREAM_CONFIG_PATH"])
+    chunks = list(
+        iter_chunks(
+            os.environ["START_YEAR"],
+            os.environ["NUMBER_OF_YEARS"],
+            os.environ.get("STANDARDISE_CHUNK_YEARS"),
+        )
+    )
+
+    index = index_standardised_data(dataset)
+    requested = {
+        variable.split(":")[0]: set()
+        for variable in read_variables(os.environ["VARIABLES_PATH"])
+    }
 
-    request = create_request(dataset)
-    target_path = Path(os.environ["REQUEST_PATH"])
-    write_request(request, target_path)
+    # Only request what hasn't been standardised already. The chunks of a
+    # stream are planned together, so they never request the same years
+    plans = {}
+    for stream in configured_streams:
+        if stream not in streams:
+            continue
+        variables = read_variables(
+            stream_file_path(os.environ["VARIABLES_PATH"], stream)
+        )
+        with span("plan chunks", stream=stream):
+            plans[stream] = plan_chunks(index, variables, chunks)
+
+    for stream, (chunk_index, chunk) in itertools.product(
+        configured_streams, enumerate(chunks)
+    ):
+        target_path = Path(
+            stream_file_path(os.environ["REQUEST_PATH"], stream, chunk[0])
+        )
+        variables, years = ([], None)
+        if stream in plans:
+            variables, years = plans[stream][chunk_index]
+        if variables:
+            variables_path = stream_file_path(
+                os.environ["VARIABLES_PATH"], stream, chunk[0]
+            )
+            write_variables(variables, variables_path)
+
+        if variables:
+            logger.info(
+                "Creating CDDS request for dataset %s, stream %s, "
+                "years %s to %s",
+                dataset,
+                stream,
+                *years,
+            )
+            request = create_request(
+                dataset, stream, chunk, years, variables_path
+            )
+            write_request(request, target_path)
+            for variable in variables:
+                requested[variable.split(":")[0]].update(
+                    range(years[0], years[1] + 1)
+                )
+        elif target_path.exists():
+            logger.info(
+                "Nothing to standardise from stream %s for years from %s, "
+                "removing %s",
+                stream,
+                chunk[0],
+                target_path,
+            )
+            target_path.unlink()
+
+    with span("link stored files"):
+        link_stored_files(
+            index, requested, os.environ["ROOT_RESTRUCTURED_DIR"]
+        )
 
 
 if __name__ == "__main__":
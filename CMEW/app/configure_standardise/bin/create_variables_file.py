@@ -5,9 +5,11 @@
 Create a variables file to standardise model data with CDDS.
 """
 import os
-import yaml
 import sys
 import logging
+from streams import stream_file_path
+from tracing import traced
+from yaml_io import load_yaml
 
 
 logging.basicConfig(level=logging.INFO, stream=sys.stdout)
@@ -15,6 +17,7 @@ filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
+@traced
 def combine_variable_lists(directory):
     """Combine all variables list files from a directory.
 
@@ -54,13 +57,13 @@ def load_stream_dict(stream_config_fp):
         A mapping of pre-defined streams to their associated variables
     """
     # Read the stream mappings
-    with open(stream_config_fp, "r") as f:
-        config = yaml.safe_load(f)
+    config = load_yaml(stream_config_fp)
 
     # Return the whole dictionary
     return config
 
 
+@traced
 def add_stream_to_variables(stream_config_fp, variables):
     """Add stream information to a list of variables.
 
@@ -95,6 +98,42 @@ def add_stream_to_variables(stream_config_fp, variables):
     return streamed_variables
 
 
+@traced
+def split_variables_by_stream(stream_config_fp, streamed_variables):
+    """Split a list of variables by their stream.
+
+    Parameters
+    ----------
+    stream_config_fp : str
+        The full path to the file containing
+        the data streams for each variable.
+    streamed_variables : list[str]
+        List of variables in the format "MIP_table/variable_name:stream"
+
+    Returns
+    -------
+    dict
+        A mapping of every pre-defined stream to the list of its variables,
+        in the format "MIP_table/variable_name:stream". Streams without
+        any variables map to an empty list. Variables without a pre-defined
+        stream are left out.
+    """
+    variables_by_stream = {
+        stream: [] for stream in load_stream_dict(stream_config_fp)
+    }
+    for var in streamed_variables:
+        # Don't split by substream
+        stream = var.split(":")[-1].split("/")[0]
+        if stream in variables_by_stream:
+            variables_by_stream[stream].append(var)
+        else:
+            logger.warning("No stream is defined for %s", var)
+    logger.debug("Variables by stream:\n%s", variables_by_stream)
+
+    return variables_by_stream
+
+
+@traced
 def write_variables(variables, output_filepath):
     """Write a string of variables to a text file in the installed workflow.
 
@@ -113,11 +152,34 @@ def write_variables(variables, output_filepath):
         target_file.write(variables_str)
 
 
+@traced
 def create_variables_file(
     vars_files_list_dir, stream_config_fp, output_filepath
 ):
-    """Create a variables file to standardise model data with CDDS."""
+    """Create a variables file to standardise model data with CDDS.
+
+    As well as the file listing the variables from every stream, a file is
+    written for each stream, e.g. ``variables_u-cw673_apm.txt``, so that
+    each stream can be standardised separately. Any file left from a
+    previous run for a stream which is no longer needed is removed.
+    """
     variables = combine_variable_lists(vars_files_list_dir)
     streamed_variables = add_stream_to_variables(stream_config_fp, variables)
     logger.info("Writing variables file to %s", output_filepath)
     write_variables(streamed_variables, output_filepath)
+
+    variables_by_stream = split_variables_by_stream(
+        stream_config_fp, streamed_variables
+    )
+    for stream, stream_variables in variables_by_stream.items():
+        stream_filepath = stream_file_path(output_filepath, stream)
+        if stream_variables:
+            logger.info(
+                "Writing %s variables file to %s", stream, stream_filepath
+            )
+            write_variables(stream_variables, stream_filepath)
+        elif os.path.exists(stream_filepath):
+            logger.info(
+                "No %s variables, removing %s", stream, stream_filepath
+            )
+            os.remove(stream_filepath)
@@ -58,3 +58,49 @@ def test_create_request(monkeypatch):
     }
 
     assert actual == expected
+
+
+def test_create_request_for_stream(monkeypatch):
+    monkeypatch.setenv(
+        "DATASETS_LIST_DIR",
+        str(Path(__file__).parent.parent.parent / "unittest" / "mock_data"),
+    )
+    request_defaults_path = (
+        Path(__file__).parent.parent / "etc" / "request_defaults.yml"
+    )
+    monkeypatch.setenv("RAW_DATA_DIR_MODE", "save_new")
+    monkeypatch.setenv("REQUEST_DEFAULTS_PATH", str(request_defaults_path))
+    monkeypatch.setenv("ROOT_PROC_DIR", "/path/to/proc/dir/")
+    monkeypatch.setenv("ROOT_DATA_DIR", "/path/to/data/dir/")
+    monkeypatch.setenv("VARIABLES_PATH", "/path/to/variables_u-cw673.txt")
+    monkeypatch.setenv("MIP_TABLE_DIR", "/path/to/mip_tables")
+
+    actual = create_request_file.create_request("u-cw673", "inm")
+
+    assert actual["common"]["package"] == "round-1-inm"
+    assert actual["data"]["streams"] == "inm"
+    assert actual["data"]["variable_list_file"] == (
+        "/path/to/variables_u-cw673_inm.txt"
+    )
+
+
+def test_create_request_for_chunk(monkeypatch):
+    monkeypatch.setenv(
+        "DATASETS_LIST_DIR",
+        str(Path(__file__).parent.parent.parent / "unittest" / "mock_data"),
+    )
+    request_defaults_path = (
+        Path(__file__).parent.parent / "etc" / "request_defaults.yml"
+    )
+    monkeypatch.setenv("RAW_DATA_DIR_MODE", "save_new")
+    monkeypatch.setenv("REQUEST_DEFAULTS_PATH", str(request_defaults_path))
+    monkeypatch.setenv("ROOT_PROC_DIR", "/path/to/proc/dir/")
+    monkeypatch.setenv("ROOT_DATA_DIR", "/path/to/data/dir/")
+    monkeypatch.setenv("VARIABLES_PATH", "/path/to/variables_u-cw673.txt")
+    monkeypatch.setenv("MIP_TABLE_DIR", "/path/to/mip_tables")
+
+    actual = create_request_file.create_request("u-cw673", "apm", (1998, 2002))
+
+    assert actual["common"]["package"] == "round-1-apm-1998"
+    assert actual["data"]["start_date"] == "1998-01-01T00:00:00"
+    assert actual["data"]["end_date"] == "2003-01-01T00:00:00"
@@ -15,6 +15,8 @@ Test data files:
 from create_variables_file import (
     combine_variable_lists,
     add_stream_to_variables,
+    create_variables_file,
+    split_variables_by_stream,
     write_variables,
 )
 import tempfile
@@ -100,3 +102,42 @@ def test_write_variables():
         expected = file_handle.read()
 
     assert expected == actual
+
+
+def test_split_variables_by_stream():
+    input = [
+        "Amon/hfls:apm",
+        "Amon/tas:apm/ap5",
+        "SImon/siconc:inm",
+        "Amon/pr:None",
+    ]
+    actual = split_variables_by_stream(str(streams_yml_fp()), input)
+
+    expected = {
+        "apm": ["Amon/hfls:apm", "Amon/tas:apm/ap5"],
+        "inm": ["SImon/siconc:inm"],
+    }
+
+    assert actual == expected
+
+
+def test_create_variables_file_per_stream(tmp_path):
+    vars_files_list_dir = tmp_path / "variables_lists"
+    vars_files_list_dir.mkdir()
+    (vars_files_list_dir / "recipe_variables.txt").write_text(
+        "Amon/tas\nAmon/rsut\n"
+    )
+    output_filepath = tmp_path / "variables_u-cw673.txt"
+
+    # Left from a previous run which needed the inm stream
+    stale_filepath = tmp_path / "variables_u-cw673_inm.txt"
+    stale_filepath.write_text("SImon/siconc:inm\n")
+
+    create_variables_file(
+        str(vars_files_list_dir), str(streams_yml_fp()), str(output_filepath)
+    )
+
+    expected = "Amon/tas:apm\nAmon/rsut:apm\n"
+    assert output_filepath.read_text() == expected
+    assert (tmp_path / "variables_u-cw673_apm.txt").read_text() == expected
+    assert not stale_filepath.exists()
@@ -9,10 +9,14 @@ These may be edited in the GUI.
 This application reads the namelist files,
 converts the contents to a dictionary of datasets and their facets,
 then writes those dictionaries to YAML files in the share directory.
+Model run sections describing an ensemble are expanded into one dataset
+per member.
 """
 import os
-import yaml
-from scrape_ini import find_ref
+import re
+from scrape_ini import expand_ensemble, find_ref
+from tracing import span, traced
+from yaml_io import write_yaml
 from pathlib import Path
 import sys
 import logging
@@ -22,92 +26,134 @@ filename = os.path.basename(__file__)
 logger = logging.getLogger(filename)
 
 
-def extract_sections_from_naml(naml_fp):
+# A key at the start of a namelist item, e.g. "suite_id=" or "x(1) ="
+_NAMELIST_KEY = re.compile(r"\s*([A-Za-z_][\w%]*(?:\([^)]*\))?)\s*=")
+
+# A single value: double or single quoted (with doubled quotes as escapes)
+# or unquoted up to the next comma, followed by a comma or the end of line
+_NAMELIST_VALUE = re.compile(
+    r"""\s*("(?:[^"]|"")*"|'(?:[^']|'')*'|[^,]*?)\s*(?:,|$)"""
+)
+
+
+def parse_naml_value(token):
     """
-    Read sections from a namelist file and return them as a list of strings.
+    Remove the quotes from a single value read from a namelist file.
 
     Parameters
     ----------
-    naml_fp: str
-        The file path to the namelist file containing the datasets.
+    token: str
+        The value as written in the namelist file.
 
     Returns
     -------
-    datatsets: list of str
-        A list of strings, each containing the content of a section in the
-        namelist file minus the headers and separating characters.
+    str
+        The value without surrounding quotes, with doubled quotes unescaped.
     """
+    if len(token) >= 2 and token[0] == token[-1] and token[0] in "\"'":
+        quote = token[0]
+        return token[1:-1].replace(quote * 2, quote)
+    return token
 
-    # Read the namelist file
-    with open(naml_fp, "r") as file:
-        content = file.read()
-    logger.debug("Namelist content:\n", content)
-
-    # Namelist files are separated by a line containing only "/"
-    datasets = content.split("\n/\n")
-
-    # Read the line containing the header for the first dataset's section
-    first_dataset = datasets[0]
-    first_line = first_dataset.split("\n")[0]
-    name = first_line.replace("&", "")  # This could be returned if needed
-
-    # Initialise a list to hold the extracted datasets
-    extracted_datasets = []
-
-    for dataset in datasets:
-        logger.debug("Extracting dataset %s", dataset)
-        if dataset:  # There is an empty dataset at the end
-            # Replace newlines with just commas
-            dataset = dataset.replace(",\n", ",")
-
-            # Remove remaining new lines
-            dataset = dataset.replace("\n", "")
-
-            # Remove the header
-            dataset = dataset.replace(f"&{name}", "")
-
-            # Add the datasets to the list
-            extracted_datasets.append(dataset)
-
-    return extracted_datasets
 
-
-def convert_str_to_facets(section):
+def parse_naml_line(line, section, key=None):
     """
-    Converts a section of a naml file to a dictionary of its facets.
+    Add the key=value pairs on one line of a namelist group to a dictionary.
+
+    Quoted values may contain commas and equals signs. A key followed by
+    several comma separated values is stored as a list of values; values
+    at the start of a line continue the list of the previous key.
 
     Parameters
     ----------
-    section: str
-        A string containing the amended content of a section of namelist file.
-        The content is expected to be in the format of key=value pairs,
-        without a header and separated by commas.
+    line: str
+        A line from the body of a namelist group.
+    section: dict
+        The facets read so far from the current namelist group.
+        This is updated in place.
+    key: str, optional
+        The key of the last value read from the previous line.
 
     Returns
     -------
-    section_dict: dict
-        A dictionary containing the facets of the dataset.
+    str
+        The key of the last value read, for use with the next line.
     """
+    position = 0
+    line = line.rstrip()
+    while position < len(line):
+        key_match = _NAMELIST_KEY.match(line, position)
+        if key_match:
+            key = key_match.group(1)
+            position = key_match.end()
+            new_key = True
+        else:
+            new_key = False
+
+        value_match = _NAMELIST_VALUE.match(line, position)
+        token = value_match.group(1)
+        position = value_match.end()
+
+        if key is None:
+            raise ValueError(f"Namelist value without a key: {line}")
+        if not token and not new_key:
+            # Nothing but a trailing separator
+            continue
+
+        value = parse_naml_value(token)
+        if new_key:
+            section[key] = value
+        elif isinstance(section[key], list):
+            section[key].append(value)
+        else:
+            section[key] = [section[key], value]
+
+    return key
+
+
+def read_naml_sections(naml_fp):
+    """
+    Read the groups from a namelist file, one at a time.
 
-    # Initialise a dictionary to hold the facets of the dataset
-    section_dict = {}
+    The file is tokenised line by line, so only the current group is
+    held in memory.
 
-    # Separate the facets in the string to loop over
-    facets = section.split(",")
-    for facet in facets:
-        logger.debug("Reading facet %s", facet)
-        if facet:  # There's an empty facet at the end
+    Parameters
+    ----------
+    naml_fp: str
+        The file path to the namelist file containing the datasets.
 
-            # The facets are in the string are key=value pairs
-            key, value = facet.split("=")
+    Yields
+    ------
+    dict
+        The facets of each group in the namelist file, in file order.
+    """
+    section = None
+    key = None
+    with open(naml_fp, "r") as file:
+        for line in file:
+            stripped = line.strip()
 
-            # Values are output with quotes around them
-            value = value.replace('"', "")
+            # Skip blank lines and comments
+            if not stripped or stripped.startswith("!"):
+                continue
 
-            # Add the key: value pair dictionary
-            section_dict[key.strip()] = value.strip()
+            # Groups end with a line containing only "/" (or "&end")
+            if stripped == "/" or stripped.lower() == "&end":
+                if section is not None:
+                    logger.debug("Extracted dataset %s", section)
+                    yield section
+                section = None
 
-    return section_dict
+            # Groups start with "&" and the name of the group
+            elif stripped.startswith("&"):
+                name, _, remainder = stripped[1:].partition(" ")
+                logger.debug("Reading namelist group %s", name)
+                section = {}
+                key = parse_naml_line(remainder, section)
+
+            elif section is not None:
+                key = parse_naml_line(stripped, section, key)
 
 
 def add_common_facets(
@@ -174,28 +220,24 @@ def process_naml_file(
     project: str, optional
         A string indicating the project to which the dataset belongs.
 
-    Returns
-    -------
-    datasets: list of dict
-        A list of dictionaries, each containing the facets of one dataset.
+    Yields
+    ------
+    dict
+        The facets of each dataset, one dataset at a time.
     """
     logger.info("Processing %s", naml_fp)
-    datasets = []
-    sections = extract_sections_from_naml(naml_fp)
-    for section in sections:
-        dataset_dict = convert_str_to_facets(section)
-        dataset_dict = add_common_facets(
+    for dataset_dict in read_naml_sections(naml_fp):
+        yield add_common_facets(
             start_year, number_of_years, dataset_dict, institute, project
         )
-        datasets.append(dataset_dict)
-    return datasets
 
 
-# Note: I've stolen this with a slight rename from update_recipe_file.py
-# Eventually the plan is to move it to a common directory
 def write_dict_to_yaml(dict_to_write, target_path):
     """Write the contents of a dictionary to a YAML file at ``target_path``.
 
+    The content is written atomically with sorted keys by
+    :func:`yaml_io.write_yaml` in CMEW/lib/python.
+
     Parameters
     ----------
     dict_to_write dict
@@ -204,25 +246,20 @@ def write_dict_to_yaml(dict_to_write, target_path):
     target_path: str
         Location at which to write the content.
     """
-    with open(target_path, "w") as file_handle:
-        yaml.dump(
-            dict_to_write,
-            file_handle,
-            default_flow_style=False,
-            sort_keys=True,
-        )
+    write_yaml(dict_to_write, target_path)
 
 
 # If the above function does stay here, there's no reason to have this
 # whole function just to create a target path then call the above
+@traced
 def write_datasets_to_yaml(datasets, name, target_dir):
     """
     Write a list of dataset dictionaries to a YAML file in the directory.
 
     Parameters
     ----------
-    datasets: list of dict
-        A list of dictionaries, each containing the facets of a dataset.
+    datasets: dict
+        A dictionary of datasets, each containing the facets of a dataset.
     name: str
         The name of the YAML file to which the datasets are to be written.
     target_dir: str
@@ -268,71 +305,86 @@ def list_files(directory, extension):
     return filepaths
 
 
-def use_facet_as_key(filepath, key_facet):
+def use_facet_as_key(datasets, key_facet):
     """
-    Edit a YAML file in place, from a list to a dictionary.
+    Convert a list of datasets to a dictionary.
 
     The keys of the new dictionary are the values of the specified facet,
     which must be present in each section of the list and be unique.
 
     Parameters
     ----------
-    filepath: str
-        The file path to the YAML file to be edited.
+    datasets: iterable of dict
+        The facets of each dataset.
     key_facet: str
-        The facet to use as the key in the new dictionary.
-        Defaults to 'suite_id', which is the unique identifier for now.
-    """
-    # Read the YAML file that has datasets as a list
-    with open(filepath, "r") as f:
-        data = yaml.safe_load(f)
+        The facet to use as the key in the new dictionary,
+        e.g. 'suite_id', which is the unique identifier for model runs.
 
-    # Create a new dictionary with the same sections as the list
+    Returns
+    -------
+    dict
+        The datasets, keyed by the value of ``key_facet``.
+
+    Raises
+    ------
+    ValueError
+        If two datasets share the same value of ``key_facet``.
+    """
     new_dict = {}
-    for section in data:
+    for section in datasets:
         logger.debug("Adding key to %s", section)
 
         # Use the facet as a unique key
         unique = section[key_facet]
+        if unique in new_dict:
+            raise ValueError(f"Duplicate {key_facet} found: {unique}")
 
         # The information in each section remains unchanged
         new_dict[unique] = section
 
-    # Write the new dictionary back to the existing YAML filepath
-    with open(filepath, "w") as f:
-        yaml.dump(new_dict, f)
+    return new_dict
 
 
-def add_reference_key(filepath):
+@traced
+def add_reference_key(dataset_dict, rose_suite_fp=None):
     """
-    Add a "benchmark_dataset" key with the value "true" to a YAML file.
+    Add a "benchmark_dataset" key with the value "true" to a dataset.
 
-    The section to which the key is added is determined by the function
+    The dataset to which the key is added is determined by the function
     `find_ref` in CMEW/lib/python/scrape_ini.py.
 
     Parameters
     ----------
-    filepath: str
-        The location of the YAML file to be edited.
+    dataset_dict: dict
+        The datasets keyed by suite ID. This is updated in place.
+    rose_suite_fp: str, optional
+        The location of the `rose-suite.conf` file. Defaults to the file
+        at the top level of the installed workflow.
+
+    Returns
+    -------
+    dict
+        The datasets with the benchmarking key added.
     """
     # Find the reference suite ID in the `rose-suite.conf` file
-    rose_suite_fp = (
-        Path(__file__).parent.parent.parent.parent / "rose-suite.conf"
-    )
+    if rose_suite_fp is None:
+        rose_suite_fp = (
+            Path(__file__).parent.parent.parent.parent / "rose-suite.conf"
+        )
     ref_dataset = find_ref(rose_suite_fp)
 
-    # Read the yaml as a dictionary without the extra key
-    with open(filepath, "r") as f:
-        dataset_dict = yaml.safe_load(f)
-
-    # Add the extra key and re-save the file
     dataset_dict[ref_dataset]["benchmark_dataset"] = True
-    with open(filepath, "w") as f:
-        yaml.dump(dataset_dict, f)
+    return dataset_dict
 
 
+@traced
 def add_datasets_to_share(
-    source_dir, target_dir, start_year, number_of_years, institute
+    source_dir,
+    target_dir,
+    start_year,
+    number_of_years,
+    institute,
+    rose_suite_fp=None,
 ):
     """
     Copy the datasets defined in namelist files into YAML files.
@@ -349,6 +401,10 @@ def add_datasets_to_share(
         The number of years to extract for each dataset.
     institute: str
         The institution ID to add to the datasets.
+    rose_suite_fp: str, optional
+        The location of the `rose-suite.conf` file naming the reference
+        model run. Defaults to the file at the top level of the installed
+        workflow.
     """
     # Create the target directory if it doesn't exist
     os.makedirs(target_dir, exist_ok=True)
@@ -363,34 +419,44 @@ def add_datasets_to_share(
         # Check if it's model runs
         if basename == "model_runs":
 
-            # Write the datasets to a YAML file with ESMVal project
+            # Read the datasets with ESMVal project
             datasets = process_naml_file(
                 nl_fp, start_year, number_of_years, institute, "ESMVal"
             )
+
+            # Expand any ensembles into their members
+            datasets = (
+                member
+                for dataset in datasets
+                for member in expand_ensemble(dataset)
+            )
+
+            # Use suite IDs as keys, reading the namelist file as we go
+            with span("read model runs", path=nl_fp):
+                model_runs = use_facet_as_key(datasets, "suite_id")
+
             # Update the experiment to encode the suite ID
-            for dataset in datasets:
+            for dataset in model_runs.values():
                 dataset["experiment_id"] = (
                     f"{dataset['experiment_id']}-{dataset['suite_id']}"
                 )
+
+            # Add the reference identifier
+            logger.info("Adding benchmarking key to model runs")
+            add_reference_key(model_runs, rose_suite_fp)
+
             logger.info("Writing model runs YAML")
-            write_datasets_to_yaml(datasets, basename, target_dir)
+            write_datasets_to_yaml(model_runs, basename, target_dir)
 
         # Check if it's CMIP6:
         if basename == "cmip6_datasets":
 
-            # Write the datasets to a YAML file with CMIP6 project
+            # Read the datasets with CMIP6 project, using model IDs as keys
             datasets = process_naml_file(
                 nl_fp, start_year, number_of_years, institute, "CMIP6"
             )
-            logger.info("Writing CMIP6 runs YAML")
-            write_datasets_to_yaml(datasets, basename, target_dir)
-
-    # Reformat the YAML files to use unique identifiers as keys
-    logger.info("Reformatting YAML files to use suite IDs as keys")
-    model_runs_yaml = f"{target_dir}/model_runs.yml"
-    use_facet_as_key(model_runs_yaml, "suite_id")
-    use_facet_as_key(f"{target_dir}/cmip6_datasets.yml", "model_id")
+            with span("read CMIP6 datasets", path=nl_fp):
+                cmip6_datasets = use_facet_as_key(datasets, "model_id")
 
-    # Add the reference identifier
-    logger.info("Adding benchmarking key to model runs YAML")
-    add_reference_key(model_runs_yaml)
+            logger.info("Writing CMIP6 runs YAML")
+            write_datasets_to_yaml(cmip6_datasets, basename, target_dir)
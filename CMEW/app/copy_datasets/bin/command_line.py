@@ -2,6 +2,7 @@
 # The LICENSE.md file contains full licensing details.
 import argparse
 from add_datasets_to_share import add_datasets_to_share
+from profiling import profile_entry_point
 
 
 def parse_args_for_add_datasets_to_share(arguments):
@@ -46,6 +47,7 @@ def parse_args_for_add_datasets_to_share(arguments):
     return parser.parse_args(arguments)
 
 
+@profile_entry_point
 def main_for_add_datasets_to_share(arguments=None):
     """
     Copy the datasets defined in namelist files into YAML files.
@@ -5,7 +5,7 @@ Unit tests for add_datasets_to_share.py
 
 Test data files:
 /app/unittest/mock_data/model_runs.nl
-    input for test_extract_sections_from_naml
+    input for test_read_naml_sections
     input for test_process_naml_file
 /app/unittest/mock_data/model_runs_as_list.yml
     input for test_use_facet_as_key
@@ -15,19 +15,18 @@ Test data files:
     kgo for test_write_dict_to_yaml
 """
 from add_datasets_to_share import (
-    extract_sections_from_naml,
-    convert_str_to_facets,
+    read_naml_sections,
+    parse_naml_line,
     add_common_facets,
     process_naml_file,
     write_dict_to_yaml,
     write_datasets_to_yaml,
     list_files,
     use_facet_as_key,
+    add_reference_key,
 )
 import yaml
 import pytest
-import shutil
-import tempfile
 from unittest.mock import patch
 from copy_datasets_conftest import (
     model_runs_nl_fp,
@@ -41,48 +40,44 @@ NUMBER_OF_YEARS = "10"
 INSTITUTE = "mock_institute"
 
 
-def test_extract_sections_from_naml():
-    # Note that I actually expect one long string for each section,
-    # not a concatenated string, but this fails the flake8 tests.
+def test_read_naml_sections():
     expected = [
-        (
-            "calendar=gregorian,"
-            "label_for_plots=HadGEM3-GC5E-LL N96ORCA1,"
-            "model_id=HadGEM3-GC5E-LL,"
-            "suite_id=u-cw673,"
-            "variant_label=r1i1p1f1,"
-        ),
-        (
-            "calendar=360_day,"
-            "label_for_plots=HadGEM3-GC3.1 N96ORCA1,"
-            "model_id=HadGEM3-GC31-LL,"
-            "suite_id=u-bv526,"
-            "variant_label=r5i1p1f3,"
-        ),
+        {
+            "calendar": "gregorian",
+            "label_for_plots": "HadGEM3-GC5E-LL N96ORCA1",
+            "model_id": "HadGEM3-GC5E-LL",
+            "suite_id": "u-cw673",
+            "variant_label": "r1i1p1f1",
+        },
+        {
+            "calendar": "360_day",
+            "label_for_plots": "HadGEM3-GC3.1 N96ORCA1",
+            "model_id": "HadGEM3-GC31-LL",
+            "suite_id": "u-bv526",
+            "variant_label": "r5i1p1f3",
+        },
     ]
 
-    actual = extract_sections_from_naml(str(model_runs_nl_fp()))
+    actual = list(read_naml_sections(str(model_runs_nl_fp())))
     assert actual == expected
 
 
-def test_convert_str_to_facets():
-    section = (
-        "calendar=gregorian,"
-        "label_for_plots=HadGEM3-GC5E-LL N96ORCA1,"
-        "model_id=HadGEM3-GC5E-LL,"
-        "suite_id=u-cw673,"
-        "variant_label=r1i1p1f1,"
+def test_parse_naml_line_quoted_values():
+    # Quoted values may contain commas, equals signs and escaped quotes
+    line = (
+        "label_for_plots=\"GC5, a=b\",model_id='HadGEM3''s',"
+        'suite_id="u-aa001", "u-aa002",'
     )
     expected = {
-        "calendar": "gregorian",
-        "label_for_plots": "HadGEM3-GC5E-LL N96ORCA1",
-        "model_id": "HadGEM3-GC5E-LL",
-        "suite_id": "u-cw673",
-        "variant_label": "r1i1p1f1",
+        "label_for_plots": "GC5, a=b",
+        "model_id": "HadGEM3's",
+        "suite_id": ["u-aa001", "u-aa002"],
     }
 
-    actual = convert_str_to_facets(section)
+    actual = {}
+    last_key = parse_naml_line(line, actual)
     assert actual == expected
+    assert last_key == "suite_id"
 
 
 def test_add_common_facets():
@@ -135,17 +130,19 @@ def test_process_naml_file():
         },
     ]
 
-    actual = process_naml_file(
-        str(model_runs_nl_fp()),
-        START_YEAR,
-        NUMBER_OF_YEARS,
-        INSTITUTE,
-        "CMIP6",
+    actual = list(
+        process_naml_file(
+            str(model_runs_nl_fp()),
+            START_YEAR,
+            NUMBER_OF_YEARS,
+            INSTITUTE,
+            "CMIP6",
+        )
     )
     assert actual == expected
 
 
-def test_write_dict_to_yaml():
+def test_write_dict_to_yaml(tmp_path):
     # Note the keys are not alphabetical here but are in the output
     test_dict = {
         "key_1": "value_1",
@@ -156,11 +153,15 @@ def test_write_dict_to_yaml():
         },
     }
 
-    # Write the test dictionary to a temporary file
-    with tempfile.NamedTemporaryFile() as tmp:
-        write_dict_to_yaml(test_dict, tmp.name)
-        tmp.seek(0)
-        actual = yaml.safe_load(tmp)
+    # Write the test dictionary to a temporary file, which is replaced
+    # rather than written in place
+    target_path = tmp_path / "basic_dict.yml"
+    write_dict_to_yaml(test_dict, str(target_path))
+    with open(target_path, "r") as file_handle:
+        actual = yaml.safe_load(file_handle)
+
+    # No temporary files are left behind
+    assert list(tmp_path.iterdir()) == [target_path]
 
     # Load the expected dictionary
     with open(str(basic_dict_yml_fp()), "r") as file_handle:
@@ -201,19 +202,32 @@ def test_list_files(mock_listdir, mock_dirname, extension):
 
 
 def test_use_facet_as_key():
-    # Copy known input to a temp file
-    with tempfile.NamedTemporaryFile() as tmp:
-        shutil.copyfile(str(model_runs_as_list_yml_fp()), tmp.name)
-
-        # The filepath is given by .name
-        use_facet_as_key(str(tmp.name), "suite_id")
+    # Load known input
+    with open(str(model_runs_as_list_yml_fp()), "r") as file_handle:
+        datasets = yaml.safe_load(file_handle)
 
-        # Read the result
-        tmp.seek(0)
-        actual = yaml.safe_load(tmp)
+    actual = use_facet_as_key(datasets, "suite_id")
 
     # Load the expected output
     with open(str(model_runs_as_dict_yml_fp()), "r") as file_handle:
         expected = yaml.safe_load(file_handle)
 
     assert actual == expected
+
+
+def test_use_facet_as_key_duplicate():
+    datasets = [{"suite_id": "u-aa001"}, {"suite_id": "u-aa001"}]
+    with pytest.raises(ValueError, match="u-aa001"):
+        use_facet_as_key(datasets, "suite_id")
+
+
+def test_add_reference_key(tmp_path):
+    rose_suite_fp = tmp_path / "rose-suite.conf"
+    rose_suite_fp.write_text(
+        '[namelist:model_runs(reference)]\nsuite_id="u-bv526"\n'
+    )
+    dataset_dict = {"u-bv526": {}, "u-cw673": {}}
+    expected = {"u-bv526": {"benchmark_dataset": True}, "u-cw673": {}}
+
+    actual = add_reference_key(dataset_dict, str(rose_suite_fp))
+    assert actual == expected
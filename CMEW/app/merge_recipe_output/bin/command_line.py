@@ -0,0 +1,63 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+from merge_recipe_output import merge_recipe_output
+from profiling import profile_entry_point
+
+
+def parse_args_for_merge_recipe_output(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_merge_recipe_output`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Merge the output of the shards of a recipe.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--recipe_path",
+        help="The full path to the recipe which was split into shards.",
+    )
+    parser.add_argument(
+        "--shards_dir",
+        help="The full path to the directory the shards wrote output to.",
+    )
+    parser.add_argument(
+        "--output_dir",
+        help="The full path to the directory to write the merged output to.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_merge_recipe_output(arguments=None):
+    """
+    Merge the output of the shards of a recipe.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_merge_recipe_output(arguments)
+
+    # Run the code.
+    print(f"recipe_path: {args.recipe_path}")
+    print(f"shards_dir: {args.shards_dir}")
+    print(f"output_dir: {args.output_dir}")
+    merge_recipe_output(
+        args.recipe_path,
+        args.shards_dir,
+        args.output_dir,
+    )
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Merge the output of the shards of a recipe.
+
+ESMValTool writes the output of each shard to its own timestamped
+directory, e.g. ``recipe_radiation_budget_shard1_20260101_120000``. The
+files of each diagnostic are linked into a single output directory, e.g.
+``recipe_radiation_budget_20260101_120000``, laid out as if the whole
+recipe had been run at once. The files which aren't specific to a
+diagnostic, such as the logs, are kept for each shard under ``shards``.
+A ``provenance.yml`` file lists the diagnostics run by each shard and the
+provenance record of every output file.
+"""
+import logging
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from yaml_io import write_yaml
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The sub-directories of the output directory of a recipe which contain
+# a directory for each diagnostic
+DIAGNOSTIC_SUB_DIRS = ("plots", "work", "preproc", "run")
+
+# The name of the combined provenance in the merged output directory
+PROVENANCE_FILENAME = "provenance.yml"
+
+# The suffix of the provenance record ESMValTool writes for each file
+PROVENANCE_SUFFIX = "_provenance.xml"
+
+
+def find_shard_output_dirs(shards_dir, recipe_name):
+    """
+    Find the latest output directory of each shard of a recipe.
+
+    Parameters
+    ----------
+    shards_dir: Path
+        The directory the shards wrote their output to.
+    recipe_name: str
+        The name of the recipe, without the extension,
+        e.g. "recipe_radiation_budget".
+
+    Returns
+    -------
+    dict
+        The latest output directory of each shard, by shard number.
+    """
+    pattern = re.compile(
+        rf"^{re.escape(recipe_name)}_shard(\d+)_(\d{{8}}_\d{{6}})$"
+    )
+    latest = {}
+    for path in sorted(shards_dir.iterdir()) if shards_dir.is_dir() else []:
+        match = pattern.match(path.name)
+        if match and path.is_dir():
+            shard = int(match.group(1))
+            # The timestamps sort in time order, so the last one is the latest
+            latest[shard] = path
+    return latest
+
+
+def link_file(source, target):
+    """Hard link ``source`` to ``target``, or symlink it if that fails."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        logger.warning("%s already exists, so isn't replaced", target)
+    except OSError:
+        target.symlink_to(source.resolve())
+
+
+def link_tree(source_dir, target_dir):
+    """
+    Link every file under ``source_dir`` to the same place under
+    ``target_dir``.
+
+    Returns
+    -------
+    int
+        The number of files linked.
+    """
+    linked = 0
+    for root, _, files in os.walk(source_dir):
+        for name in files:
+            source = Path(root) / name
+            link_file(source, target_dir / source.relative_to(source_dir))
+            linked += 1
+    return linked
+
+
+def merge_shard(shard_dir, merged_dir):
+    """
+    Link the output of a shard into the merged output directory.
+
+    Parameters
+    ----------
+    shard_dir: Path
+        The output directory of the shard.
+    merged_dir: Path
+        The merged output directory.
+
+    Returns
+    -------
+    list of str
+        The names of the diagnostics run by the shard.
+    """
+    diagnostics = set()
+    other_dir = merged_dir / "shards" / shard_dir.name
+    for path in sorted(shard_dir.iterdir()):
+        if path.name in DIAGNOSTIC_SUB_DIRS and path.is_dir():
+            for sub_path in sorted(path.iterdir()):
+                if sub_path.is_dir():
+                    diagnostics.add(sub_path.name)
+                    link_tree(sub_path, merged_dir / path.name / sub_path.name)
+                else:
+                    # e.g. the main log in the run directory
+                    link_file(sub_path, other_dir / path.name / sub_path.name)
+        elif path.is_dir():
+            link_tree(path, other_dir / path.name)
+        else:
+            link_file(path, other_dir / path.name)
+    return sorted(diagnostics)
+
+
+def list_provenance(merged_dir):
+    """List the provenance records in the merged output directory."""
+    records = []
+    for sub_dir in ("plots", "work"):
+        for root, _, files in os.walk(merged_dir / sub_dir):
+            records.extend(
+                str((Path(root) / name).relative_to(merged_dir))
+                for name in files
+                if name.endswith(PROVENANCE_SUFFIX)
+            )
+    return sorted(records)
+
+
+def merge_recipe_output(recipe_path, shards_dir, output_dir, timestamp=None):
+    """
+    Merge the output of the shards of a recipe into one output directory.
+
+    Parameters
+    ----------
+    recipe_path: str
+        The full path to the recipe which was split into shards.
+    shards_dir: str
+        The directory the shards wrote their output to.
+    output_dir: str
+        The directory to write the merged output directory to.
+    timestamp: str, optional
+        The timestamp in the name of the merged output directory;
+        by default, the current time, e.g. "20260101_120000".
+
+    Returns
+    -------
+    Path
+        The merged output directory.
+
+    Raises
+    ------
+    FileNotFoundError
+        If no shard has written any output.
+    """
+    recipe_name = Path(recipe_path).stem
+    shard_dirs = find_shard_output_dirs(Path(shards_dir), recipe_name)
+    if not shard_dirs:
+        raise FileNotFoundError(
+            f"No output from the shards of {recipe_name} in {shards_dir}"
+        )
+
+    timestamp = timestamp or datetime.now(timezone.utc).strftime(
+        "%Y%m%d_%H%M%S"
+    )
+    merged_dir = Path(output_dir) / f"{recipe_name}_{timestamp}"
+    merged_dir.mkdir(parents=True)
+    provenance = {"recipe": str(recipe_path), "shards": {}}
+    for shard, shard_dir in sorted(shard_dirs.items()):
+        logger.info("Merging the output of shard %s from %s", shard, shard_dir)
+        provenance["shards"][shard] = {
+            "output_dir": str(shard_dir),
+            "diagnostics": merge_shard(shard_dir, merged_dir),
+        }
+    provenance["records"] = list_provenance(merged_dir)
+    write_yaml(provenance, merged_dir / PROVENANCE_FILENAME)
+    logger.info(
+        "Merged the output of %s shards into %s", len(shard_dirs), merged_dir
+    )
+    return merged_dir
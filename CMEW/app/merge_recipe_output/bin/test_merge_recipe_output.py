@@ -0,0 +1,62 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for merge_recipe_output.py"""
+from merge_recipe_output import merge_recipe_output
+import pytest
+from yaml_io import load_yaml
+
+RECIPE_NAME = "recipe_radiation_budget"
+
+
+def write_shard_output(shards_dir, shard, timestamp, diagnostic):
+    """Write the output of a shard which ran a single diagnostic."""
+    shard_dir = shards_dir / f"{RECIPE_NAME}_shard{shard}_{timestamp}"
+    for sub_dir in ["plots", "work", "run"]:
+        (shard_dir / sub_dir / diagnostic / "script").mkdir(parents=True)
+    plot_dir = shard_dir / "plots" / diagnostic / "script"
+    (plot_dir / "plot.png").write_text(diagnostic)
+    (plot_dir / "plot_provenance.xml").write_text(diagnostic)
+    (shard_dir / "run" / "main_log.txt").write_text(diagnostic)
+    (shard_dir / "index.html").write_text(diagnostic)
+    return shard_dir
+
+
+def test_merge_recipe_output(tmp_path):
+    shards_dir = tmp_path / "shards"
+    write_shard_output(shards_dir, 1, "20260101_000000", "old")
+    shard_1 = write_shard_output(shards_dir, 1, "20260101_120000", "maps")
+    shard_2 = write_shard_output(shards_dir, 2, "20260101_120000", "summary")
+
+    merged_dir = merge_recipe_output(
+        tmp_path / f"{RECIPE_NAME}.yml",
+        shards_dir,
+        tmp_path,
+        "20260102_000000",
+    )
+
+    assert merged_dir == tmp_path / f"{RECIPE_NAME}_20260102_000000"
+    assert sorted(path.name for path in (merged_dir / "plots").iterdir()) == [
+        "maps",
+        "summary",
+    ]
+    plot_path = merged_dir / "plots" / "summary" / "script" / "plot.png"
+    assert plot_path.read_text() == "summary"
+    assert (
+        merged_dir / "shards" / shard_1.name / "run" / "main_log.txt"
+    ).read_text() == "maps"
+    assert (merged_dir / "shards" / shard_2.name / "index.html").is_file()
+
+    provenance = load_yaml(merged_dir / "provenance.yml")
+    assert provenance["shards"][1]["diagnostics"] == ["maps"]
+    assert provenance["shards"][2]["output_dir"] == str(shard_2)
+    assert provenance["records"] == [
+        "plots/maps/script/plot_provenance.xml",
+        "plots/summary/script/plot_provenance.xml",
+    ]
+
+
+def test_merge_recipe_output_no_shards(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        merge_recipe_output(
+            tmp_path / f"{RECIPE_NAME}.yml", tmp_path / "shards", tmp_path
+        )
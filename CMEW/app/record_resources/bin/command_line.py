@@ -0,0 +1,204 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+from profiling import profile_entry_point
+from resource_history import (
+    DEFAULT_MEMORY_HEADROOM,
+    DEFAULT_TIME_HEADROOM,
+    record_resources,
+    tune_resources,
+)
+from yaml_io import load_yaml
+
+
+def parse_args_for_record_resources(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_record_resources`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Add the resources used by every job of a workflow to the "
+            "history of resource usage."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--run_dir",
+        help="The full path to the run directory of the workflow.",
+    )
+    parser.add_argument(
+        "--workflow_id",
+        help="The ID of the workflow.",
+    )
+    parser.add_argument(
+        "--model_runs_yml_fp",
+        help="The full path to the model_runs.yml file.",
+    )
+    parser.add_argument(
+        "--cmip6_datasets_yml_fp",
+        help="The full path to the cmip6_datasets.yml file.",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        help="The number of years evaluated by the workflow.",
+    )
+    parser.add_argument(
+        "--history_path",
+        help="The full path to the history of resource usage.",
+    )
+    parser.add_argument(
+        "--chunk_years",
+        type=int,
+        default=0,
+        help=(
+            "The number of years standardised by each task, i.e. "
+            "STANDARDISE_CHUNK_YEARS or MONITOR_CYCLE_YEARS, or 0 if each "
+            "task standardises every year."
+        ),
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_record_resources(arguments=None):
+    """
+    Add the resources used by every job of a workflow to the history of
+    resource usage.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_record_resources(arguments)
+
+    # Run the code.
+    print(f"run_dir: {args.run_dir}")
+    print(f"workflow_id: {args.workflow_id}")
+    print(f"model_runs_yml_fp: {args.model_runs_yml_fp}")
+    print(f"cmip6_datasets_yml_fp: {args.cmip6_datasets_yml_fp}")
+    print(f"years: {args.years}")
+    print(f"history_path: {args.history_path}")
+    print(f"chunk_years: {args.chunk_years}")
+    record_resources(
+        args.run_dir,
+        args.workflow_id,
+        load_yaml(args.model_runs_yml_fp),
+        load_yaml(args.cmip6_datasets_yml_fp),
+        args.years,
+        args.history_path,
+        args.chunk_years,
+    )
+
+
+def parse_args_for_tune_resources(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_tune_resources`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recommend the resources of each task from the history of "
+            "resource usage."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--history_path",
+        help="The full path to the history of resource usage.",
+    )
+    parser.add_argument(
+        "--datasets",
+        type=int,
+        help="The number of datasets to evaluate.",
+    )
+    parser.add_argument(
+        "--years",
+        type=int,
+        help="The number of years to evaluate.",
+    )
+    parser.add_argument(
+        "--chunk_years",
+        type=int,
+        default=0,
+        help=(
+            "The number of years to standardise in each task, or 0 if each "
+            "task standardises every year."
+        ),
+    )
+    parser.add_argument(
+        "--output_path",
+        help=(
+            "The full path to write the Cylc runtime file for the site to, "
+            "e.g. site/metoffice_resources.cylc. If not given, the "
+            "recommendations are only logged."
+        ),
+    )
+    parser.add_argument(
+        "--memory_headroom",
+        type=float,
+        default=DEFAULT_MEMORY_HEADROOM,
+        help="The factor by which the recommended memory exceeds the usage.",
+    )
+    parser.add_argument(
+        "--time_headroom",
+        type=float,
+        default=DEFAULT_TIME_HEADROOM,
+        help="The factor by which the recommended time exceeds the usage.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_tune_resources(arguments=None):
+    """
+    Recommend the resources of each task from the history of resource usage.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_tune_resources(arguments)
+
+    # Run the code.
+    print(f"history_path: {args.history_path}")
+    print(f"datasets: {args.datasets}")
+    print(f"years: {args.years}")
+    print(f"output_path: {args.output_path}")
+    print(f"memory_headroom: {args.memory_headroom}")
+    print(f"time_headroom: {args.time_headroom}")
+    print(f"chunk_years: {args.chunk_years}")
+    tune_resources(
+        args.history_path,
+        args.datasets,
+        args.years,
+        args.output_path,
+        args.memory_headroom,
+        args.time_headroom,
+        args.chunk_years,
+    )
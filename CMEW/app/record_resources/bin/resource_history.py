@@ -0,0 +1,442 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Record the resources used by each task, and recommend resources from them.
+
+The resource usage each job wrote to its ``.time`` file is added to a
+history shared by workflows, keyed by task, with the number of datasets and
+years the workflow evaluated. The memory, time limit and number of tasks of
+each task are then recommended from the history, with some headroom, and
+can be written as a Cylc runtime file for the site, e.g.
+``site/metoffice_resources.cylc``, which overrides the guesses in the site
+configuration.
+"""
+import contextlib
+import fcntl
+import logging
+import math
+import os
+import re
+import sys
+
+from time_log import find_time_logs, read_time_log
+from yaml_io import load_yaml, write_text, write_yaml
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The default factors by which the recommendations exceed the usage
+DEFAULT_MEMORY_HEADROOM = 1.5
+DEFAULT_TIME_HEADROOM = 1.5
+
+# The shortest time limit recommended, in minutes
+MINIMUM_MINUTES = 5
+
+# The parameterised tasks whose resources are tuned, with the runtime
+# section matching every task for one value of the parameter
+TUNED_TASKS = {
+    "run_recipe": "run_recipe<recipe={}{{{{ SHARD_PARAM }}}}>",
+    "standardise_model_data": (
+        "standardise_model_data<dataset, stream={}{{{{ CHUNK_PARAM }}}}>"
+    ),
+}
+
+# The tasks which run once for each dataset and chunk of years, so whose
+# time grows with the number of years in each chunk, not with the number of
+# datasets
+PER_CHUNK_TASKS = ("standardise_model_data",)
+
+# The fields which identify a job in the history
+JOB_FIELDS = ("workflow", "cycle", "task", "submit")
+
+# The suffix of the file locked while the history is updated
+LOCK_SUFFIX = ".lock"
+
+
+def task_key(task, suite_ids):
+    """
+    Return the name a task is recorded under in the history.
+
+    The suite IDs of the model runs, the chunk of years and the shard are
+    removed from the name, so the usage of similar tasks in different
+    workflows can be compared.
+
+    Parameters
+    ----------
+    task: str
+        The name of the task,
+        e.g. "standardise_model_data_u-cw673_apm_chunk1993".
+    suite_ids: list of str
+        The suite IDs of the model runs evaluated by the workflow.
+
+    Returns
+    -------
+    str
+        The name of the task in the history,
+        e.g. "standardise_model_data_apm".
+    """
+    key = re.sub(r"_shard\d+$", "", task)
+    for suite_id in suite_ids:
+        key = key.replace(f"_{suite_id}", "")
+    return re.sub(r"_chunk\d+$", "", key)
+
+
+def collect_usage(
+    run_dir, workflow_id, suite_ids, datasets, years, chunk_years=0
+):
+    """
+    List the resource usage of every job of a workflow.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+    workflow_id: str
+        The ID of the workflow.
+    suite_ids: list of str
+        The suite IDs of the model runs evaluated by the workflow.
+    datasets: int
+        The number of datasets evaluated by the workflow.
+    years: int
+        The number of years evaluated by the workflow.
+    chunk_years: int, optional
+        The number of years standardised by each task, or 0 if each task
+        standardises every year.
+
+    Returns
+    -------
+    dict
+        The records of the jobs, by the name of the task in the history.
+    """
+    records = {}
+    for cycle, task, submit, fp in find_time_logs(run_dir):
+        record = {
+            "workflow": workflow_id,
+            "cycle": cycle,
+            "task": task,
+            "submit": submit,
+            "datasets": datasets,
+            "years": years,
+            "chunk_years": min(chunk_years, years) or years,
+        }
+        record.update(read_time_log(fp))
+        records.setdefault(task_key(task, suite_ids), []).append(record)
+    return records
+
+
+@contextlib.contextmanager
+def lock_history(history_path):
+    """
+    Hold an exclusive lock on the history for the body of a ``with``
+    statement, so workflows finishing at the same time don't lose each
+    other's records.
+
+    The lock is held on a separate file, ``<history_path>.lock``, as the
+    history itself is replaced when it is written.
+    """
+    with open(f"{history_path}{LOCK_SUFFIX}", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def update_history(history_path, records):
+    """
+    Add the records of jobs to the history, skipping any already there.
+
+    The history is locked while it is read and written.
+
+    Parameters
+    ----------
+    history_path: str
+        The full path to the history YAML file.
+    records: dict
+        The records of the jobs, by the name of the task in the history.
+
+    Returns
+    -------
+    int
+        The number of records added.
+    """
+    with lock_history(history_path):
+        history = (
+            load_yaml(history_path, use_cache=False)
+            if os.path.isfile(history_path)
+            else {}
+        )
+        added = 0
+        for key, new_records in records.items():
+            task_history = history.setdefault(key, [])
+            recorded = {
+                tuple(record.get(field) for field in JOB_FIELDS)
+                for record in task_history
+            }
+            for record in new_records:
+                job = tuple(record[field] for field in JOB_FIELDS)
+                if job not in recorded:
+                    task_history.append(record)
+                    added += 1
+        write_yaml(history, history_path)
+    return added
+
+
+def job_work(record, per_chunk=False):
+    """
+    Return the amount of work done by a past job, which the time it takes
+    is assumed to grow with.
+
+    Parameters
+    ----------
+    record: dict
+        The record of the job.
+    per_chunk: bool, optional
+        Whether the job standardised one dataset and one chunk of years, in
+        which case the work is the number of years in the chunk, rather
+        than the number of datasets times the number of years.
+
+    Returns
+    -------
+    int
+        The amount of work.
+    """
+    if per_chunk:
+        return record.get("chunk_years") or record["years"]
+    return record["datasets"] * record["years"]
+
+
+def recommend(
+    records,
+    datasets,
+    years,
+    memory_headroom=DEFAULT_MEMORY_HEADROOM,
+    time_headroom=DEFAULT_TIME_HEADROOM,
+    per_chunk=False,
+    chunk_years=0,
+):
+    """
+    Recommend the resources of a task from the usage of its past jobs.
+
+    The time taken is assumed to grow with the number of datasets times the
+    number of years or, for the tasks in ``PER_CHUNK_TASKS``, with the
+    number of years in each chunk, so each job's time is scaled to those
+    being evaluated (see :func:`job_work`).
+    The memory used depends mostly on the size of each file rather than the
+    number of files, so the largest memory used is taken as it is.
+
+    Parameters
+    ----------
+    records: list of dicts
+        The records of the past jobs of the task.
+    datasets: int
+        The number of datasets to evaluate.
+    years: int
+        The number of years to evaluate.
+    memory_headroom: float
+        The factor by which the recommended memory exceeds the usage.
+    time_headroom: float
+        The factor by which the recommended time exceeds the usage.
+    per_chunk: bool, optional
+        Whether each job of the task standardises one dataset and one chunk
+        of years.
+    chunk_years: int, optional
+        The number of years in each chunk, or 0 if there is a single chunk
+        of every year.
+
+    Returns
+    -------
+    dict or None
+        The memory in MB, time limit in minutes and number of tasks,
+        or None if no job of the task succeeded.
+    """
+    succeeded = [
+        record
+        for record in records
+        if record.get("exit_status") == 0 and "max_rss_kb" in record
+    ]
+    if not succeeded:
+        return None
+    if per_chunk:
+        work = min(chunk_years, years) or years
+    else:
+        work = datasets * years
+    seconds = max(
+        record.get("elapsed_seconds", 0)
+        * work
+        / max(1, job_work(record, per_chunk))
+        for record in succeeded
+    )
+    max_rss_kb = max(record["max_rss_kb"] for record in succeeded)
+    percent_cpu = max(record.get("percent_cpu", 100) for record in succeeded)
+    return {
+        "memory_mb": math.ceil(max_rss_kb / 1024 * memory_headroom),
+        "time_minutes": max(
+            MINIMUM_MINUTES, math.ceil(seconds * time_headroom / 60)
+        ),
+        "ntasks": max(1, math.ceil(percent_cpu / 100)),
+        "jobs": len(succeeded),
+    }
+
+
+def format_memory(memory_mb):
+    """Return a memory directive value, e.g. "3G" or "500M"."""
+    if memory_mb >= 1024:
+        return f"{math.ceil(memory_mb / 1024)}G"
+    return f"{memory_mb}M"
+
+
+def format_runtime(recommendations):
+    """
+    Return the Cylc runtime configuration for the recommended resources.
+
+    Only the tasks in ``TUNED_TASKS`` are included.
+
+    Parameters
+    ----------
+    recommendations: dict
+        The recommended resources, by the name of the task in the history.
+
+    Returns
+    -------
+    str
+        The contents of the runtime file for the site.
+    """
+    lines = [
+        "# Written by tune_resources from the history of resource usage.",
+        "[runtime]",
+    ]
+    for key, resources in sorted(recommendations.items()):
+        for task, section in TUNED_TASKS.items():
+            prefix = f"{task}_"
+            if key.startswith(prefix):
+                value = key.replace(prefix, "", 1)
+                lines.extend(
+                    [
+                        f"    [[{section.format(value)}]]",
+                        "        execution time limit = "
+                        f"PT{resources['time_minutes']}M",
+                        "        [[[directives]]]",
+                        f"            --time = {resources['time_minutes']}",
+                        f"            --mem = "
+                        f"{format_memory(resources['memory_mb'])}",
+                        f"            --ntasks = {resources['ntasks']}",
+                        "",
+                    ]
+                )
+    return "\n".join(lines) + "\n"
+
+
+def record_resources(
+    run_dir,
+    workflow_id,
+    model_runs,
+    cmip6_datasets,
+    years,
+    history_path,
+    chunk_years=0,
+):
+    """
+    Add the resource usage of every job of a workflow to the history.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+    workflow_id: str
+        The ID of the workflow.
+    model_runs: dict
+        The model runs evaluated by the workflow, by suite ID.
+    cmip6_datasets: list
+        The CMIP6 datasets evaluated by the workflow.
+    years: int
+        The number of years evaluated by the workflow.
+    history_path: str
+        The full path to the history YAML file.
+    chunk_years: int, optional
+        The number of years standardised by each task, or 0 if each task
+        standardises every year.
+
+    Returns
+    -------
+    int
+        The number of records added to the history.
+    """
+    records = collect_usage(
+        run_dir,
+        workflow_id,
+        list(model_runs),
+        len(model_runs) + len(cmip6_datasets or []),
+        years,
+        chunk_years,
+    )
+    added = update_history(history_path, records)
+    logger.info("Added %s jobs to %s", added, history_path)
+    return added
+
+
+def tune_resources(
+    history_path,
+    datasets,
+    years,
+    output_path=None,
+    memory_headroom=DEFAULT_MEMORY_HEADROOM,
+    time_headroom=DEFAULT_TIME_HEADROOM,
+    chunk_years=0,
+):
+    """
+    Recommend the resources of every task in the history.
+
+    Parameters
+    ----------
+    history_path: str
+        The full path to the history YAML file.
+    datasets: int
+        The number of datasets to evaluate.
+    years: int
+        The number of years to evaluate.
+    output_path: str, optional
+        The full path to write the Cylc runtime file for the site to.
+    memory_headroom: float
+        The factor by which the recommended memory exceeds the usage.
+    time_headroom: float
+        The factor by which the recommended time exceeds the usage.
+    chunk_years: int, optional
+        The number of years to standardise in each task, or 0 if each task
+        standardises every year.
+
+    Returns
+    -------
+    dict
+        The recommended resources, by the name of the task in the history.
+    """
+    per_chunk_prefixes = tuple(f"{task}_" for task in PER_CHUNK_TASKS)
+    recommendations = {}
+    for key, records in load_yaml(history_path).items():
+        resources = recommend(
+            records,
+            datasets,
+            years,
+            memory_headroom,
+            time_headroom,
+            per_chunk=key.startswith(per_chunk_prefixes),
+            chunk_years=chunk_years,
+        )
+        if resources is None:
+            continue
+        recommendations[key] = resources
+        logger.info(
+            "%s: --mem = %s, time limit = %s minutes, --ntasks = %s "
+            "(from %s jobs)",
+            key,
+            format_memory(resources["memory_mb"]),
+            resources["time_minutes"],
+            resources["ntasks"],
+            resources["jobs"],
+        )
+    if output_path:
+        write_text(format_runtime(recommendations), output_path)
+        logger.info("Wrote the recommended resources to %s", output_path)
+    return recommendations
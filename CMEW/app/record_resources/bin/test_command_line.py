@@ -0,0 +1,60 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for the command of the record_resources Rose app"""
+from pathlib import Path
+import importlib.util
+import re
+import shlex
+
+# --- Section to import command_line.py ---
+
+# Every app has a command_line.py, so this one is imported under its own
+# name
+spec = importlib.util.spec_from_file_location(
+    "record_resources_command_line", Path(__file__).parent / "command_line.py"
+)
+command_line = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(command_line)
+
+# --- End of import section ---
+
+ROSE_APP_PATH = Path(__file__).parent.parent / "rose-app.conf"
+
+# The values of the environment variables used by the command
+ENVIRONMENT = {"NUMBER_OF_YEARS": "10", "CHUNK_YEARS": "5"}
+
+
+def read_command(rose_app_path):
+    """
+    Return the lines of the default command of a Rose app, as Rose joins
+    the continuation lines starting with "=".
+    """
+    lines = []
+    for line in rose_app_path.read_text().splitlines():
+        if line.startswith("default="):
+            lines.append(line.split("=", 1)[1])
+        elif lines and line.lstrip().startswith("="):
+            lines.append(line.lstrip()[1:])
+        elif lines:
+            break
+    return lines
+
+
+def test_command_is_a_single_command():
+    lines = read_command(ROSE_APP_PATH)
+
+    # Every line but the last must be continued, or the shell runs the
+    # following lines as separate commands
+    assert all(line.endswith(" \\") for line in lines[:-1])
+    command = re.sub(
+        r"\$\{(\w+)\}",
+        lambda match: ENVIRONMENT.get(match.group(1), match.group(1)),
+        " ".join(line.rstrip("\\") for line in lines),
+    )
+    words = shlex.split(command)
+    assert words[:2] == ["cmew-esmvaltool-env", "record_resources"]
+
+    args = command_line.parse_args_for_record_resources(words[2:])
+    assert args.history_path == "RESOURCE_HISTORY"
+    assert args.years == 10
+    assert args.chunk_years == 5
@@ -0,0 +1,238 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for resource_history.py"""
+from multiprocessing import Pool
+from resource_history import (
+    format_runtime,
+    recommend,
+    record_resources,
+    task_key,
+    tune_resources,
+    update_history,
+)
+import pytest
+from yaml_io import load_yaml
+
+TIME_LOG = """\
+\tCommand being timed: "esmvaltool run recipe_radiation_budget.yml"
+\tUser time (seconds): 500.00
+\tSystem time (seconds): 20.00
+\tPercent of CPU this job got: {percent_cpu}%
+\tElapsed (wall clock) time (h:mm:ss or m:ss): {elapsed}
+\tMaximum resident set size (kbytes): {max_rss_kb}
+\tExit status: 0
+"""
+
+
+def write_time_log(run_dir, cycle, task, submit, **usage):
+    """Write the .time file of a job."""
+    job_dir = run_dir / "log" / "job" / cycle / task / f"{submit:02d}"
+    job_dir.mkdir(parents=True)
+    (job_dir / "job.time").write_text(TIME_LOG.format(**usage))
+
+
+@pytest.mark.parametrize(
+    "task, expected",
+    [
+        ("run_recipe_radiation_budget", "run_recipe_radiation_budget"),
+        ("run_recipe_radiation_budget_shard2", "run_recipe_radiation_budget"),
+        (
+            "standardise_model_data_u-cw673_apm_chunk1993",
+            "standardise_model_data_apm",
+        ),
+        ("standardise_model_data_u-cw673_apm", "standardise_model_data_apm"),
+        ("restructure_dirs_u-cw673", "restructure_dirs"),
+        ("housekeeping", "housekeeping"),
+    ],
+)
+def test_task_key(task, expected):
+    assert task_key(task, ["u-bv526", "u-cw673"]) == expected
+
+
+def test_recommend():
+    records = [
+        {
+            "datasets": 2,
+            "years": 10,
+            "elapsed_seconds": 600.0,
+            "max_rss_kb": 2048000,
+            "percent_cpu": 350,
+            "exit_status": 0,
+        },
+        {
+            "datasets": 4,
+            "years": 10,
+            "elapsed_seconds": 900.0,
+            "max_rss_kb": 1024000,
+            "percent_cpu": 200,
+            "exit_status": 0,
+        },
+        {"datasets": 4, "years": 10, "max_rss_kb": 9999999, "exit_status": 1},
+    ]
+    actual = recommend(records, 4, 20)
+    expected = {
+        "memory_mb": 3000,
+        "time_minutes": 60,
+        "ntasks": 4,
+        "jobs": 2,
+    }
+    assert actual == expected
+
+
+def test_recommend_per_chunk():
+    records = [
+        {
+            "datasets": 3,
+            "years": 20,
+            "chunk_years": 10,
+            "elapsed_seconds": 600.0,
+            "max_rss_kb": 1024000,
+            "exit_status": 0,
+        },
+        # Recorded without the years in each chunk, so covering every year
+        {
+            "datasets": 3,
+            "years": 5,
+            "elapsed_seconds": 240.0,
+            "max_rss_kb": 1024000,
+            "exit_status": 0,
+        },
+    ]
+    # Each job standardises one dataset, so only the years in each chunk
+    # matter
+    actual = recommend(records, 10, 40, per_chunk=True, chunk_years=10)
+    assert actual["time_minutes"] == 15
+    actual = recommend(records, 10, 40, per_chunk=True)
+    assert actual["time_minutes"] == 60
+
+
+def test_recommend_no_successful_jobs():
+    assert recommend([{"exit_status": 1}], 1, 1) is None
+
+
+def test_format_runtime():
+    recommendations = {
+        "run_recipe_radiation_budget": {
+            "memory_mb": 3000,
+            "time_minutes": 60,
+            "ntasks": 4,
+        },
+        "standardise_model_data_apm": {
+            "memory_mb": 500,
+            "time_minutes": 5,
+            "ntasks": 1,
+        },
+        "housekeeping": {"memory_mb": 50, "time_minutes": 5, "ntasks": 1},
+    }
+    actual = format_runtime(recommendations)
+    assert (
+        "    [[run_recipe<recipe=radiation_budget{{ SHARD_PARAM }}>]]\n"
+        in (actual)
+    )
+    assert "            --mem = 3G\n" in actual
+    assert "execution time limit = PT5M" in actual
+    assert "housekeeping" not in actual
+
+
+def test_record_and_tune_resources(tmp_path):
+    run_dir = tmp_path / "cylc-run" / "cmew" / "run1"
+    write_time_log(
+        run_dir,
+        "1",
+        "run_recipe_radiation_budget",
+        1,
+        percent_cpu=390,
+        elapsed="1:00:00",
+        max_rss_kb=2000000,
+    )
+    write_time_log(
+        run_dir,
+        "1",
+        "standardise_model_data_u-cw673_apm_chunk1993",
+        1,
+        percent_cpu=95,
+        elapsed="10:00.00",
+        max_rss_kb=400000,
+    )
+    history_path = tmp_path / "history.yml"
+    model_runs = {"u-cw673": {}, "u-bv526": {}}
+
+    assert (
+        record_resources(
+            run_dir, "cmew/run1", model_runs, [{}], 2, history_path
+        )
+        == 2
+    )
+    # Recording the same jobs again doesn't add them twice
+    assert (
+        record_resources(
+            run_dir, "cmew/run1", model_runs, [{}], 2, history_path
+        )
+        == 0
+    )
+    history = load_yaml(history_path)
+    assert history["standardise_model_data_apm"][0]["datasets"] == 3
+    assert history["standardise_model_data_apm"][0]["chunk_years"] == 2
+
+    output_path = tmp_path / "metoffice_resources.cylc"
+    recommendations = tune_resources(history_path, 3, 4, output_path)
+    assert (
+        recommendations["run_recipe_radiation_budget"]["time_minutes"] == 180
+    )
+    assert recommendations["standardise_model_data_apm"]["time_minutes"] == 30
+    assert "[[standardise_model_data<dataset, stream=apm" in (
+        output_path.read_text()
+    )
+
+
+def test_record_resources_several_commands(tmp_path):
+    # standardise_model_data runs cdds_convert, then caches the data,
+    # appending the usage of each command to the same .time file
+    run_dir = tmp_path / "cylc-run" / "cmew" / "run1"
+    task = "standardise_model_data_u-cw673_apm_chunk1993"
+    write_time_log(
+        run_dir,
+        "1",
+        task,
+        1,
+        percent_cpu=95,
+        elapsed="2:00:00",
+        max_rss_kb=4000000,
+    )
+    time_path = run_dir / "log" / "job" / "1" / task / "01" / "job.time"
+    with open(time_path, "a") as file_handle:
+        file_handle.write(
+            TIME_LOG.format(percent_cpu=50, elapsed="0:10", max_rss_kb=50000)
+        )
+    history_path = tmp_path / "history.yml"
+
+    record_resources(
+        run_dir, "cmew/run1", {"u-cw673": {}}, [], 10, history_path
+    )
+
+    record = load_yaml(history_path)["standardise_model_data_apm"][0]
+    assert record["max_rss_kb"] == 4000000
+    assert record["elapsed_seconds"] == 7210.0
+    assert record["user_seconds"] == 1000.0
+
+
+def add_record(history_path, workflow):
+    """Add one job of a workflow to the history."""
+    record = {"workflow": workflow, "cycle": "1", "task": "t", "submit": 1}
+    return update_history(history_path, {"housekeeping": [record]})
+
+
+def test_update_history_concurrently(tmp_path):
+    history_path = str(tmp_path / "history.yml")
+    workflows = [f"cmew/run{index}" for index in range(8)]
+
+    with Pool(4) as pool:
+        added = pool.starmap(
+            add_record, [(history_path, workflow) for workflow in workflows]
+        )
+
+    assert added == [1] * len(workflows)
+    history = load_yaml(history_path, use_cache=False)
+    assert sorted(
+        record["workflow"] for record in history["housekeeping"]
+    ) == sorted(workflows)
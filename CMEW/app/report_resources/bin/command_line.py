@@ -0,0 +1,72 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+from profiling import profile_entry_point
+from resource_report import report_resources
+
+
+def parse_args_for_report_resources(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_report_resources`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Report the resources used by every job of a workflow.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--run_dir",
+        help="The full path to the run directory of the workflow.",
+    )
+    parser.add_argument(
+        "--workflow_id",
+        help="The ID of the workflow.",
+    )
+    parser.add_argument(
+        "--report_dir",
+        help="The full path to the directory to write the report to.",
+    )
+    parser.add_argument(
+        "--csv_path",
+        help=(
+            "The full path to the CSV file to append the report to. "
+            "If not given, resources.csv in the report directory is used."
+        ),
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_report_resources(arguments=None):
+    """
+    Report the resources used by every job of a workflow.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_report_resources(arguments)
+
+    # Run the code.
+    print(f"run_dir: {args.run_dir}")
+    print(f"workflow_id: {args.workflow_id}")
+    print(f"report_dir: {args.report_dir}")
+    print(f"csv_path: {args.csv_path}")
+    report_resources(
+        args.run_dir,
+        args.workflow_id,
+        args.report_dir,
+        args.csv_path,
+    )
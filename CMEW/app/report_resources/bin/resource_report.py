@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Report the resources used by every job of a workflow.
+
+The resource usage each job wrote to its ``.time`` file is combined with
+the times Cylc recorded in the workflow database, when each job was
+submitted, started and finished. The report is written to the share
+directory of the workflow as a plain text table and an HTML summary, and
+the rows are appended to a CSV file, which may be shared between runs to
+compare them. The times of the jobs are also combined with any traces
+written by the jobs (see ``lib/python/tracing.py``) into a single timeline.
+"""
+import csv
+import html
+import json
+import logging
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from time_log import find_time_logs, read_time_log
+from tracing import find_traces, merge_traces
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The columns of the report, in order
+REPORT_FIELDS = (
+    "workflow",
+    "cycle",
+    "task",
+    "submit",
+    "platform",
+    "queued_seconds",
+    "run_seconds",
+    "elapsed_seconds",
+    "cpu_seconds",
+    "percent_cpu",
+    "max_rss_kb",
+    "major_page_faults",
+    "minor_page_faults",
+    "file_system_inputs",
+    "file_system_outputs",
+    "exit_status",
+)
+
+# The columns which identify a job
+JOB_FIELDS = ("workflow", "cycle", "task", "submit")
+
+# The columns of the plain text table, with their headings
+TABLE_COLUMNS = (
+    ("task", "Task"),
+    ("cycle", "Cycle"),
+    ("submit", "Job"),
+    ("queued_seconds", "Queued (s)"),
+    ("elapsed_seconds", "Wall (s)"),
+    ("cpu_seconds", "CPU (s)"),
+    ("max_rss_kb", "Max RSS (kB)"),
+    ("major_page_faults", "Major faults"),
+    ("file_system_inputs", "FS in"),
+    ("file_system_outputs", "FS out"),
+)
+
+# The names of the report files in the report directory
+TABLE_FILENAME = "resources.txt"
+HTML_FILENAME = "resources.html"
+TRACE_FILENAME = "resources.trace.json"
+
+# The process ID of the jobs in the combined trace, which no real process has
+JOBS_TRACE_PID = 0
+
+# The number of jobs highlighted as taking the most time or memory
+HOT_JOBS = 5
+
+
+def parse_time(value):
+    """Return the datetime of a time in the Cylc database, or None."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def read_task_jobs(db_path):
+    """
+    Read when each job was submitted, started and finished.
+
+    Parameters
+    ----------
+    db_path: str
+        The full path to the Cylc database of the workflow.
+
+    Returns
+    -------
+    list of tuples
+        The cycle point, task name, submit number, platform, and the
+        datetimes the job was submitted, started and finished (or None),
+        of each job.
+    """
+    if not os.path.isfile(db_path):
+        return []
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = connection.execute(
+            "SELECT cycle, name, submit_num, platform_name, time_submit, "
+            "time_run, time_run_exit FROM task_jobs"
+        ).fetchall()
+    finally:
+        connection.close()
+    return [
+        (
+            cycle,
+            task,
+            submit,
+            platform,
+            *(parse_time(value) for value in times),
+        )
+        for cycle, task, submit, platform, *times in rows
+    ]
+
+
+def read_job_timings(db_path):
+    """
+    Read how long each job spent queueing and running.
+
+    Parameters
+    ----------
+    db_path: str
+        The full path to the Cylc database of the workflow.
+
+    Returns
+    -------
+    dict
+        The platform, the seconds spent queueing and the seconds spent
+        running of each job, by cycle point, task name and submit number.
+    """
+    timings = {}
+    for (
+        cycle,
+        task,
+        submit,
+        platform,
+        submitted,
+        started,
+        finished,
+    ) in read_task_jobs(db_path):
+        timings[(cycle, task, submit)] = {
+            "platform": platform,
+            "queued_seconds": (
+                (started - submitted).total_seconds()
+                if submitted and started
+                else None
+            ),
+            "run_seconds": (
+                (finished - started).total_seconds()
+                if started and finished
+                else None
+            ),
+        }
+    return timings
+
+
+def job_trace_events(task_jobs):
+    """
+    Return the time each job spent queueing and running as trace events.
+
+    Each job is shown on its own row of the "Cylc jobs" process, so that
+    the jobs of the same task in different cycles may overlap.
+
+    Parameters
+    ----------
+    task_jobs: list of tuples
+        The jobs, as returned by :func:`read_task_jobs`.
+
+    Returns
+    -------
+    list of dicts
+        The events, in the Trace Event Format.
+    """
+
+    def microseconds(value):
+        return int(value.timestamp() * 1_000_000)
+
+    events = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": JOBS_TRACE_PID,
+            "args": {"name": "Cylc jobs"},
+        }
+    ]
+    for row, job in enumerate(task_jobs, start=1):
+        cycle, task, submit, platform, submitted, started, finished = job
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": JOBS_TRACE_PID,
+                "tid": row,
+                "args": {"name": f"{cycle}/{task}/{submit:02d}"},
+            }
+        )
+        for name, start, end in (
+            ("queued", submitted, started),
+            ("running", started, finished),
+        ):
+            if start and end:
+                events.append(
+                    {
+                        "name": name,
+                        "cat": "cylc",
+                        "ph": "X",
+                        "ts": microseconds(start),
+                        "dur": microseconds(end) - microseconds(start),
+                        "pid": JOBS_TRACE_PID,
+                        "tid": row,
+                        "args": {"task": task, "platform": platform},
+                    }
+                )
+    return events
+
+
+def collect_rows(run_dir, workflow_id):
+    """
+    List the resources used by every job of a workflow.
+
+    Jobs recorded by Cylc without a ``.time`` file, e.g. those killed by
+    the batch system, are included with only the Cylc timings.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+    workflow_id: str
+        The ID of the workflow.
+
+    Returns
+    -------
+    list of dicts
+        The columns in ``REPORT_FIELDS`` for each job, in order of cycle
+        point, task name and submit number.
+    """
+    timings = read_job_timings(os.path.join(run_dir, "log", "db"))
+    usage = {
+        (cycle, task, submit): read_time_log(fp)
+        for cycle, task, submit, fp in find_time_logs(run_dir)
+    }
+    rows = []
+    for cycle, task, submit in sorted(set(timings) | set(usage)):
+        row = dict.fromkeys(REPORT_FIELDS)
+        row.update(zip(JOB_FIELDS, (workflow_id, cycle, task, submit)))
+        row.update(timings.get((cycle, task, submit), {}))
+        job_usage = usage.get((cycle, task, submit), {})
+        row.update(
+            {
+                name: value
+                for name, value in job_usage.items()
+                if name in REPORT_FIELDS
+            }
+        )
+        cpu_times = [
+            job_usage[name]
+            for name in ("user_seconds", "system_seconds")
+            if name in job_usage
+        ]
+        if cpu_times:
+            row["cpu_seconds"] = sum(cpu_times)
+        rows.append(row)
+    return rows
+
+
+def format_value(value):
+    """Return a value of the report as text."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+def format_table(rows):
+    """
+    Return the columns in ``TABLE_COLUMNS`` of each job as a plain text
+    table.
+    """
+    cells = [[heading for _, heading in TABLE_COLUMNS]] + [
+        [format_value(row[name]) for name, _ in TABLE_COLUMNS] for row in rows
+    ]
+    widths = [
+        max(len(line[index]) for line in cells)
+        for index in range(len(TABLE_COLUMNS))
+    ]
+    lines = [
+        "  ".join(
+            cell.ljust(width) if index == 0 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(line, widths))
+        ).rstrip()
+        for line in cells
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines) + "\n"
+
+
+def format_html_table(rows, columns):
+    """Return an HTML table of the given columns of each job."""
+    header = "".join(
+        f"<th>{html.escape(heading)}</th>" for _, heading in columns
+    )
+    body = "\n".join(
+        "<tr>"
+        + "".join(
+            f"<td>{html.escape(format_value(row[name]))}</td>"
+            for name, _ in columns
+        )
+        + "</tr>"
+        for row in rows
+    )
+    return f"<table>\n<tr>{header}</tr>\n{body}\n</table>"
+
+
+def format_html(rows, workflow_id):
+    """
+    Return an HTML summary of the resources used by a workflow.
+
+    The summary gives the total wall and CPU time, the largest memory used,
+    and the jobs which took the most time and memory, followed by the
+    table of every job.
+    """
+
+    def total(name):
+        return sum(row[name] or 0 for row in rows)
+
+    def largest(name):
+        return sorted(rows, key=lambda row: row[name] or 0, reverse=True)[
+            :HOT_JOBS
+        ]
+
+    title = html.escape(f"Resources used by {workflow_id}")
+    summary = {
+        "Jobs": len(rows),
+        "Total wall time (s)": format_value(float(total("elapsed_seconds"))),
+        "Total CPU time (s)": format_value(float(total("cpu_seconds"))),
+        "Total time queued (s)": format_value(float(total("queued_seconds"))),
+        "Largest max RSS (kB)": max(
+            (row["max_rss_kb"] or 0 for row in rows), default=0
+        ),
+    }
+    summary_items = "\n".join(
+        f"<li>{html.escape(name)}: {html.escape(str(value))}</li>"
+        for name, value in summary.items()
+    )
+    return "\n".join(
+        [
+            "<!DOCTYPE html>",
+            "<html>",
+            f"<head><meta charset='utf-8'><title>{title}</title>",
+            "<style>table {border-collapse: collapse} "
+            "th, td {border: 1px solid #ccc; padding: 2px 6px; "
+            "text-align: right} th:first-child, td:first-child "
+            "{text-align: left}</style>",
+            "</head>",
+            "<body>",
+            f"<h1>{title}</h1>",
+            f"<ul>\n{summary_items}\n</ul>",
+            "<h2>The jobs taking the most wall time</h2>",
+            format_html_table(largest("elapsed_seconds"), TABLE_COLUMNS),
+            "<h2>The jobs using the most memory</h2>",
+            format_html_table(largest("max_rss_kb"), TABLE_COLUMNS),
+            "<h2>Every job</h2>",
+            format_html_table(rows, TABLE_COLUMNS),
+            "</body>",
+            "</html>",
+            "",
+        ]
+    )
+
+
+def append_csv(rows, csv_path):
+    """
+    Append the rows of jobs to a CSV file, skipping any already there.
+
+    Parameters
+    ----------
+    rows: list of dicts
+        The columns in ``REPORT_FIELDS`` for each job.
+    csv_path: str
+        The full path to the CSV file.
+
+    Returns
+    -------
+    int
+        The number of rows appended.
+    """
+    recorded = set()
+    exists = os.path.isfile(csv_path)
+    if exists:
+        with open(csv_path, newline="") as file_handle:
+            recorded = {
+                tuple(row[field] for field in JOB_FIELDS)
+                for row in csv.DictReader(file_handle)
+            }
+    new_rows = [
+        row
+        for row in rows
+        if tuple(format_value(row[field]) for field in JOB_FIELDS)
+        not in recorded
+    ]
+    with open(csv_path, "a", newline="") as file_handle:
+        writer = csv.DictWriter(file_handle, fieldnames=REPORT_FIELDS)
+        if not exists:
+            writer.writeheader()
+        writer.writerows(new_rows)
+    return len(new_rows)
+
+
+def report_resources(run_dir, workflow_id, report_dir, csv_path=None):
+    """
+    Write a report of the resources used by every job of a workflow.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+    workflow_id: str
+        The ID of the workflow.
+    report_dir: str
+        The directory to write the plain text table, HTML summary and
+        timeline to.
+    csv_path: str, optional
+        The full path to the CSV file to append the rows to; by default,
+        ``resources.csv`` in ``report_dir``.
+
+    Returns
+    -------
+    list of dicts
+        The columns in ``REPORT_FIELDS`` for each job.
+    """
+    report_dir = Path(report_dir)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    csv_path = csv_path or report_dir / "resources.csv"
+    rows = collect_rows(run_dir, workflow_id)
+
+    (report_dir / TABLE_FILENAME).write_text(format_table(rows))
+    (report_dir / HTML_FILENAME).write_text(format_html(rows, workflow_id))
+    trace = merge_traces(
+        find_traces(run_dir),
+        job_trace_events(read_task_jobs(os.path.join(run_dir, "log", "db"))),
+    )
+    with open(report_dir / TRACE_FILENAME, "w") as file_handle:
+        json.dump(trace, file_handle)
+    appended = append_csv(rows, csv_path)
+    logger.info(
+        "Reported %s jobs in %s, and appended %s to %s",
+        len(rows),
+        report_dir,
+        appended,
+        csv_path,
+    )
+    return rows
@@ -0,0 +1,141 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for resource_report.py"""
+import csv
+import json
+import sqlite3
+from resource_report import (
+    collect_rows,
+    format_table,
+    job_trace_events,
+    read_task_jobs,
+    report_resources,
+)
+import pytest
+
+TIME_LOG = """\
+\tUser time (seconds): 50.00
+\tSystem time (seconds): 10.00
+\tPercent of CPU this job got: 60%
+\tElapsed (wall clock) time (h:mm:ss or m:ss): 1:40.00
+\tMaximum resident set size (kbytes): 2000000
+\tMajor (requiring I/O) page faults: 3
+\tFile system inputs: 800
+\tFile system outputs: 16
+\tExit status: 0
+"""
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    """A run directory with one job which wrote a .time file."""
+    run_dir = tmp_path / "run1"
+    job_dir = run_dir / "log" / "job" / "1" / "run_recipe_radiation_budget"
+    (job_dir / "01").mkdir(parents=True)
+    (job_dir / "01" / "job.time").write_text(TIME_LOG)
+
+    connection = sqlite3.connect(run_dir / "log" / "db")
+    connection.execute(
+        "CREATE TABLE task_jobs (cycle TEXT, name TEXT, submit_num INTEGER, "
+        "platform_name TEXT, time_submit TEXT, time_run TEXT, "
+        "time_run_exit TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO task_jobs VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                "1",
+                "run_recipe_radiation_budget",
+                1,
+                "spice",
+                "2026-01-01T00:00:00Z",
+                "2026-01-01T00:05:00Z",
+                "2026-01-01T00:06:45Z",
+            ),
+            (
+                "1",
+                "standardise_model_data_u-cw673_apm",
+                1,
+                "localhost",
+                "2026-01-01T00:00:00Z",
+                "2026-01-01T00:00:01Z",
+                None,
+            ),
+        ],
+    )
+    connection.commit()
+    connection.close()
+    return run_dir
+
+
+def test_collect_rows(run_dir):
+    rows = collect_rows(run_dir, "cmew/run1")
+
+    assert [row["task"] for row in rows] == [
+        "run_recipe_radiation_budget",
+        "standardise_model_data_u-cw673_apm",
+    ]
+    assert rows[0]["platform"] == "spice"
+    assert rows[0]["queued_seconds"] == 300.0
+    assert rows[0]["run_seconds"] == 105.0
+    assert rows[0]["elapsed_seconds"] == 100.0
+    assert rows[0]["cpu_seconds"] == 60.0
+    assert rows[0]["max_rss_kb"] == 2000000
+    # The job killed by the batch system has only the Cylc timings
+    assert rows[1]["run_seconds"] is None
+    assert rows[1]["max_rss_kb"] is None
+
+
+def test_format_table(run_dir):
+    lines = format_table(collect_rows(run_dir, "cmew/run1")).splitlines()
+    assert lines[0].split()[:3] == ["Task", "Cycle", "Job"]
+    assert lines[2].split() == [
+        "run_recipe_radiation_budget",
+        "1",
+        "1",
+        "300.0",
+        "100.0",
+        "60.0",
+        "2000000",
+        "3",
+        "800",
+        "16",
+    ]
+
+
+def test_job_trace_events(run_dir):
+    events = job_trace_events(read_task_jobs(run_dir / "log" / "db"))
+    spans = [event for event in events if event["ph"] == "X"]
+
+    # The job killed by the batch system has only queued
+    assert [(event["name"], event["tid"]) for event in spans] == [
+        ("queued", 1),
+        ("running", 1),
+        ("queued", 2),
+    ]
+    assert spans[0]["dur"] == 300_000_000
+    assert spans[1]["ts"] == spans[0]["ts"] + spans[0]["dur"]
+    assert events[1]["args"]["name"] == "1/run_recipe_radiation_budget/01"
+
+
+def test_report_resources(tmp_path, run_dir):
+    report_dir = tmp_path / "resources"
+    csv_path = tmp_path / "resources.csv"
+    report_resources(run_dir, "cmew/run1", report_dir, csv_path)
+    # Reporting the same jobs again doesn't append them twice
+    report_resources(run_dir, "cmew/run1", report_dir, csv_path)
+    report_resources(run_dir, "cmew/run2", report_dir, csv_path)
+
+    assert (
+        "run_recipe_radiation_budget"
+        in (report_dir / "resources.html").read_text()
+    )
+    assert (report_dir / "resources.txt").is_file()
+    trace = json.loads((report_dir / "resources.trace.json").read_text())
+    assert len(trace["traceEvents"]) == 6
+    with open(csv_path, newline="") as file_handle:
+        rows = list(csv.DictReader(file_handle))
+    assert [row["workflow"] for row in rows] == ["cmew/run1"] * 2 + [
+        "cmew/run2"
+    ] * 2
+    assert rows[0]["max_rss_kb"] == "2000000"
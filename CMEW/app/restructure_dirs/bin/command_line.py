@@ -0,0 +1,146 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+from profiling import profile_entry_point
+from restructure import DEFAULT_WORKERS, restructure
+from standardised_store import publish_to_store
+from yaml_io import load_yaml
+
+
+def parse_args_for_publish_to_store(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_publish_to_store`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Add newly standardised data to the store of standardised data."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--restructured_dir",
+        help="The full path to the restructured data directory.",
+    )
+    parser.add_argument(
+        "--store_dir",
+        help="The full path to the store of standardised data.",
+    )
+    parser.add_argument(
+        "--model_runs_yml_fp",
+        help="The full path to the model_runs.yml file.",
+    )
+    parser.add_argument(
+        "--suite_id",
+        help=(
+            "The suite ID of the model run to add. "
+            "If not given, every model run is added."
+        ),
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_publish_to_store(arguments=None):
+    """
+    Add newly standardised data to the store of standardised data.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_publish_to_store(arguments)
+
+    # Run the code.
+    print(f"restructured_dir: {args.restructured_dir}")
+    print(f"store_dir: {args.store_dir}")
+    print(f"model_runs_yml_fp: {args.model_runs_yml_fp}")
+    print(f"suite_id: {args.suite_id}")
+    model_runs = load_yaml(args.model_runs_yml_fp)
+    if args.suite_id:
+        model_runs = {args.suite_id: model_runs[args.suite_id]}
+    publish_to_store(
+        args.restructured_dir,
+        args.store_dir,
+        model_runs,
+    )
+
+
+def parse_args_for_restructure(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_restructure`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Link standardised data into the directory structure "
+            "used by ESMValTool."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--cdds_dirs_paths",
+        nargs="*",
+        default=[],
+        help=(
+            "The full paths to the indexes of the directories CDDS used "
+            "for each model run."
+        ),
+    )
+    parser.add_argument(
+        "--restructured_dir",
+        help="The full path to the restructured data directory.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="The number of threads linking files at once.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_restructure(arguments=None):
+    """
+    Link standardised data into the directory structure used by ESMValTool.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_restructure(arguments)
+
+    # Run the code.
+    print(f"cdds_dirs_paths: {args.cdds_dirs_paths}")
+    print(f"restructured_dir: {args.restructured_dir}")
+    print(f"workers: {args.workers}")
+    restructure(
+        args.cdds_dirs_paths,
+        args.restructured_dir,
+        args.workers,
+    )
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Restructure the data standardised by CDDS for ESMValTool.
+
+The files in the output directory of each CDDS request are linked into the
+BADC DRS used for the ``ESMVal`` project in the developer configuration
+file::
+
+    {mip_era}/{activity}/{institute}/{dataset}/{exp}/{ensemble}/{mip}/
+    {short_name}/{grid}/{version}/{filename}
+
+Files are hard linked where possible, otherwise symlinked, so the data is
+never copied. The dataset, experiment, ensemble member, MIP table, variable
+and grid are read from each file name, and the other facets from the
+request. Files already in the DRS, in any version, are skipped, so
+restructuring again only links the new files.
+"""
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+from cdds_dirs import read_request
+from yaml_io import load_yaml
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The default number of threads linking files at once
+DEFAULT_WORKERS = 8
+
+# The suffix of the directories CDDS writes intermediate files to,
+# before they are concatenated
+INTERMEDIATE_SUFFIX = "_mip_convert"
+
+# The facets in a CMOR file name, before the optional date range
+FILE_NAME_FACETS = ("short_name", "mip", "dataset", "exp", "ensemble", "grid")
+
+
+def parse_file_name(file_name):
+    """
+    Return the facets in a CMOR file name.
+
+    Parameters
+    ----------
+    file_name: str
+        The name of the file, e.g.
+        ``tas_Amon_HadGEM3-GC31-LL_amip_r1i1p1f1_gn_199301-200212.nc``.
+
+    Returns
+    -------
+    dict or None
+        The facets in ``FILE_NAME_FACETS``, or None if the name isn't
+        that of a CMOR file.
+    """
+    if not file_name.endswith(".nc"):
+        return None
+    parts = file_name[: -len(".nc")].split("_")
+    if len(parts) not in (len(FILE_NAME_FACETS), len(FILE_NAME_FACETS) + 1):
+        return None
+    return dict(zip(FILE_NAME_FACETS, parts))
+
+
+def variable_dir(restructured_dir, request, facets):
+    """
+    Return the directory of the versions of a variable in the DRS.
+
+    Parameters
+    ----------
+    restructured_dir: Path
+        The full path to the restructured data directory.
+    request: dict
+        The options in each section of the CDDS request.
+    facets: dict
+        The facets of the file, as returned by :func:`parse_file_name`.
+
+    Returns
+    -------
+    Path
+        The directory containing the version directories.
+    """
+    metadata = request["metadata"]
+    return Path(
+        restructured_dir,
+        metadata["mip_era"],
+        metadata["mip"],
+        metadata["institution_id"],
+        facets["dataset"],
+        facets["exp"],
+        facets["ensemble"],
+        facets["mip"],
+        facets["short_name"],
+        facets["grid"],
+    )
+
+
+def iter_output_files(output_dir):
+    """Lazily list the standardised files in a CDDS output directory."""
+    for root, dirs, files in os.walk(output_dir, followlinks=True):
+        dirs[:] = sorted(
+            name for name in dirs if not name.endswith(INTERMEDIATE_SUFFIX)
+        )
+        for name in sorted(files):
+            facets = parse_file_name(name)
+            if facets is not None:
+                yield Path(root) / name, facets
+
+
+def plan_restructure(output_dir, request, restructured_dir, version):
+    """
+    List the files to link into the DRS for a CDDS request.
+
+    Each variable keeps a single version: the latest one already in the
+    DRS, if there is one, otherwise ``version``.
+
+    Parameters
+    ----------
+    output_dir: str
+        The full path to the output directory of the request.
+    request: dict
+        The options in each section of the request.
+    restructured_dir: str
+        The full path to the restructured data directory.
+    version: str
+        The version of new variables, e.g. "v20260101".
+
+    Returns
+    -------
+    list of tuples
+        The source and target paths of each file which isn't in the DRS.
+    """
+    links = []
+    versions = {}
+    for source, facets in iter_output_files(output_dir):
+        versions_dir = variable_dir(restructured_dir, request, facets)
+        if versions_dir not in versions:
+            existing = (
+                sorted(path.name for path in versions_dir.iterdir())
+                if versions_dir.is_dir()
+                else []
+            )
+            versions[versions_dir] = existing
+        existing = versions[versions_dir]
+        if any(
+            (versions_dir / name / source.name).exists() for name in existing
+        ):
+            continue
+        target_version = existing[-1] if existing else version
+        links.append((source, versions_dir / target_version / source.name))
+    return links
+
+
+def place_file(source, target):
+    """
+    Hard link ``source`` to ``target``, or symlink it if that isn't possible.
+
+    Returns
+    -------
+    bool
+        Whether the file was placed; if ``target`` already exists,
+        another task has placed it.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source.resolve(), target)
+    except FileExistsError:
+        return False
+    except OSError:
+        try:
+            target.symlink_to(source.resolve())
+        except FileExistsError:
+            return False
+    return True
+
+
+def restructure(
+    cdds_dirs_paths, restructured_dir, workers=DEFAULT_WORKERS, version=None
+):
+    """
+    Link the standardised data of CDDS requests into the DRS.
+
+    Parameters
+    ----------
+    cdds_dirs_paths: list of str
+        The full paths to the indexes of the directories CDDS used,
+        written by ``configure_standardise``.
+    restructured_dir: str
+        The full path to the restructured data directory.
+    workers: int
+        The number of threads linking files at once.
+    version: str, optional
+        The version of new variables; by default, today's date,
+        e.g. "v20260101".
+
+    Returns
+    -------
+    int
+        The number of files linked.
+    """
+    version = version or date.today().strftime("v%Y%m%d")
+    links = []
+    for cdds_dirs_path in cdds_dirs_paths:
+        for cdds_dirs in load_yaml(cdds_dirs_path).values():
+            request = read_request(cdds_dirs["request_path"])
+            links.extend(
+                plan_restructure(
+                    cdds_dirs["output_dir"], request, restructured_dir, version
+                )
+            )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        placed = sum(executor.map(lambda link: place_file(*link), links))
+    logger.info("Linked %s files into %s", placed, restructured_dir)
+    return placed
@@ -5,6 +5,19 @@
 BASH_XTRACEFD=1
 set -eux
 
-RESTRUCTURE_COMMAND=${CDDS_SOFTWARE_DIR}/ceda-mip-tools/bin/restructure_for_cmip6
+# Link the output of every CDDS request for this model run, recorded by
+# configure_standardise, into the directory structure used by ESMValTool
+if [[ -f "${CDDS_DIRS_PATH}" ]]; then
+    cmew-esmvaltool-env restructure \
+        --cdds_dirs_paths "${CDDS_DIRS_PATH}" \
+        --restructured_dir "${ROOT_RESTRUCTURED_DIR}"
+fi
 
-${RESTRUCTURE_COMMAND} -d "${ROOT_RESTRUCTURED_DIR}" "${ROOT_DATA_DIR}"
+# Share the newly standardised data with other workflows
+if [[ -n "${STANDARDISED_DATA_STORE}" ]]; then
+    cmew-esmvaltool-env publish_to_store \
+        --restructured_dir "${ROOT_RESTRUCTURED_DIR}" \
+        --store_dir "${STANDARDISED_DATA_STORE}" \
+        --model_runs_yml_fp "${DATASETS_LIST_DIR}/model_runs.yml" \
+        --suite_id "${CYLC_TASK_PARAM_dataset}"
+fi
@@ -0,0 +1,102 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Unit tests for restructure.py
+
+Test data files:
+/app/unittest/kgo/request_u-cw673.cfg
+    basis of the request in every test
+"""
+from pathlib import Path
+import configparser
+import os
+import pytest
+from restructure import parse_file_name, restructure
+from yaml_io import write_yaml
+
+FILE_NAME = "tas_Amon_HadGEM3-GC5E-LL_amip_r1i1p1f1_gn_199301-199412.nc"
+VARIABLE_DIR = Path(
+    "GCModelDev/ESMVal/MOHC/HadGEM3-GC5E-LL/amip/r1i1p1f1/Amon/tas/gn"
+)
+
+
+@pytest.fixture
+def cdds_dirs_path(tmp_path):
+    """The index of a request which has standardised tas."""
+    config = configparser.ConfigParser()
+    config.read(
+        Path(__file__).parent.parent.parent
+        / "unittest"
+        / "kgo"
+        / "request_u-cw673.cfg"
+    )
+    request_path = tmp_path / "request_u-cw673_apm_1993.cfg"
+    with open(request_path, "w") as file_handle:
+        config.write(file_handle)
+
+    output_dir = tmp_path / "cdds_data" / "output"
+    for sub_dir in ["apm_concat/Amon/tas", "apm_mip_convert/Amon/tas"]:
+        (output_dir / sub_dir).mkdir(parents=True)
+        (output_dir / sub_dir / FILE_NAME).write_text(sub_dir)
+    (output_dir / "apm_concat" / "log.txt").write_text("not data")
+
+    cdds_dirs_path = tmp_path / "cdds_dirs_u-cw673.yml"
+    write_yaml(
+        {
+            "apm_1993": {
+                "request_path": str(request_path),
+                "output_dir": str(output_dir),
+            }
+        },
+        cdds_dirs_path,
+    )
+    return cdds_dirs_path
+
+
+def test_parse_file_name():
+    actual = parse_file_name(FILE_NAME)
+    expected = {
+        "short_name": "tas",
+        "mip": "Amon",
+        "dataset": "HadGEM3-GC5E-LL",
+        "exp": "amip",
+        "ensemble": "r1i1p1f1",
+        "grid": "gn",
+    }
+    assert actual == expected
+
+
+@pytest.mark.parametrize("file_name", ["log.txt", "tas_Amon.nc"])
+def test_parse_file_name_not_cmor(file_name):
+    assert parse_file_name(file_name) is None
+
+
+def test_restructure(tmp_path, cdds_dirs_path):
+    restructured_dir = tmp_path / "work"
+    placed = restructure([cdds_dirs_path], restructured_dir, 2, "v20260101")
+
+    target = restructured_dir / VARIABLE_DIR / "v20260101" / FILE_NAME
+    assert placed == 1
+    assert target.read_text() == "apm_concat/Amon/tas"
+    assert os.path.samefile(
+        target,
+        tmp_path / "cdds_data/output/apm_concat/Amon/tas" / FILE_NAME,
+    )
+
+
+def test_restructure_again_skips_placed_files(tmp_path, cdds_dirs_path):
+    restructured_dir = tmp_path / "work"
+    restructure([cdds_dirs_path], restructured_dir, 2, "v20260101")
+    placed = restructure([cdds_dirs_path], restructured_dir, 2, "v20261018")
+
+    assert placed == 0
+    assert os.listdir(restructured_dir / VARIABLE_DIR) == ["v20260101"]
+
+
+def test_restructure_keeps_existing_version(tmp_path, cdds_dirs_path):
+    restructured_dir = tmp_path / "work"
+    (restructured_dir / VARIABLE_DIR / "v20250101").mkdir(parents=True)
+    restructure([cdds_dirs_path], restructured_dir, 2, "v20260101")
+
+    target = restructured_dir / VARIABLE_DIR / "v20250101" / FILE_NAME
+    assert target.is_file()
@@ -0,0 +1,19 @@
+#!/bin/bash
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+# Send the output from 'set -x' to 'stdout' rather than 'stderr'.
+BASH_XTRACEFD=1
+set -eux
+
+# A recipe with fewer groups of diagnostics than RECIPE_SHARDS has fewer
+# shards, so there is nothing for the remaining tasks to run
+if [[ ! -f "${SHARD_RECIPE_PATH}" ]]; then
+    echo "[INFO] ${SHARD_RECIPE_PATH} doesn't exist, so there is nothing to run"
+    exit 0
+fi
+
+# Write the output of every shard to the same directory,
+# for 'merge_recipe_output' to merge
+mkdir -p "${SHARDS_OUTPUT_DIR}"
+cmew-esmvaltool-env esmvaltool run "${SHARD_RECIPE_PATH}" \
+    --output_dir="${SHARDS_OUTPUT_DIR}"
@@ -0,0 +1,188 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+import sys
+from cdds_dirs import look_up_cdds_dirs
+from profiling import profile_entry_point
+from raw_data import DEFAULT_WORKERS, save_raw_data
+from standardisation_cache import (
+    cache_standardised_data,
+    reuse_standardised_data,
+)
+
+# The exit status of ``reuse_standardised_data`` when the data isn't cached,
+# distinct from the status 1 of an error
+CACHE_MISS_STATUS = 3
+
+
+def parse_args_for_standardisation_cache(arguments, description):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_reuse_standardised_data` and
+    :func:`main_for_cache_standardised_data`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    description : str
+        The description of the command.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--request_path",
+        help="The full path to the CDDS request configuration file.",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        help="The full path to the cache of standardised data.",
+    )
+    parser.add_argument(
+        "--cdds_version",
+        help="The version of CDDS used to standardise the data.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_reuse_standardised_data(arguments=None):
+    """
+    Link previously standardised data for a CDDS request.
+
+    Exits with status 0 if the data was linked, or
+    :data:`CACHE_MISS_STATUS` if it wasn't found, in which case the data
+    must be standardised. Any other status is an error.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_standardisation_cache(
+        arguments, "Link previously standardised data for a CDDS request."
+    )
+
+    # Run the code.
+    print(f"request_path: {args.request_path}")
+    print(f"cache_dir: {args.cache_dir}")
+    print(f"cdds_version: {args.cdds_version}")
+    reused = reuse_standardised_data(
+        args.request_path,
+        args.cache_dir,
+        args.cdds_version,
+    )
+    sys.exit(0 if reused else CACHE_MISS_STATUS)
+
+
+@profile_entry_point
+def main_for_cache_standardised_data(arguments=None):
+    """
+    Store the standardised data for a CDDS request in the cache.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_standardisation_cache(
+        arguments, "Store the standardised data for a CDDS request."
+    )
+
+    # Run the code.
+    print(f"request_path: {args.request_path}")
+    print(f"cache_dir: {args.cache_dir}")
+    print(f"cdds_version: {args.cdds_version}")
+    cache_standardised_data(
+        args.request_path,
+        args.cache_dir,
+        args.cdds_version,
+    )
+
+
+def parse_args_for_save_raw_data(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_save_raw_data`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Save the raw data extracted for a stream of a model run.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--cdds_dirs_path",
+        help=(
+            "The full path to the index of the directories CDDS uses "
+            "for the model run."
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        help="The name of the stream.",
+    )
+    parser.add_argument(
+        "--chunk",
+        help="The first year of the chunk of years.",
+    )
+    parser.add_argument(
+        "--target_dir",
+        help="The full path to the raw data directory for the stream.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="The number of threads copying files at once.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_save_raw_data(arguments=None):
+    """
+    Save the raw data extracted for a stream of a model run.
+
+    Exits with status 1 if there is no request for the stream and chunk.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_save_raw_data(arguments)
+
+    # Run the code.
+    print(f"cdds_dirs_path: {args.cdds_dirs_path}")
+    print(f"stream: {args.stream}")
+    print(f"chunk: {args.chunk}")
+    print(f"target_dir: {args.target_dir}")
+    print(f"workers: {args.workers}")
+    cdds_dirs = look_up_cdds_dirs(args.cdds_dirs_path, args.stream, args.chunk)
+    if cdds_dirs is None:
+        print(
+            f"No request for stream {args.stream} and years from "
+            f"{args.chunk} in {args.cdds_dirs_path}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    save_raw_data(cdds_dirs["input_dir"], args.target_dir, args.workers)
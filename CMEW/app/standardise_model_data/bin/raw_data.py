@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Save the raw model data extracted by CDDS, so it can be used again.
+
+Each file is hard linked, or failing that reflinked, into the raw data
+directory when both are on the same file system, so no data is copied.
+Otherwise the files are copied by several threads at once, in batches
+of about the same total size. Files already in the raw data directory
+with the same size and modification time are skipped, so a save which
+was interrupted carries on where it stopped.
+"""
+import fcntl
+import heapq
+import logging
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The ioctl request which shares the data of a file with another (Linux)
+FICLONE = 0x40049409
+
+# The default number of threads copying files at once
+DEFAULT_WORKERS = 4
+
+
+def is_saved(source, target):
+    """Return whether ``target`` has the same size and mtime as ``source``."""
+    try:
+        target_stat = target.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    return (
+        target_stat.st_size == source_stat.st_size
+        and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+    )
+
+
+def plan_save(source_dir, target_dir):
+    """
+    List the files which still need saving, with their sizes.
+
+    Parameters
+    ----------
+    source_dir: Path
+        The directory of extracted data.
+    target_dir: Path
+        The raw data directory.
+
+    Returns
+    -------
+    list of tuples
+        The path relative to ``source_dir`` and the size in bytes of each
+        file which is missing from ``target_dir``, or differs in size or
+        modification time.
+    """
+    pending = []
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            source = Path(root) / name
+            relative_path = source.relative_to(source_dir)
+            if is_saved(source, target_dir / relative_path):
+                continue
+            if (target_dir / relative_path).exists():
+                logger.info("Replacing %s, which differs", relative_path)
+            pending.append((relative_path, source.stat().st_size))
+    return pending
+
+
+def balance_batches(files, number_of_batches):
+    """
+    Split files into batches of about the same total size.
+
+    Each file, largest first, goes into the batch with the smallest total.
+
+    Parameters
+    ----------
+    files: list of tuples
+        The path and size in bytes of each file.
+    number_of_batches: int
+        The maximum number of batches.
+
+    Returns
+    -------
+    list of lists
+        The paths in each batch; there are no empty batches.
+    """
+    number_of_batches = max(1, min(number_of_batches, len(files)))
+    heap = [(0, index) for index in range(number_of_batches)]
+    batches = [[] for _ in range(number_of_batches)]
+    for path, size in sorted(files, key=lambda item: item[1], reverse=True):
+        total, index = heapq.heappop(heap)
+        batches[index].append(path)
+        heapq.heappush(heap, (total + size, index))
+    return [batch for batch in batches if batch]
+
+
+def reflink(source, target):
+    """
+    Create ``target`` sharing the data of ``source``, without copying it.
+
+    Only some file systems (e.g. Btrfs and XFS) support this.
+
+    Raises
+    ------
+    OSError
+        If the file system doesn't support it.
+    """
+    with open(source, "rb") as source_handle:
+        with open(target, "wb") as target_handle:
+            try:
+                fcntl.ioctl(
+                    target_handle.fileno(), FICLONE, source_handle.fileno()
+                )
+            except OSError:
+                os.unlink(target)
+                raise
+    shutil.copystat(source, target)
+
+
+def link_file(source, target):
+    """
+    Hard link or reflink ``source`` to ``target``.
+
+    Returns
+    -------
+    bool
+        Whether ``source`` was linked; if not, it must be copied.
+    """
+    for link in (os.link, reflink):
+        try:
+            link(source, target)
+            return True
+        except OSError:
+            continue
+    return False
+
+
+def save_file(source, target, copy=False):
+    """
+    Save ``source`` to ``target``, replacing any file already there.
+
+    The file is saved under a temporary name which is then renamed,
+    so an interrupted save never leaves part of a file.
+
+    Parameters
+    ----------
+    source: Path
+        The extracted file.
+    target: Path
+        The saved file.
+    copy: bool
+        Whether to copy the file without trying to link it.
+
+    Returns
+    -------
+    bool
+        Whether the file was linked rather than copied.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    partial = target.parent / f".{target.name}.{os.getpid()}"
+    if partial.exists():
+        partial.unlink()
+    linked = not copy and link_file(source, partial)
+    if not linked:
+        shutil.copy2(source, partial)
+    os.replace(partial, target)
+    return linked
+
+
+def copy_batch(source_dir, target_dir, batch):
+    """Copy a batch of files, given by their paths relative to source_dir."""
+    for relative_path in batch:
+        save_file(source_dir / relative_path, target_dir / relative_path, True)
+    return len(batch)
+
+
+def save_raw_data(source_dir, target_dir, workers=DEFAULT_WORKERS):
+    """
+    Save the extracted raw data of a stream.
+
+    Parameters
+    ----------
+    source_dir: str
+        The directory CDDS extracted the stream to.
+    target_dir: str
+        The raw data directory for the stream.
+    workers: int
+        The number of threads copying files at once, if they can't be
+        linked.
+
+    Returns
+    -------
+    int
+        The number of files saved.
+    """
+    source_dir = Path(source_dir)
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    pending = plan_save(source_dir, target_dir)
+    logger.info(
+        "Saving %s files (%s bytes) from %s to %s",
+        len(pending),
+        sum(size for _, size in pending),
+        source_dir,
+        target_dir,
+    )
+    if not pending:
+        return 0
+
+    # Linking only works within a file system, so if the first file can't
+    # be linked, copy the rest
+    first_path = pending[0][0]
+    same_file_system = source_dir.stat().st_dev == target_dir.stat().st_dev
+    if same_file_system and save_file(
+        source_dir / first_path, target_dir / first_path
+    ):
+        for relative_path, _ in pending[1:]:
+            save_file(source_dir / relative_path, target_dir / relative_path)
+        logger.info("Linked %s files", len(pending))
+        return len(pending)
+
+    remaining = pending[1:] if same_file_system else pending
+    batches = balance_batches(remaining, workers)
+    with ThreadPoolExecutor(max_workers=len(batches) or 1) as executor:
+        copied = sum(
+            executor.map(
+                lambda batch: copy_batch(source_dir, target_dir, batch),
+                batches,
+            )
+        )
+    saved = copied + len(pending) - len(remaining)
+    logger.info("Copied %s files using %s threads", saved, len(batches))
+    return saved
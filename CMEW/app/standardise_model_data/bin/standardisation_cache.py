@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Reuse standardised data when the inputs to CDDS have not changed.
+
+The standardised output of a CDDS request is determined by the request,
+the variables it lists and the version of CDDS. These are hashed, and the
+output of ``cdds_convert`` is stored in the cache directory under the hash,
+together with a record of the inputs. A later request with the same hash,
+from a rerun of this workflow or another workflow sharing the cache, links
+the stored files into its own data directory instead of running
+``cdds_convert`` again.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from cdds_dirs import find_data_dir, read_request
+from yaml_io import load_yaml, write_yaml
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The name of the file recording the inputs to CDDS with the outputs
+RECORD_FILENAME = "standardisation.yml"
+
+# Options which locate files in the workflow, or control how CDDS runs,
+# but do not change the standardised data
+EXCLUDED_OPTIONS = {
+    ("common", "package"),
+    ("common", "root_data_dir"),
+    ("common", "root_proc_dir"),
+    ("conversion", "cylc_args"),
+    ("conversion", "skip_extract"),
+    ("data", "variable_list_file"),
+}
+
+
+def describe_inputs(request, cdds_version):
+    """
+    Collect the inputs to CDDS which determine the standardised data.
+
+    Parameters
+    ----------
+    request: dict
+        The options in each section of the request.
+    cdds_version: str
+        The version of CDDS.
+
+    Returns
+    -------
+    dict
+        The request without the options in ``EXCLUDED_OPTIONS``,
+        the sorted variables from the variables file and the CDDS version.
+    """
+    with open(request["data"]["variable_list_file"], "r") as file_handle:
+        variables = sorted(file_handle.read().split())
+
+    return {
+        "cdds_version": cdds_version,
+        "request": {
+            section: {
+                option: value
+                for option, value in options.items()
+                if (section, option) not in EXCLUDED_OPTIONS
+            }
+            for section, options in request.items()
+        },
+        "variables": variables,
+    }
+
+
+def hash_inputs(inputs):
+    """
+    Return the SHA-256 hash of the inputs to CDDS.
+
+    Parameters
+    ----------
+    inputs: dict
+        The inputs, as returned by :func:`describe_inputs`.
+
+    Returns
+    -------
+    str
+        The hexadecimal digest.
+    """
+    canonical = json.dumps(inputs, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def link_or_copy(source, target):
+    """
+    Hard link ``source`` to ``target``, or copy it if that isn't possible.
+
+    Hard links are only possible within a file system.
+    """
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def iter_files(directory):
+    """Lazily list the paths of the files in a directory, relative to it."""
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            yield (Path(root) / name).relative_to(directory)
+
+
+def reuse_standardised_data(request_path, cache_dir, cdds_version):
+    """
+    Link previously standardised data for a request, if there is any.
+
+    Parameters
+    ----------
+    request_path: str
+        The full path to the request configuration file.
+    cache_dir: str
+        The full path to the cache directory.
+    cdds_version: str
+        The version of CDDS.
+
+    Returns
+    -------
+    bool
+        Whether standardised data with the same inputs was found and linked
+        into the output directory of the request.
+    """
+    request = read_request(request_path)
+    digest = hash_inputs(describe_inputs(request, cdds_version))
+    entry_dir = Path(cache_dir) / digest
+    if not (entry_dir / RECORD_FILENAME).is_file():
+        logger.info("No standardised data in the cache for %s", digest)
+        return False
+
+    output_dir = find_data_dir(request) / "output"
+    record = load_yaml(entry_dir / RECORD_FILENAME)
+    for relative_path in record["files"]:
+        target = output_dir / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.is_symlink() or target.exists():
+            target.unlink()
+        target.symlink_to(entry_dir / "output" / relative_path)
+
+    write_yaml(record, output_dir.parent / RECORD_FILENAME)
+    logger.info(
+        "Linked %s files standardised with the same inputs from %s",
+        len(record["files"]),
+        entry_dir,
+    )
+    return True
+
+
+def cache_standardised_data(request_path, cache_dir, cdds_version):
+    """
+    Store the standardised data for a request in the cache.
+
+    The files are hard linked into the cache where possible, so they stay in
+    the cache when ``housekeeping`` removes the CDDS data directory. The
+    record of the inputs is written alongside the data in both the cache and
+    the output directory.
+
+    Parameters
+    ----------
+    request_path: str
+        The full path to the request configuration file.
+    cache_dir: str
+        The full path to the cache directory.
+    cdds_version: str
+        The version of CDDS.
+
+    Returns
+    -------
+    Path
+        The directory containing the cached data.
+    """
+    request = read_request(request_path)
+    inputs = describe_inputs(request, cdds_version)
+    digest = hash_inputs(inputs)
+    data_dir = find_data_dir(request)
+    output_dir = data_dir / "output"
+    files = [str(path) for path in iter_files(output_dir)]
+    record = {"hash": digest, "inputs": inputs, "files": files}
+
+    # Fill a temporary directory, so other workflows never see part of it
+    entry_dir = Path(cache_dir) / digest
+    partial_dir = Path(cache_dir) / f".{digest}.{os.getpid()}"
+    for relative_path in files:
+        target = partial_dir / "output" / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        link_or_copy(output_dir / relative_path, target)
+    partial_dir.mkdir(parents=True, exist_ok=True)
+    write_yaml(record, partial_dir / RECORD_FILENAME)
+
+    try:
+        os.rename(partial_dir, entry_dir)
+    except OSError:
+        # Another workflow cached the same data first
+        shutil.rmtree(partial_dir)
+        if not (entry_dir / RECORD_FILENAME).is_file():
+            raise
+
+    write_yaml(record, data_dir / RECORD_FILENAME)
+    logger.info("Cached %s standardised files in %s", len(files), entry_dir)
+    return entry_dir
@@ -0,0 +1,48 @@
+#!/bin/bash
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+# Standardise one chunk of years of one stream of a model run with CDDS.
+BASH_XTRACEFD=1
+set -xeuo pipefail
+
+# configure_standardise only writes a request for streams with variables
+if [[ ! -f "${STREAM_REQUEST_PATH}" ]]; then
+    echo "[INFO] No variables to standardise from stream ${CYLC_TASK_PARAM_stream}"
+    exit 0
+fi
+
+# Link the data instead, if it has been standardised with the same inputs
+cache_args=(
+    --request_path "${STREAM_REQUEST_PATH}"
+    --cache_dir "${STANDARDISE_CACHE_DIR}"
+    --cdds_version "${CDDS_VERSION}"
+)
+# Exit status 3 means the data isn't cached; any other failure is an error
+CACHE_MISS_STATUS=3
+reuse_status=0
+cmew-esmvaltool-env reuse_standardised_data "${cache_args[@]}" \
+    || reuse_status=$?
+if [[ "${reuse_status}" -eq 0 ]]; then
+    exit 0
+elif [[ "${reuse_status}" -ne "${CACHE_MISS_STATUS}" ]]; then
+    echo "[ERROR] reuse_standardised_data failed with status ${reuse_status}"
+    exit "${reuse_status}"
+fi
+
+cmew-standardise-env cdds_convert "${STREAM_REQUEST_PATH}"
+
+# If RAW_DATA_DIR is configured, save the raw data extracted for this chunk of
+# years to ${RAW_DATA_DIR}/${dataset}/${stream}. Chunks of years of the same
+# stream extract different files, so they all save to the same directory.
+# Files already saved, with the same size and modification time, are skipped.
+if [[ "${RAW_DATA_DIR_MODE}" == "save_new" ]]; then
+    cmew-esmvaltool-env save_raw_data \
+        --cdds_dirs_path "${CDDS_DIRS_PATH}" \
+        --stream "${CYLC_TASK_PARAM_stream}" \
+        --chunk "${CHUNK}" \
+        --target_dir "${RAW_DATA_DIR_SUITE}/${CYLC_TASK_PARAM_stream}"
+else
+    echo "[INFO] RAW_DATA_DIR is not set, skipping raw data copy"
+fi
+
+cmew-esmvaltool-env cache_standardised_data "${cache_args[@]}"
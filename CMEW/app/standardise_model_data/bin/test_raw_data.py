@@ -0,0 +1,87 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Unit tests for raw_data.py
+"""
+import os
+from pathlib import Path
+import pytest
+import raw_data
+from raw_data import (
+    balance_batches,
+    plan_save,
+    save_raw_data,
+)
+
+INPUT_DIR = (
+    "GCModelDev/ESMVal/HadGEM3-GC5E-LL/amip-u-cw673/r1i1p1f1/"
+    "round-1-apm-1993/input/u-cw673/apm"
+)
+FILE_NAMES = ["cw673a.pm1993jan.pp", "cw673a.pm1993feb.pp"]
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """A CDDS data directory with raw data extracted for one stream."""
+    source_dir = tmp_path / "cdds_data" / INPUT_DIR
+    source_dir.mkdir(parents=True)
+    for size, name in enumerate(FILE_NAMES, 1):
+        (source_dir / name).write_bytes(b"x" * size)
+    return source_dir
+
+
+def test_balance_batches():
+    files = [("a", 10), ("b", 7), ("c", 5), ("d", 3), ("e", 2)]
+    actual = balance_batches(files, 2)
+    expected = [["a", "d"], ["b", "c", "e"]]
+    assert actual == expected
+
+
+def test_balance_batches_more_workers_than_files():
+    actual = balance_batches([("a", 1)], 4)
+    assert actual == [["a"]]
+
+
+def test_save_raw_data_links(tmp_path, source_dir):
+    target_dir = tmp_path / "raw_data" / "u-cw673" / "apm"
+    saved = save_raw_data(source_dir, target_dir)
+
+    assert saved == len(FILE_NAMES)
+    for name in FILE_NAMES:
+        assert os.path.samefile(source_dir / name, target_dir / name)
+
+
+def test_save_raw_data_copies(tmp_path, source_dir, monkeypatch):
+    # As if the raw data directory is on another file system
+    monkeypatch.setattr(raw_data, "link_file", lambda *args: False)
+    target_dir = tmp_path / "raw_data" / "u-cw673" / "apm"
+    saved = save_raw_data(source_dir, target_dir, workers=2)
+
+    assert saved == len(FILE_NAMES)
+    for name in FILE_NAMES:
+        assert not os.path.samefile(source_dir / name, target_dir / name)
+        assert (target_dir / name).read_bytes() == (
+            source_dir / name
+        ).read_bytes()
+        assert (target_dir / name).stat().st_mtime_ns == (
+            source_dir / name
+        ).stat().st_mtime_ns
+
+
+def test_save_raw_data_resumes(tmp_path, source_dir):
+    target_dir = tmp_path / "raw_data" / "u-cw673" / "apm"
+    save_raw_data(source_dir, target_dir)
+    (target_dir / FILE_NAMES[1]).unlink()
+
+    assert plan_save(source_dir, target_dir) == [(Path(FILE_NAMES[1]), 2)]
+    assert save_raw_data(source_dir, target_dir) == 1
+    assert save_raw_data(source_dir, target_dir) == 0
+
+
+def test_save_raw_data_replaces_different_file(tmp_path, source_dir):
+    target_dir = tmp_path / "raw_data" / "u-cw673" / "apm"
+    target_dir.mkdir(parents=True)
+    (target_dir / FILE_NAMES[0]).write_bytes(b"partial file")
+
+    assert save_raw_data(source_dir, target_dir) == len(FILE_NAMES)
+    assert (target_dir / FILE_NAMES[0]).read_bytes() == b"x"
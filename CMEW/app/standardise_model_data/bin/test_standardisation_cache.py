@@ -0,0 +1,156 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Unit tests for standardisation_cache.py
+
+Test data files:
+/app/unittest/kgo/request_u-cw673.cfg
+    basis of the requests in every test
+"""
+from pathlib import Path
+import configparser
+import pytest
+from command_line import CACHE_MISS_STATUS, main_for_reuse_standardised_data
+from standardisation_cache import (
+    RECORD_FILENAME,
+    cache_standardised_data,
+    find_data_dir,
+    read_request,
+    reuse_standardised_data,
+)
+
+CDDS_VERSION = "3.3.0"
+OUTPUT_FILE = "apm_concat/tas_Amon_HadGEM3-GC5E-LL_amip_r1i1p1f1_gn.nc"
+
+
+def write_request(workflow_dir, overrides=None):
+    """Write a request, like configure_standardise, to ``workflow_dir``."""
+    config = configparser.ConfigParser()
+    config.read(
+        Path(__file__).parent.parent.parent
+        / "unittest"
+        / "kgo"
+        / "request_u-cw673.cfg"
+    )
+    variables_path = workflow_dir / "variables_u-cw673_apm.txt"
+    variables_path.write_text("Amon/tas:apm\nAmon/rsut:apm\n")
+    config["common"]["root_data_dir"] = str(workflow_dir / "cdds_data")
+    config["common"]["root_proc_dir"] = str(workflow_dir / "proc")
+    config["common"]["package"] = "round-1-apm-1993"
+    config["data"]["variable_list_file"] = str(variables_path)
+    for (section, option), value in (overrides or {}).items():
+        config[section][option] = value
+
+    request_path = workflow_dir / "request_u-cw673_apm_1993.cfg"
+    with open(request_path, "w") as file_handle:
+        config.write(file_handle)
+    return request_path
+
+
+@pytest.fixture
+def cached_workflow(tmp_path):
+    """A workflow which has standardised its data and cached it."""
+    workflow_dir = tmp_path / "first"
+    workflow_dir.mkdir()
+    request_path = write_request(workflow_dir)
+    output_dir = find_data_dir(read_request(request_path)) / "output"
+    (output_dir / OUTPUT_FILE).parent.mkdir(parents=True)
+    (output_dir / OUTPUT_FILE).write_text("standardised data")
+
+    cache_dir = tmp_path / "cache"
+    cache_standardised_data(str(request_path), str(cache_dir), CDDS_VERSION)
+    return cache_dir
+
+
+def test_reuse_standardised_data(tmp_path, cached_workflow):
+    # A different workflow, with different paths, making the same request
+    workflow_dir = tmp_path / "second"
+    workflow_dir.mkdir()
+    request_path = write_request(
+        workflow_dir, {("conversion", "skip_extract"): "False"}
+    )
+
+    reused = reuse_standardised_data(
+        str(request_path), str(cached_workflow), CDDS_VERSION
+    )
+
+    data_dir = find_data_dir(read_request(request_path))
+    linked = data_dir / "output" / OUTPUT_FILE
+    assert reused
+    assert linked.is_symlink()
+    assert linked.read_text() == "standardised data"
+    assert (data_dir / RECORD_FILENAME).is_file()
+
+
+@pytest.mark.parametrize(
+    "overrides, cdds_version",
+    [
+        ({("data", "end_date"): "1995-01-01T00:00:00"}, CDDS_VERSION),
+        ({("metadata", "calendar"): "360_day"}, CDDS_VERSION),
+        ({}, "3.4.0"),
+    ],
+)
+def test_reuse_standardised_data_changed_inputs(
+    tmp_path, cached_workflow, overrides, cdds_version
+):
+    workflow_dir = tmp_path / "second"
+    workflow_dir.mkdir()
+    request_path = write_request(workflow_dir, overrides)
+
+    reused = reuse_standardised_data(
+        str(request_path), str(cached_workflow), cdds_version
+    )
+
+    assert not reused
+    assert not find_data_dir(read_request(request_path)).exists()
+
+
+def test_cached_data_survives_restructure(tmp_path, cached_workflow):
+    # restructure_dirs moves the standardised files out of the data dir
+    first_output = next((tmp_path / "first" / "cdds_data").rglob("*.nc"))
+    first_output.unlink()
+
+    workflow_dir = tmp_path / "second"
+    workflow_dir.mkdir()
+    request_path = write_request(workflow_dir)
+    assert reuse_standardised_data(
+        str(request_path), str(cached_workflow), CDDS_VERSION
+    )
+    linked = find_data_dir(read_request(request_path)) / "output" / OUTPUT_FILE
+    assert linked.read_text() == "standardised data"
+
+
+def main_exit_status(request_path, cache_dir):
+    """Return the exit status of ``reuse_standardised_data``."""
+    with pytest.raises(SystemExit) as exit_info:
+        main_for_reuse_standardised_data(
+            [
+                "--request_path",
+                str(request_path),
+                "--cache_dir",
+                str(cache_dir),
+                "--cdds_version",
+                CDDS_VERSION,
+            ]
+        )
+    return exit_info.value.code
+
+
+def test_main_exit_status(tmp_path, cached_workflow):
+    workflow_dir = tmp_path / "second"
+    workflow_dir.mkdir()
+    request_path = write_request(workflow_dir)
+    assert main_exit_status(request_path, cached_workflow) == 0
+
+    request_path = write_request(
+        workflow_dir, {("metadata", "calendar"): "360_day"}
+    )
+    assert main_exit_status(request_path, cached_workflow) == CACHE_MISS_STATUS
+
+
+def test_main_error_is_not_a_cache_miss(tmp_path, cached_workflow):
+    # Errors must fail the task, rather than standardise the data again
+    request_path = tmp_path / "empty.cfg"
+    request_path.write_text("")
+    with pytest.raises(KeyError):
+        main_exit_status(request_path, cached_workflow)
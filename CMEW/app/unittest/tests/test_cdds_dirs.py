@@ -0,0 +1,72 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/cdds_dirs.py"""
+from pathlib import Path
+import configparser
+import importlib.util
+
+# --- Section to import cdds_dirs.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+cdds_dirs_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "cdds_dirs.py"
+)
+
+spec = importlib.util.spec_from_file_location("cdds_dirs", cdds_dirs_path)
+cdds_dirs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(cdds_dirs)
+
+# --- End of import section ---
+
+KGO_REQUEST = Path(__file__).parent.parent / "kgo" / "request_u-cw673.cfg"
+
+
+def write_request(tmp_path, stream, chunk):
+    """Write a request for a stream and chunk, like configure_standardise."""
+    config = configparser.ConfigParser()
+    config.read(KGO_REQUEST)
+    config["common"]["root_data_dir"] = str(tmp_path / "cdds_data")
+    config["common"]["package"] = f"round-1-{stream}-{chunk}"
+    request_path = tmp_path / f"request_u-cw673_{stream}_{chunk}.cfg"
+    with open(request_path, "w") as file_handle:
+        config.write(file_handle)
+    return request_path
+
+
+def test_find_data_dir():
+    request = cdds_dirs.read_request(KGO_REQUEST)
+    actual = cdds_dirs.find_data_dir(request)
+    expected = Path(
+        "/path/to/data/dir/GCModelDev/ESMVal/HadGEM3-GC5E-LL/amip/r1i1p1f1/"
+        "round-1"
+    )
+    assert actual == expected
+
+
+def test_record_and_look_up_cdds_dirs(tmp_path):
+    request_path = write_request(tmp_path, "apm", "1993")
+    index_path = tmp_path / "cdds_dirs_u-cw673.yml"
+    cdds_dirs.record_cdds_dirs(
+        index_path,
+        tmp_path / "request_u-cw673.cfg",
+        ["apm", "inm"],
+        ["1993", "1995"],
+    )
+
+    data_dir = (
+        tmp_path
+        / "cdds_data"
+        / "GCModelDev/ESMVal/HadGEM3-GC5E-LL/amip/r1i1p1f1/round-1-apm-1993"
+    )
+    expected = {
+        "request_path": str(request_path),
+        "data_dir": str(data_dir),
+        "input_dir": str(data_dir / "input" / "u-cw673" / "apm"),
+        "output_dir": str(data_dir / "output"),
+    }
+    assert cdds_dirs.look_up_cdds_dirs(index_path, "apm", "1993") == expected
+    assert cdds_dirs.look_up_cdds_dirs(index_path, "inm", "1993") is None
+    assert cdds_dirs.look_up_cdds_dirs(index_path, "apm", "1995") is None
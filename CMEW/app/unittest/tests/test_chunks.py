@@ -0,0 +1,44 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/chunks.py"""
+from pathlib import Path
+import importlib.util
+import pytest
+
+# --- Section to import chunks.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+chunks_path = (
+    Path(__file__).parent.parent.parent.parent / "lib" / "python" / "chunks.py"
+)
+
+spec = importlib.util.spec_from_file_location("chunks", chunks_path)
+chunks = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(chunks)
+
+# --- End of import section ---
+
+
+@pytest.mark.parametrize(
+    "chunk_years, expected",
+    [
+        (0, [(1993, 2002)]),
+        ("", [(1993, 2002)]),
+        (None, [(1993, 2002)]),
+        (5, [(1993, 1997), (1998, 2002)]),
+        ("4", [(1993, 1996), (1997, 2000), (2001, 2002)]),
+        (20, [(1993, 2002)]),
+    ],
+)
+def test_iter_chunks(chunk_years, expected):
+    actual = list(chunks.iter_chunks(1993, 10, chunk_years))
+    assert actual == expected
+
+
+def test_iter_chunks_negative():
+    with pytest.raises(ValueError):
+        list(chunks.iter_chunks(1993, 10, -1))
+
+
+def test_list_chunks():
+    assert chunks.list_chunks("1993", "10", "4") == "1993, 1997, 2001"
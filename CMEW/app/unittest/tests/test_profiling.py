@@ -0,0 +1,62 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/profiling.py"""
+from pathlib import Path
+import importlib.util
+import pstats
+import pytest
+
+# --- Section to import profiling.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+profiling_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "profiling.py"
+)
+
+spec = importlib.util.spec_from_file_location("profiling", profiling_path)
+profiling = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(profiling)
+
+# --- End of import section ---
+
+
+@profiling.profile_entry_point
+def main_for_test(size):
+    """An entry point which allocates some memory."""
+    return len([str(number) for number in range(size)])
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("", set()), ("cpu", {"cpu"}), (" CPU, memory ", {"cpu", "memory"})],
+)
+def test_profile_kinds(value, expected):
+    assert profiling.profile_kinds(value) == expected
+
+
+def test_profile_kinds_unknown():
+    with pytest.raises(ValueError, match="Unknown CMEW_PROFILE"):
+        profiling.profile_kinds("cpu,disk")
+
+
+def test_profile_entry_point_disabled(tmp_path, monkeypatch):
+    monkeypatch.delenv("CMEW_PROFILE", raising=False)
+    monkeypatch.setenv("CYLC_TASK_LOG_DIR", str(tmp_path))
+    assert main_for_test(10) == 10
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_entry_point(tmp_path, monkeypatch):
+    monkeypatch.setenv("CMEW_PROFILE", "cpu,memory")
+    monkeypatch.setenv("CYLC_TASK_LOG_DIR", str(tmp_path))
+    assert main_for_test(1000) == 1000
+
+    stats = pstats.Stats(str(tmp_path / "main_for_test.prof"))
+    assert any(function[2] == "main_for_test" for function in stats.stats)
+    assert "main_for_test" in (tmp_path / "main_for_test.prof.txt").read_text()
+    report = (tmp_path / "main_for_test.tracemalloc.txt").read_text()
+    assert report.startswith("Peak memory traced:")
+    assert (tmp_path / "main_for_test.tracemalloc").is_file()
@@ -0,0 +1,65 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/resource_sampler.py"""
+from pathlib import Path
+import csv
+import importlib.util
+import os
+import subprocess
+import sys
+
+# --- Section to import resource_sampler.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+resource_sampler_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "resource_sampler.py"
+)
+
+spec = importlib.util.spec_from_file_location(
+    "resource_sampler", resource_sampler_path
+)
+resource_sampler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(resource_sampler)
+
+# --- End of import section ---
+
+
+def test_sample_tree():
+    child = subprocess.Popen(["sleep", "5"])
+    try:
+        sample = resource_sampler.sample_tree(os.getpid())
+        tree = resource_sampler.find_tree(os.getpid())
+        excluded = resource_sampler.find_tree(os.getpid(), {child.pid})
+    finally:
+        child.kill()
+        child.wait()
+
+    assert child.pid in tree
+    assert child.pid not in excluded
+    assert sample["processes"] == len(tree)
+    assert sample["rss_kb"] > 0
+    assert sample["open_files"] > 0
+
+
+def test_sample_tree_no_process():
+    child = subprocess.Popen(["true"])
+    child.wait()
+    assert resource_sampler.sample_tree(child.pid) is None
+
+
+def test_run_sampler(tmp_path):
+    output_path = tmp_path / "job.cdds_convert.12345.samples"
+    child = subprocess.Popen(
+        [sys.executable, "-c", "import time; time.sleep(0.5)"]
+    )
+    written = resource_sampler.run_sampler(child.pid, 0.1, output_path)
+    child.wait()
+
+    with open(output_path, newline="") as file_handle:
+        rows = list(csv.DictReader(file_handle))
+    assert written == len(rows) > 1
+    assert list(rows[0]) == list(resource_sampler.SAMPLE_FIELDS)
+    assert rows[0]["processes"] == "1"
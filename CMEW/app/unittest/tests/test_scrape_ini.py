@@ -2,6 +2,7 @@
 # The LICENSE.md file contains full licensing details.
 """Unit tests for CMEW/lib/python/scrape_ini.py"""
 from pathlib import Path
+import os
 import importlib.util
 import pytest
 
@@ -39,3 +40,110 @@ def test_ref_dataset_extracted(path_to_mock_ini):
     expected = "line_16"
     actual = scrape_ini.find_ref(path_to_mock_ini)
     assert actual == expected
+
+
+def test_retrieve_value_only_searches_indicated_section(path_to_mock_ini):
+    # The "experiment" section has no label, so the value must not be taken
+    # from a later section
+    actual = scrape_ini.retrieve_value(
+        path_to_mock_ini, "experiment", "not_a_suite_id"
+    )
+    assert actual is None
+
+
+def test_parse_sections_joins_continuation_lines():
+    content = [
+        "[namelist:model_runs(1)]\n",
+        'suite_id="u-ab123"\n',
+        "help=first line\n",
+        "    =second line\n",
+    ]
+    expected = {
+        "": {},
+        "namelist:model_runs(1)": {
+            "suite_id": "u-ab123",
+            "help": "first line\nsecond line",
+        },
+    }
+    actual = scrape_ini.parse_sections(content)
+    assert actual == expected
+
+
+def test_read_sections_reparses_modified_file(tmp_path):
+    ini_path = tmp_path / "rose-suite.conf"
+    ini_path.write_text('[namelist:model_runs(reference)]\nsuite_id="u-1"\n')
+    assert scrape_ini.find_ref(str(ini_path)) == "u-1"
+
+    # Rewrite the file with a later modification time
+    ini_path.write_text('[namelist:model_runs(reference)]\nsuite_id="u-2"\n')
+    stat = ini_path.stat()
+    os.utime(ini_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert scrape_ini.find_ref(str(ini_path)) == "u-2"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("r1i1p1f1", ["r1i1p1f1"]),
+        ("r{1..3}i1p1f1", ["r1i1p1f1", "r2i1p1f1", "r3i1p1f1"]),
+        ("u-ab{009..011}", ["u-ab009", "u-ab010", "u-ab011"]),
+        (["u-aa001", "u-ab{1..2}"], ["u-aa001", "u-ab1", "u-ab2"]),
+    ],
+)
+def test_expand_values(value, expected):
+    actual = scrape_ini.expand_values(value)
+    assert actual == expected
+
+
+def test_expand_ensemble():
+    facets = {
+        "model_id": "HadGEM3-GC31-LL",
+        "suite_id": ["u-aa001", "u-aa002"],
+        "variant_label": "r{1..2}i1p1f1",
+    }
+    expected = [
+        {
+            "model_id": "HadGEM3-GC31-LL",
+            "suite_id": "u-aa001",
+            "variant_label": "r1i1p1f1",
+        },
+        {
+            "model_id": "HadGEM3-GC31-LL",
+            "suite_id": "u-aa002",
+            "variant_label": "r2i1p1f1",
+        },
+    ]
+    actual = list(scrape_ini.expand_ensemble(facets))
+    assert actual == expected
+
+
+def test_expand_ensemble_mismatched_lengths():
+    facets = {"suite_id": "u-aa{1..3}", "variant_label": "r{1..2}i1p1f1"}
+    with pytest.raises(ValueError, match="variant_label"):
+        list(scrape_ini.expand_ensemble(facets))
+
+
+def test_list_datasets_expands_ensembles(tmp_path):
+    ini_path = tmp_path / "rose-suite.conf"
+    ini_path.write_text(
+        "[namelist:model_runs(reference)]\n"
+        'suite_id="u-bv526"\n'
+        "[namelist:model_runs(ppe)]\n"
+        'suite_id="u-ab{01..03}"\n'
+        "[namelist:model_runs(ic)]\n"
+        'suite_id="u-cc001","u-cc002"\n'
+        'variant_label="r1i1p1f1","r2i1p1f1"\n'
+    )
+    expected = "u-bv526, u-ab01, u-ab02, u-ab03, u-cc001, u-cc002"
+    actual = scrape_ini.list_datasets(str(ini_path))
+    assert actual == expected
+
+
+def test_list_datasets_duplicate_suite_id(tmp_path):
+    ini_path = tmp_path / "rose-suite.conf"
+    ini_path.write_text(
+        '[namelist:model_runs(1)]\nsuite_id="u-ab001"\n'
+        '[namelist:model_runs(2)]\nsuite_id="u-ab{001..002}"\n'
+    )
+    with pytest.raises(ValueError, match="u-ab001"):
+        scrape_ini.list_datasets(str(ini_path))
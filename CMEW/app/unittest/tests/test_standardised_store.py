@@ -0,0 +1,349 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/standardised_store.py"""
+from pathlib import Path
+import importlib.util
+import pytest
+
+# --- Section to import standardised_store.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+standardised_store_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "standardised_store.py"
+)
+
+spec = importlib.util.spec_from_file_location(
+    "standardised_store", standardised_store_path
+)
+standardised_store = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(standardised_store)
+
+# --- End of import section ---
+
+DATASET_DICT = {
+    "experiment_id": "amip-u-cw673",
+    "grid": "gn",
+    "model_id": "HadGEM3-GC5E-LL",
+    "suite_id": "u-cw673",
+    "variant_label": "r1i1p1f1",
+}
+
+
+def drs_path(mip, short_name, years, exp="amip-u-cw673"):
+    """Return the path of a file relative to the restructured directory."""
+    return (
+        Path("GCModelDev", "ESMVal", "MOHC", "HadGEM3-GC5E-LL", exp)
+        / "r1i1p1f1"
+        / mip
+        / short_name
+        / "gn"
+        / "v20260101"
+        / (
+            f"{short_name}_{mip}_HadGEM3-GC5E-LL_{exp}_r1i1p1f1_gn_"
+            f"{years[0]}01-{years[1]}12.nc"
+        )
+    )
+
+
+@pytest.fixture
+def store_dir(tmp_path):
+    """A store with tas for 1993-1997 and rsut for 1993-2002."""
+    store_dir = tmp_path / "store"
+    for mip, short_name, years in [
+        ("Amon", "tas", (1993, 1997)),
+        ("Amon", "rsut", (1993, 2002)),
+    ]:
+        path = store_dir / "u-cw673" / drs_path(mip, short_name, years)
+        path.parent.mkdir(parents=True)
+        path.write_text(short_name)
+
+    # Data for another experiment of the same suite is never reused
+    path = store_dir / "u-cw673" / drs_path("Amon", "tas", (1998, 2002), "x")
+    path.parent.mkdir(parents=True)
+    path.write_text("tas")
+    return store_dir
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        (
+            "tas_Amon_HadGEM3-GC5E-LL_amip_r1i1p1f1_gn_199301-200212.nc",
+            (1993, 2002),
+        ),
+        (
+            "tas_day_HadGEM3-GC5E-LL_amip_r1i1p1f1_gn_19930101-19931230.nc",
+            (1993, 1993),
+        ),
+        ("areacella_fx_HadGEM3-GC5E-LL_amip_r1i1p1f1_gn.nc", None),
+    ],
+)
+def test_parse_years(file_name, expected):
+    assert standardised_store.parse_years(file_name) == expected
+
+
+def test_index_store(store_dir):
+    index = standardised_store.index_store(str(store_dir), DATASET_DICT)
+    root_dir = str(store_dir / "u-cw673")
+    expected = {
+        "Amon/rsut": [
+            (
+                root_dir,
+                str(drs_path("Amon", "rsut", (1993, 2002))),
+                (1993, 2002),
+            )
+        ],
+        "Amon/tas": [
+            (
+                root_dir,
+                str(drs_path("Amon", "tas", (1993, 1997))),
+                (1993, 1997),
+            )
+        ],
+    }
+    assert index == expected
+
+
+def test_plan_chunk(store_dir):
+    index = standardised_store.index_store(str(store_dir), DATASET_DICT)
+    variables = ["Amon/tas:apm", "Amon/rsut:apm", "Amon/rlut:apm"]
+
+    # Only rsut is complete
+    actual = standardised_store.plan_chunk(index, variables, (1993, 2002))
+    assert actual == (["Amon/tas:apm", "Amon/rlut:apm"], (1993, 2002))
+
+    # Only the later years of tas are missing
+    actual = standardised_store.plan_chunk(index, variables[:2], (1993, 2002))
+    assert actual == (["Amon/tas:apm"], (1998, 2002))
+
+    # Nothing is missing
+    actual = standardised_store.plan_chunk(index, variables[:2], (1993, 1997))
+    assert actual == ([], None)
+
+
+def test_plan_chunk_straddling_file(tmp_path):
+    # tas is missing 1995 to 1999 and rsut 1993 to 1999, so 1993 to 1999 is
+    # standardised; the stored tas file for 1990 to 1994 can't be linked, so
+    # its years are standardised again
+    restructured_dir = tmp_path / "work"
+    for short_name, years in [("tas", (1990, 1994)), ("rsut", (1990, 1992))]:
+        path = restructured_dir / drs_path("Amon", short_name, years)
+        path.parent.mkdir(parents=True)
+        path.write_text(short_name)
+    index = standardised_store.index_drs_tree(
+        str(restructured_dir), DATASET_DICT
+    )
+    variables = ["Amon/tas:apm", "Amon/rsut:apm"]
+
+    actual = standardised_store.plan_chunk(index, variables, (1990, 1999))
+    assert actual == (variables, (1990, 1999))
+
+    standardised_store.link_stored_files(
+        index,
+        {
+            "Amon/tas": set(range(1990, 2000)),
+            "Amon/rsut": set(range(1990, 2000)),
+        },
+        str(restructured_dir),
+    )
+    assert not (
+        restructured_dir / drs_path("Amon", "tas", (1990, 1994))
+    ).exists()
+
+
+def test_widen_years():
+    index = {
+        "Amon/tas": [
+            ("a", "tas_1", (1990, 1994)),
+            ("a", "tas_2", (1995, 1999)),
+        ],
+        "Amon/rsut": [("a", "rsut_1", (1985, 1991))],
+        "Amon/rlut": [("a", "rlut_1", (1980, 1999))],
+    }
+    variables = ["Amon/tas:apm", "Amon/rsut:apm"]
+    # Covering all of tas_1 overlaps rsut_1, which also covers years before
+    # the chunk
+    actual = standardised_store.widen_years(
+        index, variables, (1993, 1994), (1990, 1999)
+    )
+    assert actual == ((1990, 1994), {("a", "rsut_1", (1985, 1991))})
+
+    actual = standardised_store.widen_years(
+        index, variables, (2000, 2002), (2000, 2009)
+    )
+    assert actual == ((2000, 2002), set())
+
+
+def test_plan_chunks_adjacent_chunks(tmp_path):
+    # The stored tas file covers years of both chunks, and pr isn't stored
+    restructured_dir = tmp_path / "work"
+    stored = restructured_dir / drs_path("Amon", "tas", (1995, 2000))
+    stored.parent.mkdir(parents=True)
+    stored.write_text("tas")
+    index = standardised_store.index_drs_tree(
+        str(restructured_dir), DATASET_DICT
+    )
+    variables = ["Amon/tas:apm", "Amon/pr:apm"]
+
+    actual = standardised_store.plan_chunks(
+        index, variables, [(1993, 1997), (1998, 2002)]
+    )
+
+    # Each chunk standardises its own years of both variables, once
+    assert actual == [(variables, (1993, 1997)), (variables, (1998, 2002))]
+    standardised_store.link_stored_files(
+        index,
+        {
+            "Amon/tas": set(range(1993, 2003)),
+            "Amon/pr": set(range(1993, 2003)),
+        },
+        str(restructured_dir),
+    )
+    assert not stored.exists()
+
+
+def test_link_stored_files(tmp_path, store_dir):
+    index = standardised_store.index_store(str(store_dir), DATASET_DICT)
+    restructured_dir = tmp_path / "work"
+    requested = {
+        "Amon/tas": set(range(1998, 2003)),
+        "Amon/rsut": set(),
+        "Amon/rlut": set(range(1993, 2003)),
+    }
+
+    linked = standardised_store.link_stored_files(
+        index, requested, str(restructured_dir)
+    )
+
+    assert linked == 2
+    tas = restructured_dir / drs_path("Amon", "tas", (1993, 1997))
+    assert tas.is_symlink()
+    assert tas.read_text() == "tas"
+
+
+def test_link_stored_files_overlap(tmp_path, store_dir):
+    index = standardised_store.index_store(str(store_dir), DATASET_DICT)
+    restructured_dir = tmp_path / "work"
+
+    # The stored tas file would overlap the standardised one
+    linked = standardised_store.link_stored_files(
+        index,
+        {"Amon/tas": set(range(1993, 2003))},
+        str(restructured_dir),
+    )
+
+    assert linked == 0
+    assert not restructured_dir.exists()
+
+
+def test_publish_to_store(tmp_path, store_dir):
+    restructured_dir = tmp_path / "work"
+    new_file = restructured_dir / drs_path("Amon", "tas", (1998, 2002))
+    new_file.parent.mkdir(parents=True)
+    new_file.write_text("new tas")
+
+    # Files linked from the store are not published again
+    stored_file = drs_path("Amon", "rsut", (1993, 2002))
+    (restructured_dir / stored_file).parent.mkdir(parents=True)
+    (restructured_dir / stored_file).symlink_to(
+        store_dir / "u-cw673" / stored_file
+    )
+
+    published = standardised_store.publish_to_store(
+        str(restructured_dir), str(store_dir), {"u-cw673": DATASET_DICT}
+    )
+
+    assert published == 1
+    stored = store_dir / "u-cw673" / drs_path("Amon", "tas", (1998, 2002))
+    assert stored.read_text() == "new tas"
+    index = standardised_store.index_store(str(store_dir), DATASET_DICT)
+    assert standardised_store.stored_years(index["Amon/tas"]) == set(
+        range(1993, 2003)
+    )
+
+
+def test_publish_to_store_only_given_model_runs(tmp_path, store_dir):
+    restructured_dir = tmp_path / "work"
+    other_file = restructured_dir / drs_path(
+        "Amon", "tas", (1993, 1997), exp="amip-u-ab123"
+    )
+    other_file.parent.mkdir(parents=True)
+    other_file.write_text("other tas")
+
+    published = standardised_store.publish_to_store(
+        str(restructured_dir), str(store_dir), {"u-cw673": DATASET_DICT}
+    )
+
+    assert published == 0
+    assert not (store_dir / "u-ab123").exists()
+
+
+def test_extend_period(tmp_path, store_dir):
+    # An earlier run of the workflow standardised 1993 to 1997
+    restructured_dir = tmp_path / "work"
+    for short_name in ["tas", "rsut"]:
+        path = restructured_dir / drs_path("Amon", short_name, (1993, 1997))
+        path.parent.mkdir(parents=True)
+        path.write_text(short_name)
+
+    index = standardised_store.merge_indexes(
+        standardised_store.index_drs_tree(str(restructured_dir), DATASET_DICT),
+        standardised_store.index_store(str(store_dir), DATASET_DICT),
+    )
+    variables = ["Amon/tas:apm", "Amon/rsut:apm"]
+
+    # The period is extended to 2002. The stored rsut file overlaps the
+    # earlier one, so can't be used
+    actual = standardised_store.plan_chunk(index, variables, (1993, 2002))
+    assert actual == (variables, (1998, 2002))
+
+    linked = standardised_store.link_stored_files(
+        index,
+        {
+            "Amon/tas": set(range(1998, 2003)),
+            "Amon/rsut": set(range(1998, 2003)),
+        },
+        str(restructured_dir),
+    )
+    assert linked == 0
+    assert (restructured_dir / drs_path("Amon", "tas", (1993, 1997))).exists()
+    assert (restructured_dir / drs_path("Amon", "rsut", (1993, 1997))).exists()
+
+
+def test_link_stored_files_replaces_overlapping(tmp_path):
+    restructured_dir = tmp_path / "work"
+    earlier = restructured_dir / drs_path("Amon", "tas", (1993, 1997))
+    earlier.parent.mkdir(parents=True)
+    earlier.write_text("tas")
+    index = standardised_store.index_drs_tree(
+        str(restructured_dir), DATASET_DICT
+    )
+
+    standardised_store.link_stored_files(
+        index, {"Amon/tas": set(range(1995, 2003))}, str(restructured_dir)
+    )
+
+    assert not earlier.exists()
+
+
+def test_merge_indexes():
+    first = {"Amon/tas": [("a", "tas_1", (1993, 1997))]}
+    second = {
+        "Amon/tas": [
+            ("b", "tas_1", (1993, 1997)),
+            ("b", "tas_2", (1995, 2002)),
+            ("b", "tas_3", (1998, 2002)),
+        ],
+        "Amon/rsut": [("b", "rsut_1", (1993, 2002))],
+    }
+    expected = {
+        "Amon/tas": [
+            ("a", "tas_1", (1993, 1997)),
+            ("b", "tas_3", (1998, 2002)),
+        ],
+        "Amon/rsut": [("b", "rsut_1", (1993, 2002))],
+    }
+    assert standardised_store.merge_indexes(first, second) == expected
@@ -0,0 +1,56 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/streams.py"""
+from pathlib import Path
+import importlib.util
+
+# --- Section to import streams.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+streams_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "streams.py"
+)
+
+spec = importlib.util.spec_from_file_location("streams", streams_path)
+streams = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(streams)
+
+# --- End of import section ---
+
+
+def test_list_configured_streams():
+    streams_yml = (
+        Path(__file__).parent.parent.parent
+        / "configure_standardise"
+        / "etc"
+        / "streams.yml"
+    )
+    actual = streams.list_configured_streams(str(streams_yml))
+    assert actual == "apm, inm"
+
+
+def test_read_top_level_keys():
+    content = [
+        "# A comment:\n",
+        "apm:\n",
+        "- Amon/tas\n",
+        "  nested: value\n",
+        "'ap5': # Quoted, with a comment\n",
+        "- 6hrPlevPt/ua\n",
+    ]
+    assert streams.read_top_level_keys(content) == ["apm", "ap5"]
+
+
+def test_stream_file_path():
+    actual = streams.stream_file_path("/path/to/request_u-cw673.cfg", "apm")
+    assert actual == "/path/to/request_u-cw673_apm.cfg"
+
+
+def test_stream_file_path_for_chunk():
+    actual = streams.stream_file_path(
+        "/path/to/request_u-cw673.cfg", "apm", 1993
+    )
+    assert actual == "/path/to/request_u-cw673_apm_1993.cfg"
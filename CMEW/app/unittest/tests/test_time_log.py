@@ -0,0 +1,120 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/time_log.py"""
+from pathlib import Path
+import importlib.util
+import pytest
+
+# --- Section to import time_log.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+time_log_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "time_log.py"
+)
+
+spec = importlib.util.spec_from_file_location("time_log", time_log_path)
+time_log = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(time_log)
+
+# --- End of import section ---
+
+TIME_LOG = """\
+Command exited with non-zero status 1
+\tCommand being timed: "esmvaltool run recipe_radiation_budget.yml"
+\tUser time (seconds): 3.25
+\tSystem time (seconds): 0.50
+\tPercent of CPU this job got: 97%
+\tElapsed (wall clock) time (h:mm:ss or m:ss): 0:03.84
+\tAverage shared text size (kbytes): 0
+\tMaximum resident set size (kbytes): 123456
+\tMajor (requiring I/O) page faults: 2
+\tMinor (reclaiming a frame) page faults: 3000
+\tVoluntary context switches: 40
+\tInvoluntary context switches: 5
+\tFile system inputs: 800
+\tFile system outputs: 16
+\tExit status: 1
+"""
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("0:03.84", 3.84), ("2:03.50", 123.5), ("1:02:03", 3723.0)],
+)
+def test_parse_elapsed(value, expected):
+    assert time_log.parse_elapsed(value) == pytest.approx(expected)
+
+
+def test_parse_time_log():
+    actual = time_log.parse_time_log(TIME_LOG.splitlines())
+    expected = {
+        "user_seconds": 3.25,
+        "system_seconds": 0.5,
+        "percent_cpu": 97,
+        "elapsed_seconds": pytest.approx(3.84),
+        "max_rss_kb": 123456,
+        "major_page_faults": 2,
+        "minor_page_faults": 3000,
+        "voluntary_context_switches": 40,
+        "involuntary_context_switches": 5,
+        "file_system_inputs": 800,
+        "file_system_outputs": 16,
+        "exit_status": 1,
+    }
+    assert actual == expected
+
+
+def test_parse_time_log_unmeasured():
+    actual = time_log.parse_time_log(["\tPercent of CPU this job got: ?%"])
+    assert actual == {}
+
+
+SECOND_COMMAND = """\
+\tCommand being timed: "cache_standardised_data --request_path request.cfg"
+\tUser time (seconds): 1.00
+\tSystem time (seconds): 0.25
+\tPercent of CPU this job got: 200%
+\tElapsed (wall clock) time (h:mm:ss or m:ss): 0:01.16
+\tMaximum resident set size (kbytes): 1000
+\tExit status: 0
+"""
+
+
+def test_split_time_log():
+    content = (TIME_LOG + SECOND_COMMAND + "\tCommand being").splitlines()
+    actual = time_log.split_time_log(content)
+    assert [len(lines) for lines in actual] == [15, 7]
+    assert actual[1][0] == SECOND_COMMAND.splitlines()[0]
+
+
+def test_read_time_log_several_commands(tmp_path):
+    fp = tmp_path / "job.time"
+    fp.write_text(TIME_LOG + SECOND_COMMAND)
+
+    actual = time_log.read_time_log(fp)
+
+    # The times are summed, and the largest memory and CPU are kept
+    assert actual["user_seconds"] == pytest.approx(4.25)
+    assert actual["system_seconds"] == pytest.approx(0.75)
+    assert actual["elapsed_seconds"] == pytest.approx(5.0)
+    assert actual["max_rss_kb"] == 123456
+    assert actual["percent_cpu"] == 200
+    assert actual["minor_page_faults"] == 3000
+    assert actual["exit_status"] == 1
+
+
+def test_find_time_logs(tmp_path):
+    job_dir = tmp_path / "log" / "job" / "1" / "run_recipe_radiation_budget"
+    for submit in ["01", "02"]:
+        (job_dir / submit).mkdir(parents=True)
+    (job_dir / "02" / "job.time").write_text(TIME_LOG)
+    (job_dir / "NN").symlink_to(job_dir / "02")
+
+    actual = list(time_log.find_time_logs(tmp_path))
+    expected = [
+        ("1", "run_recipe_radiation_budget", 2, str(job_dir / "02/job.time"))
+    ]
+    assert actual == expected
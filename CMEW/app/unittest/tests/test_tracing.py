@@ -0,0 +1,99 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/tracing.py"""
+from pathlib import Path
+import importlib.util
+import json
+import pytest
+
+# --- Section to import tracing.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+tracing_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "tracing.py"
+)
+
+spec = importlib.util.spec_from_file_location("tracing", tracing_path)
+tracing = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(tracing)
+
+# --- End of import section ---
+
+
+@tracing.traced
+def load_recipe(size):
+    """A step which takes a little time."""
+    with tracing.span("build datasets", size=size):
+        return len([str(number) for number in range(size)])
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    """Record spans for the duration of a test."""
+    monkeypatch.setenv("CYLC_TASK_LOG_DIR", str(tmp_path))
+    monkeypatch.setenv("CYLC_TASK_ID", "1/configure_for")
+    tracing.start_tracing()
+    yield
+    tracing.stop_tracing()
+
+
+def test_tracing_disabled():
+    assert not tracing.tracing_enabled()
+    assert load_recipe(10) == 10
+    assert tracing.span("build datasets") is tracing.span("write recipe")
+    assert tracing.stop_tracing() == []
+
+
+def test_traced(tracer):
+    assert load_recipe(1000) == 1000
+    metadata, inner, outer = tracing.stop_tracing()
+
+    assert metadata["ph"] == "M"
+    assert metadata["args"]["name"].startswith("1/configure_for ")
+    assert outer["name"] == "load_recipe"
+    assert inner["name"] == "build datasets"
+    assert inner["args"] == {"size": "1000"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["dur"] <= outer["dur"]
+
+
+def test_span_records_errors(tracer):
+    with pytest.raises(KeyError):
+        with tracing.span("read model runs"):
+            raise KeyError("suite_id")
+    assert tracing.stop_tracing()[-1]["args"] == {"error": "KeyError"}
+
+
+def test_write_and_merge_traces(tracer, tmp_path):
+    load_recipe(10)
+    tracing.write_trace()
+    tracing.stop_tracing()
+    (tmp_path / "killed.trace.json").write_text('{"traceEvents": [')
+
+    trace_paths = sorted(tmp_path.glob("*.trace.json"))
+    assert len(trace_paths) == 2
+    events = [{"name": "queued", "ph": "X"}]
+    merged = tracing.merge_traces(trace_paths, events)
+
+    assert [event["name"] for event in merged["traceEvents"]] == [
+        "queued",
+        "process_name",
+        "build datasets",
+        "load_recipe",
+    ]
+    # The merged trace can be written as it is
+    assert json.loads(json.dumps(merged)) == merged
+
+
+def test_find_traces(tmp_path):
+    job_dir = tmp_path / "log" / "job" / "1" / "configure_for" / "01"
+    job_dir.mkdir(parents=True)
+    (job_dir / "configure_for-123.trace.json").write_text("{}")
+    (job_dir / "job.out").write_text("")
+    (job_dir.parent / "NN").symlink_to(job_dir)
+    assert tracing.find_traces(tmp_path) == [
+        str(job_dir / "configure_for-123.trace.json")
+    ]
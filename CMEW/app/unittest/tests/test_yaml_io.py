@@ -0,0 +1,102 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""Unit tests for CMEW/lib/python/yaml_io.py"""
+from pathlib import Path
+import importlib.util
+import os
+import pytest
+
+# --- Section to import yaml_io.py ---
+
+# PYTHONPATH doesn't automatically pick this up
+yaml_io_path = (
+    Path(__file__).parent.parent.parent.parent
+    / "lib"
+    / "python"
+    / "yaml_io.py"
+)
+
+spec = importlib.util.spec_from_file_location("yaml_io", yaml_io_path)
+yaml_io = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(yaml_io)
+
+# --- End of import section ---
+
+
+@pytest.fixture
+def path_to_basic_dict():
+    path = Path(__file__).parent.parent / "kgo" / "basic_dict.yml"
+    return str(path)
+
+
+def test_write_yaml_sorts_keys(tmp_path, path_to_basic_dict):
+    # Note the keys are not alphabetical here but are in the output
+    test_dict = {
+        "key_1": "value_1",
+        "key_for_list": ["item_1", "item_2", "item_3"],
+        "key_for_dict": {
+            "nested_key_1": "nested_value_1",
+            "nested_key_2": "nested_value_2",
+        },
+    }
+    target_path = tmp_path / "basic_dict.yml"
+    yaml_io.write_yaml(test_dict, str(target_path))
+
+    with open(path_to_basic_dict, "r") as file_handle:
+        expected = file_handle.read()
+
+    assert target_path.read_text() == expected
+    assert list(tmp_path.iterdir()) == [target_path]
+
+
+def test_write_yaml_keeps_insertion_order(tmp_path):
+    target_path = tmp_path / "unsorted.yml"
+    yaml_io.write_yaml({"b": 1, "a": 2}, str(target_path), sort_keys=False)
+    assert target_path.read_text() == "b: 1\na: 2\n"
+
+
+def test_write_yaml_failure_keeps_original(tmp_path):
+    target_path = tmp_path / "original.yml"
+    target_path.write_text("key: value\n")
+
+    # Objects that are not plain data can't be safely dumped
+    with pytest.raises(Exception):
+        yaml_io.write_yaml({"key": object()}, str(target_path))
+
+    assert target_path.read_text() == "key: value\n"
+    assert list(tmp_path.iterdir()) == [target_path]
+
+
+def test_write_text_applies_umask_without_changing_it(tmp_path, monkeypatch):
+    target_path = tmp_path / "written.txt"
+    umask = os.umask(0o027)
+    try:
+        # Changing the umask would affect files created by other threads
+        monkeypatch.setattr(os, "umask", None)
+        yaml_io.write_text("text\n", str(target_path))
+    finally:
+        monkeypatch.undo()
+        os.umask(umask)
+
+    assert target_path.read_text() == "text\n"
+    assert target_path.stat().st_mode & 0o777 == 0o640
+    assert list(tmp_path.iterdir()) == [target_path]
+
+
+def test_load_yaml_returns_independent_copies(path_to_basic_dict):
+    first = yaml_io.load_yaml(path_to_basic_dict)
+    first["key_for_list"].append("item_4")
+    second = yaml_io.load_yaml(path_to_basic_dict)
+    assert second["key_for_list"] == ["item_1", "item_2", "item_3"]
+
+
+def test_load_yaml_reparses_modified_file(tmp_path):
+    yaml_path = tmp_path / "changing.yml"
+    yaml_path.write_text("key: 1\n")
+    assert yaml_io.load_yaml(str(yaml_path)) == {"key": 1}
+
+    # Rewrite the file with a later modification time
+    yaml_path.write_text("key: 2\n")
+    stat = yaml_path.stat()
+    os.utime(yaml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert yaml_io.load_yaml(str(yaml_path)) == {"key": 2}
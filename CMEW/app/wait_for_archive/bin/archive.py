@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Check whether a model run has archived the data to standardise.
+
+CDDS extracts the data of each stream from its MASS collection, e.g.
+``moose:/crum/u-cw673/apm.pp``. The data of a request has been archived
+once the collection holds the last month of the request, which is found in
+the file names, e.g. ``cw673a.pm2002dec.pp`` for the UM streams, or
+``cw673i_1m_20021201-20030101.nc`` for the ocean and sea ice streams.
+"""
+import calendar
+import configparser
+import logging
+import os
+import subprocess
+import sys
+from datetime import date, timedelta
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The type of the MASS collection of each stream, by the model component,
+# i.e. the first letter of the stream
+COLLECTION_TYPES = {"a": "pp", "o": "nc.file", "i": "nc.file"}
+
+
+def read_request(request_path):
+    """Read a CDDS request configuration file."""
+    request = configparser.ConfigParser()
+    request.read(request_path)
+    return request
+
+
+def archive_collection(request, stream):
+    """
+    Return the MASS collection of a stream of the model run of a request.
+
+    Parameters
+    ----------
+    request: :class:`configparser.ConfigParser`
+        The CDDS request.
+    stream: str
+        The name of the stream, e.g. "apm".
+
+    Returns
+    -------
+    str
+        The MASS collection, e.g. ``moose:/crum/u-cw673/apm.pp``.
+    """
+    return (
+        f"moose:/{request['data']['mass_data_class']}/"
+        f"{request['data']['model_workflow_id']}/"
+        f"{stream}.{COLLECTION_TYPES[stream[0]]}"
+    )
+
+
+def last_month(request):
+    """
+    Return the year and month of the last month covered by a request.
+
+    The end date of a request is the start of the month after its data.
+    """
+    end_date = date.fromisoformat(request["data"]["end_date"][:10])
+    last_day = end_date - timedelta(days=1)
+    return last_day.year, last_day.month
+
+
+def month_archived(file_names, year, month):
+    """
+    Return whether any of the files of a collection holds the given month.
+
+    Parameters
+    ----------
+    file_names: iterable of str
+        The names, or MASS paths, of the files in the collection.
+    year: int
+        The year.
+    month: int
+        The month, from 1 to 12.
+
+    Returns
+    -------
+    bool
+        Whether a file name includes the month, either as in the UM file
+        names, e.g. "2002dec", or as in the NEMO and CICE file names,
+        e.g. "_20021201-".
+    """
+    patterns = (
+        f"{year}{calendar.month_abbr[month].lower()}.",
+        f"_{year}{month:02d}01-",
+    )
+    return any(
+        pattern in os.path.basename(name)
+        for name in file_names
+        for pattern in patterns
+    )
+
+
+def list_collection(collection):
+    """
+    List the files in a MASS collection.
+
+    Parameters
+    ----------
+    collection: str
+        The MASS collection.
+
+    Returns
+    -------
+    list of str
+        The MASS paths of the files, or an empty list if the collection
+        can't be listed, e.g. because it doesn't exist yet.
+    """
+    result = subprocess.run(
+        ["moo", "ls", collection], capture_output=True, text=True
+    )
+    if result.returncode:
+        logger.info("Could not list %s: %s", collection, result.stderr.strip())
+        return []
+    return result.stdout.split()
+
+
+def find_unarchived_streams(requests, list_files=list_collection):
+    """
+    Return the streams whose data hasn't all been archived yet.
+
+    Parameters
+    ----------
+    requests: dict
+        A mapping of each stream to its CDDS request.
+    list_files: callable, optional
+        The function listing the files in a MASS collection.
+
+    Returns
+    -------
+    list of str
+        The streams whose last month isn't in their MASS collection.
+    """
+    unarchived = []
+    for stream, request in requests.items():
+        collection = archive_collection(request, stream)
+        year, month = last_month(request)
+        if month_archived(list_files(collection), year, month):
+            logger.info("%s holds %s-%02d", collection, year, month)
+        else:
+            logger.info("%s doesn't hold %s-%02d yet", collection, year, month)
+            unarchived.append(stream)
+    return unarchived
@@ -0,0 +1,87 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+import argparse
+import os
+import sys
+from archive import find_unarchived_streams, read_request
+from profiling import profile_entry_point
+from streams import stream_file_path
+
+
+def parse_args_for_wait_for_archive(arguments):
+    """
+    Return the names and values of the command line arguments for
+    :func:`main_for_wait_for_archive`.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+
+    Returns
+    -------
+    :class:`argparse.Namespace`
+        The names and values of the command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=(
+            "Check whether a model run has archived the data requested "
+            "from each stream."
+        ),
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--request_path",
+        help=(
+            "The full path to the CDDS request configuration file of the "
+            "model run, before the stream and chunk are added."
+        ),
+    )
+    parser.add_argument(
+        "--streams",
+        nargs="+",
+        help="The streams which may be standardised.",
+    )
+    parser.add_argument(
+        "--chunk",
+        help="The first year of the chunk of years to standardise.",
+    )
+    return parser.parse_args(arguments)
+
+
+@profile_entry_point
+def main_for_wait_for_archive(arguments=None):
+    """
+    Check whether a model run has archived the data requested from each
+    stream.
+
+    Only the streams with a request for the chunk are checked. Exits with
+    status 1 if any of them hasn't been archived yet, so the task can be
+    retried later.
+
+    Parameters
+    ----------
+    arguments : :obj:`list` of :obj:`str`
+        The command line arguments to be parsed.
+    """
+    # Parse the arguments.
+    args = parse_args_for_wait_for_archive(arguments)
+
+    # Run the code.
+    print(f"request_path: {args.request_path}")
+    print(f"streams: {args.streams}")
+    print(f"chunk: {args.chunk}")
+    requests = {}
+    for stream in args.streams:
+        stream_request_path = stream_file_path(
+            args.request_path, stream, args.chunk
+        )
+        if os.path.isfile(stream_request_path):
+            requests[stream] = read_request(stream_request_path)
+    unarchived = find_unarchived_streams(requests)
+    if unarchived:
+        print(
+            f"Not yet archived from streams: {' '.join(unarchived)}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
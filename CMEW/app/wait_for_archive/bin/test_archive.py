@@ -0,0 +1,78 @@
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Unit tests for archive.py
+
+Test data files:
+/app/unittest/kgo/request_u-cw673.cfg
+    basis of the requests in every test
+"""
+from pathlib import Path
+from archive import (
+    archive_collection,
+    find_unarchived_streams,
+    last_month,
+    month_archived,
+    read_request,
+)
+import pytest
+
+KGO_REQUEST_PATH = (
+    Path(__file__).parent.parent.parent
+    / "unittest"
+    / "kgo"
+    / "request_u-cw673.cfg"
+)
+
+
+@pytest.fixture
+def request_():
+    """The request for u-cw673, for the years 1993 to 2002."""
+    return read_request(KGO_REQUEST_PATH)
+
+
+@pytest.mark.parametrize(
+    "stream, expected",
+    [
+        ("apm", "moose:/crum/u-cw673/apm.pp"),
+        ("inm", "moose:/crum/u-cw673/inm.nc.file"),
+        ("onm", "moose:/crum/u-cw673/onm.nc.file"),
+    ],
+)
+def test_archive_collection(request_, stream, expected):
+    assert archive_collection(request_, stream) == expected
+
+
+def test_last_month(request_):
+    assert last_month(request_) == (2002, 12)
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        ("moose:/crum/u-cw673/apm.pp/cw673a.pm2002dec.pp", True),
+        ("moose:/crum/u-cw673/apm.pp/cw673a.pm2002nov.pp", False),
+        (
+            "moose:/crum/u-cw673/inm.nc.file/cw673i_1m_20021201-20030101.nc",
+            True,
+        ),
+        (
+            "moose:/crum/u-cw673/inm.nc.file/cw673i_1m_20021101-20021201.nc",
+            False,
+        ),
+    ],
+)
+def test_month_archived(file_name, expected):
+    assert month_archived([file_name], 2002, 12) == expected
+
+
+def test_find_unarchived_streams(request_):
+    archived = {
+        "moose:/crum/u-cw673/apm.pp": ["cw673a.pm2002nov.pp"],
+        "moose:/crum/u-cw673/inm.nc.file": ["cw673i_1m_20021201-20030101.nc"],
+    }
+    requests = {"apm": request_, "inm": request_}
+
+    actual = find_unarchived_streams(requests, archived.get)
+
+    assert actual == ["apm"]
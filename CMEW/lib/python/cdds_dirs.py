@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Index the directories CDDS uses for the requests of a model run.
+
+``configure_standardise`` records the input and output directories of each
+request, for each stream and chunk of years, once it has created them with
+``create_cdds_directory_structure``. The later tasks look the directories up
+in the index, rather than searching ``ROOT_DATA_DIR`` for them, which is
+slow on shared file systems.
+"""
+import configparser
+import logging
+import os
+import sys
+from pathlib import Path
+
+from streams import stream_file_path
+from yaml_io import load_yaml, write_yaml
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+
+def read_request(request_path):
+    """
+    Read a CDDS request configuration file.
+
+    Parameters
+    ----------
+    request_path: str
+        The full path to the request configuration file.
+
+    Returns
+    -------
+    dict
+        The options in each section of the request.
+    """
+    cfg = configparser.ConfigParser()
+    cfg.read(request_path)
+    return {section: dict(cfg[section]) for section in cfg.sections()}
+
+
+def find_data_dir(request):
+    """
+    Return the directory where CDDS writes the data for a request.
+
+    Parameters
+    ----------
+    request: dict
+        The options in each section of the request.
+
+    Returns
+    -------
+    Path
+        The data directory for the package of the request.
+    """
+    metadata = request["metadata"]
+    return Path(
+        request["common"]["root_data_dir"],
+        metadata["mip_era"],
+        metadata["mip"],
+        metadata["model_id"],
+        metadata["experiment_id"],
+        metadata["variant_label"],
+        request["common"]["package"],
+    )
+
+
+def describe_dirs(request_path, stream):
+    """
+    Return the directories CDDS uses for a request for a single stream.
+
+    Parameters
+    ----------
+    request_path: str
+        The full path to the request configuration file.
+    stream: str
+        The name of the stream.
+
+    Returns
+    -------
+    dict
+        The full paths to the request, the data directory of its package,
+        the directory the stream is extracted to and the directory the
+        standardised data is written to.
+    """
+    request = read_request(request_path)
+    data_dir = find_data_dir(request)
+    input_dir = data_dir / "input" / request["data"]["model_workflow_id"]
+    return {
+        "request_path": str(request_path),
+        "data_dir": str(data_dir),
+        "input_dir": str(input_dir / stream),
+        "output_dir": str(data_dir / "output"),
+    }
+
+
+def record_cdds_dirs(index_path, request_path, streams, chunks):
+    """
+    Write the index of the directories of every request of a model run.
+
+    Parameters
+    ----------
+    index_path: str
+        The full path to the index.
+    request_path: str
+        The full path to the request configuration file for all streams;
+        the request for each stream and chunk is found next to it.
+    streams: list of str
+        The names of the streams.
+    chunks: list of str
+        The first year of each chunk of years.
+
+    Returns
+    -------
+    dict
+        The index, mapping "<stream>_<chunk>" to the directories of each
+        request which exists, as returned by :func:`describe_dirs`.
+    """
+    index = {}
+    for stream in streams:
+        for chunk in chunks:
+            stream_request_path = stream_file_path(request_path, stream, chunk)
+            if os.path.isfile(stream_request_path):
+                index[f"{stream}_{chunk}"] = describe_dirs(
+                    stream_request_path, stream
+                )
+
+    write_yaml(index, index_path)
+    logger.info("Recorded the directories of %s requests", len(index))
+    return index
+
+
+def look_up_cdds_dirs(index_path, stream, chunk):
+    """
+    Return the directories of the request for a stream and chunk of years.
+
+    Parameters
+    ----------
+    index_path: str
+        The full path to the index.
+    stream: str
+        The name of the stream.
+    chunk: str
+        The first year of the chunk of years.
+
+    Returns
+    -------
+    dict or None
+        The directories, as returned by :func:`describe_dirs`, or None if
+        there is no request for the stream and chunk.
+    """
+    return load_yaml(index_path).get(f"{stream}_{chunk}")
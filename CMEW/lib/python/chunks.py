@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Split the evaluation period into chunks of years to standardise.
+
+The Jinja2 in ``flow.cylc`` uses the first year of each chunk as the values
+of the ``chunk`` task parameter, so that each chunk of years is
+standardised by a separate task. This module only uses the standard
+library, as it is imported by the Python that runs Cylc.
+"""
+
+
+def iter_chunks(start_year, number_of_years, chunk_years=0):
+    """
+    Lazily split a period of whole years into chunks.
+
+    Parameters
+    ----------
+    start_year: int or str
+        The first year of the period.
+    number_of_years: int or str
+        The number of years in the period.
+    chunk_years: int or str
+        The number of years in each chunk; the last chunk may be shorter.
+        If zero or empty, the whole period is a single chunk.
+
+    Yields
+    ------
+    tuple of int
+        The first and last years (inclusive) of each chunk.
+
+    Raises
+    ------
+    ValueError
+        If the period has no years,
+        or the number of years in each chunk is negative.
+    """
+    start_year = int(start_year)
+    number_of_years = int(number_of_years)
+    chunk_years = int(chunk_years or 0)
+    if number_of_years < 1 or chunk_years < 0:
+        raise ValueError(
+            f"Can't split {number_of_years} years "
+            f"into chunks of {chunk_years} years"
+        )
+
+    end_year = start_year + number_of_years - 1
+    step = chunk_years or number_of_years
+    for first_year in range(start_year, end_year + 1, step):
+        yield first_year, min(first_year + step - 1, end_year)
+
+
+def list_chunks(start_year, number_of_years, chunk_years=0):
+    """
+    Obtain a string listing the first year of each chunk.
+
+    Parameters
+    ----------
+    start_year: int or str
+        The first year of the period.
+    number_of_years: int or str
+        The number of years in the period.
+    chunk_years: int or str
+        The number of years in each chunk; the last chunk may be shorter.
+        If zero or empty, the whole period is a single chunk.
+
+    Returns
+    -------
+    str
+        The first year of each chunk, in a comma separated string.
+    """
+    chunks = iter_chunks(start_year, number_of_years, chunk_years)
+    chunks_string = ", ".join(str(first_year) for first_year, _ in chunks)
+
+    print(f"[chunks.py] Chunks found: {chunks_string}")
+    return chunks_string
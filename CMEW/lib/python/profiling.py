@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Profile the CMEW entry points, if the ``CMEW_PROFILE`` environment
+variable asks for it.
+
+``CMEW_PROFILE`` is a comma separated list of:
+
+``cpu``
+    Profile the entry point with :mod:`cProfile`, writing the statistics
+    to ``<entry point>.prof``, which can be read with :mod:`pstats` or
+    e.g. ``snakeviz``, and the functions taking the most time to
+    ``<entry point>.prof.txt``.
+``memory``
+    Trace the memory allocated by the entry point with
+    :mod:`tracemalloc`, writing the snapshot at the end to
+    ``<entry point>.tracemalloc`` and the lines allocating the most memory,
+    with the peak, to ``<entry point>.tracemalloc.txt``.
+
+The files are written to the job log directory of the task, or the
+current directory outside Cylc. When ``CMEW_PROFILE`` is unset or empty,
+the entry point is called as it is.
+"""
+import cProfile
+import functools
+import io
+import logging
+import os
+import pstats
+import sys
+import tracemalloc
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The environment variable listing the kinds of profile to write
+PROFILE_ENV = "CMEW_PROFILE"
+
+# The kinds of profile which can be written
+PROFILE_KINDS = ("cpu", "memory")
+
+# The number of functions or lines listed in the reports
+TOP_N = 30
+
+# The number of frames kept for each allocation traced
+TRACEMALLOC_FRAMES = 10
+
+
+def profile_kinds(value):
+    """
+    Return the kinds of profile asked for.
+
+    Parameters
+    ----------
+    value: str
+        The value of ``CMEW_PROFILE``, e.g. "cpu,memory".
+
+    Returns
+    -------
+    set of str
+        The kinds of profile in ``PROFILE_KINDS`` to write.
+
+    Raises
+    ------
+    ValueError
+        If an unknown kind of profile is asked for.
+    """
+    kinds = {kind.strip().lower() for kind in value.split(",") if kind.strip()}
+    unknown = kinds - set(PROFILE_KINDS)
+    if unknown:
+        raise ValueError(
+            f"Unknown {PROFILE_ENV} {sorted(unknown)}, "
+            f"expected some of {list(PROFILE_KINDS)}"
+        )
+    return kinds
+
+
+def profile_dir():
+    """Return the directory to write profiles to."""
+    return os.environ.get("CYLC_TASK_LOG_DIR") or os.getcwd()
+
+
+def write_cpu_report(profiler, prof_path):
+    """Write a profile's statistics and the functions taking the most time."""
+    profiler.dump_stats(prof_path)
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_N)
+    with open(f"{prof_path}.txt", "w") as file_handle:
+        file_handle.write(report.getvalue())
+
+
+def write_memory_report(snapshot, peak, snapshot_path):
+    """Write a memory snapshot and the lines allocating the most memory."""
+    snapshot.dump(snapshot_path)
+    lines = [f"Peak memory traced: {peak / 1024:.1f} KiB", ""]
+    lines.extend(
+        str(statistic) for statistic in snapshot.statistics("lineno")[:TOP_N]
+    )
+    with open(f"{snapshot_path}.txt", "w") as file_handle:
+        file_handle.write("\n".join(lines) + "\n")
+
+
+def profile_entry_point(function):
+    """
+    Profile an entry point if ``CMEW_PROFILE`` asks for it.
+
+    Parameters
+    ----------
+    function: callable
+        The entry point, e.g. ``main_for_configure_for``.
+
+    Returns
+    -------
+    callable
+        The entry point, profiled when asked for.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        kinds = profile_kinds(os.environ.get(PROFILE_ENV, ""))
+        if not kinds:
+            return function(*args, **kwargs)
+
+        path = os.path.join(profile_dir(), function.__name__)
+        profiler = cProfile.Profile() if "cpu" in kinds else None
+        if "memory" in kinds:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        if profiler:
+            profiler.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            if profiler:
+                profiler.disable()
+                write_cpu_report(profiler, f"{path}.prof")
+                logger.info("Wrote the CPU profile to %s.prof", path)
+            if "memory" in kinds:
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                write_memory_report(snapshot, peak, f"{path}.tracemalloc")
+                logger.info("Wrote the memory profile to %s.tracemalloc", path)
+
+    return wrapper
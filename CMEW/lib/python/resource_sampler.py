@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Sample the resources used by a process and its descendants over time.
+
+``/usr/bin/time -v`` only records the totals when a command exits, and
+nothing if the command is killed. When ``RESOURCE_SAMPLE_INTERVAL`` is set,
+the site environment wrappers start this script in the background, which
+writes the resources used by the whole process tree to a CSV file every
+interval, until the process exits. Each command has its own file, e.g.
+``job.cdds_convert.12345.samples``, so the samples of the commands run by a
+task are all kept:
+
+``time``
+    The time of the sample, in seconds since the epoch.
+``elapsed_seconds``
+    The seconds since sampling started.
+``processes``
+    The number of processes in the tree.
+``rss_kb``
+    The total resident set size of the processes.
+``cpu_seconds``
+    The total CPU time used by the processes, and by their descendants
+    which have exited.
+``read_bytes``, ``write_bytes``
+    The total bytes the processes have read from, and written to, storage.
+``open_files``
+    The total number of files the processes have open.
+
+Only the ``/proc`` file system is read, so it is cheap to sample, and each
+line is flushed so the samples up to a kill are kept. Only Linux is
+supported.
+"""
+import argparse
+import csv
+import os
+import time
+
+# The columns of the samples file, in order
+SAMPLE_FIELDS = (
+    "time",
+    "elapsed_seconds",
+    "processes",
+    "rss_kb",
+    "cpu_seconds",
+    "read_bytes",
+    "write_bytes",
+    "open_files",
+)
+
+PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def read_stat(pid):
+    """
+    Return the state, parent process ID, CPU ticks and resident pages of a
+    process.
+
+    The CPU ticks include those of the children the process has waited for.
+
+    Raises
+    ------
+    OSError
+        If the process no longer exists.
+    """
+    with open(f"/proc/{pid}/stat") as file_handle:
+        # The command name may contain spaces, so split after it
+        fields = file_handle.read().rpartition(")")[2].split()
+    cpu_ticks = sum(int(value) for value in fields[11:15])
+    return fields[0], int(fields[1]), cpu_ticks, int(fields[21])
+
+
+def read_io(pid):
+    """Return the bytes a process has read from, and written to, storage."""
+    io = {}
+    try:
+        with open(f"/proc/{pid}/io") as file_handle:
+            for line in file_handle:
+                name, _, value = line.partition(":")
+                io[name] = int(value)
+    except OSError:
+        # Only the owner of a process may read its I/O
+        pass
+    return io.get("read_bytes", 0), io.get("write_bytes", 0)
+
+
+def count_open_files(pid):
+    """Return the number of files a process has open."""
+    try:
+        return len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        return 0
+
+
+def find_tree(root_pid, exclude=()):
+    """
+    Find the processes in the tree rooted at a process.
+
+    Parameters
+    ----------
+    root_pid: int
+        The process ID of the root of the tree.
+    exclude: collection of int
+        The process IDs to leave out, with their descendants.
+
+    Returns
+    -------
+    dict
+        The CPU ticks and resident pages of each process, by process ID.
+    """
+    stats = {}
+    children = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            state, parent, cpu_ticks, rss_pages = read_stat(int(name))
+        except (OSError, ValueError, IndexError):
+            continue
+        # A process which has exited, but not been waited for, is a zombie
+        if state == "Z":
+            continue
+        stats[int(name)] = (cpu_ticks, rss_pages)
+        children.setdefault(parent, []).append(int(name))
+
+    tree = {}
+    pending = [root_pid] if root_pid in stats else []
+    while pending:
+        pid = pending.pop()
+        if pid in exclude:
+            continue
+        tree[pid] = stats[pid]
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+def sample_tree(root_pid, exclude=()):
+    """
+    Return the resources used by the tree rooted at a process.
+
+    Returns
+    -------
+    dict or None
+        The columns in ``SAMPLE_FIELDS`` other than the times, or None if
+        the process no longer exists.
+    """
+    tree = find_tree(root_pid, exclude)
+    if not tree:
+        return None
+    sample = {
+        "processes": len(tree),
+        "rss_kb": sum(rss_pages for _, rss_pages in tree.values()) * PAGE_KB,
+        "cpu_seconds": round(
+            sum(cpu_ticks for cpu_ticks, _ in tree.values()) / CLOCK_TICKS, 2
+        ),
+        "read_bytes": 0,
+        "write_bytes": 0,
+        "open_files": 0,
+    }
+    for pid in tree:
+        read_bytes, write_bytes = read_io(pid)
+        sample["read_bytes"] += read_bytes
+        sample["write_bytes"] += write_bytes
+        sample["open_files"] += count_open_files(pid)
+    return sample
+
+
+def run_sampler(root_pid, interval, output_path):
+    """
+    Sample the resources used by a process tree until the process exits.
+
+    Parameters
+    ----------
+    root_pid: int
+        The process ID of the root of the tree.
+    interval: float
+        The seconds between samples.
+    output_path: str
+        The full path to the CSV file to write the samples to.
+
+    Returns
+    -------
+    int
+        The number of samples written.
+    """
+    start = time.time()
+    written = 0
+    with open(output_path, "w", newline="") as file_handle:
+        writer = csv.DictWriter(file_handle, fieldnames=SAMPLE_FIELDS)
+        writer.writeheader()
+        while True:
+            sample = sample_tree(root_pid, exclude={os.getpid()})
+            if sample is None:
+                return written
+            now = time.time()
+            sample["time"] = round(now, 2)
+            sample["elapsed_seconds"] = round(now - start, 2)
+            writer.writerow(sample)
+            file_handle.flush()
+            written += 1
+            time.sleep(interval)
+
+
+def main(arguments=None):
+    """Sample the resources used by a process tree."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pid", type=int, help="The process to sample.")
+    parser.add_argument(
+        "--interval", type=float, help="The seconds between samples."
+    )
+    parser.add_argument(
+        "--output", help="The full path to the CSV file to write."
+    )
+    args = parser.parse_args(arguments)
+    run_sampler(args.pid, args.interval, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,40 +3,260 @@
 # The LICENSE.md file contains full licensing details.
 """
 Scrape model_run suite_ids from an ini-style file.
+
+The file is parsed once into an index of sections, which is cached on the
+file path and modification time. Every helper imported by the Jinja2 in
+``flow.cylc`` and ``inc/autoassess.cylc`` therefore queries the same
+structure, however many times it is called during ``cylc validate``,
+``cylc play`` or ``cylc reload``. Reading the file is traced (see
+``tracing.py``), so a trace shows each time the file is read.
+
+A model run section may describe an ensemble by giving a list of values,
+or an integer range such as ``{1..50}``, for the ``suite_id`` and
+``variant_label`` facets; see :func:`expand_ensemble`.
 """
+import functools
+import os
+import re
 
+from tracing import traced
 
-def extract_suite_ids(content):
+# Facets which may describe the members of an ensemble
+ENSEMBLE_FACETS = ("suite_id", "variant_label")
+
+# An inclusive integer range, e.g. "{1..50}" or "{001..050}"
+_RANGE = re.compile(r"\{(\d+)\.\.(\d+)\}")
+
+
+def parse_sections(content):
     """
-    Lists the suite IDs of model runs from the content of an ini-style file.
+    Index the sections of an ini-style file.
 
-    Checks the whole file for lines starting "suite_id".
+    Continuation lines (those starting with "=", as written by Rose) are
+    appended to the value of the preceding key, separated by a newline.
 
     Parameters
     ----------
     content: list of strings
-        The lines of the ini-style file
+        The lines of the ini-style file.
 
     Returns
     -------
-    list
-        The list of suite_ids (unquoted).
+    dict
+        A dictionary of section names (without brackets), each mapping to a
+        dictionary of the keys and unquoted values in that section.
+        Keys outside any section are stored under the empty string.
     """
-    # Initialise overall list
-    suite_ids = []
+    sections = {"": {}}
+    section = sections[""]
+    key = None
 
-    # Read each line in turn
     for line in content:
+        stripped = line.strip()
+
+        # Skip blank lines and comments
+        if not stripped or stripped.startswith("#"):
+            continue
+
+        # Start a new section
+        if stripped.startswith("[") and stripped.endswith("]"):
+            section = sections.setdefault(stripped[1:-1], {})
+            key = None
+
+        # Extend the value of the previous key
+        elif stripped.startswith("=") and key is not None:
+            extra = stripped[1:].strip().replace('"', "")
+            section[key] = f"{section[key]}\n{extra}"
+
+        # Read a new key=value pair
+        elif "=" in stripped:
+            key, value = stripped.split("=", 1)
+            key = key.strip()
+            section[key] = value.strip().replace('"', "")
+
+    return sections
+
+
+@functools.lru_cache(maxsize=None)
+@traced
+def _load_sections(fp, mtime_ns):
+    """
+    Read and index an ini-style file.
+
+    ``mtime_ns`` is only used as part of the cache key, so that the file
+    is read again if it changes.
+    """
+    with open(fp, "r") as f:
+        content = f.readlines()
+    return parse_sections(content)
 
-        # Look for relevant lines
-        if line.startswith("suite_id"):
-            print(f"[scrape_ini.py] Found line: {line}")
 
-            # Take the value of the suite ID
-            suite_id = line.split("=")[1]
+def read_sections(fp):
+    """
+    Return the index of sections in an ini-style file.
+
+    The index is built once for each version of the file and cached on the
+    file path and modification time.
+
+    Parameters
+    ----------
+    fp: str
+        The file path to the ini-style file.
+
+    Returns
+    -------
+    dict
+        A dictionary of section names, each mapping to a dictionary of the
+        keys and unquoted values in that section.
+    """
+    fp = os.path.abspath(fp)
+    return _load_sections(fp, os.stat(fp).st_mtime_ns)
 
-            # Add to the list, unquoted
-            suite_ids.append(suite_id.strip().replace('"', ""))
+
+def expand_range(value):
+    """
+    Expand the integer ranges in a value.
+
+    A range is written ``{<first>..<last>}`` and is inclusive. If ``first``
+    has leading zeros, the numbers are zero-padded to the same width.
+    Several ranges in one value are expanded in turn.
+
+    Parameters
+    ----------
+    value: str
+        The value, which may contain ranges.
+
+    Yields
+    ------
+    str
+        Each value described by the ranges, in order.
+    """
+    match = _RANGE.search(value)
+    if not match:
+        yield value
+        return
+
+    start, end = match.span()
+    prefix, suffix = value[:start], value[end:]
+    first, last = match.groups()
+    width = len(first) if first.startswith("0") else 0
+    step = 1 if int(last) >= int(first) else -1
+    for number in range(int(first), int(last) + step, step):
+        for remainder in expand_range(suffix):
+            yield f"{prefix}{number:0{width}d}{remainder}"
+
+
+def expand_values(value):
+    """
+    Expand a single value or a list of values into a list of values.
+
+    Parameters
+    ----------
+    value: str or list of str
+        The value(s) of a facet, which may contain ranges.
+
+    Returns
+    -------
+    list of str
+        The expanded values.
+    """
+    values = value if isinstance(value, list) else [value]
+    return [member for item in values for member in expand_range(item)]
+
+
+def expand_ensemble(facets):
+    """
+    Lazily expand the facets of a model run into those of each member.
+
+    The facets named in ``ENSEMBLE_FACETS`` may be lists or contain ranges.
+    Expanded facets are combined member by member, so they must all have
+    the same number of values; single values are used for every member.
+    All other facets are copied to every member unchanged.
+
+    Parameters
+    ----------
+    facets: dict
+        The facets of a model run.
+
+    Yields
+    ------
+    dict
+        The facets of each member of the ensemble.
+
+    Raises
+    ------
+    ValueError
+        If the expanded facets have different numbers of values.
+    """
+    members = {
+        key: expand_values(facets[key])
+        for key in ENSEMBLE_FACETS
+        if key in facets
+    }
+    size = max([len(values) for values in members.values()], default=1)
+    for key, values in members.items():
+        if len(values) not in (1, size):
+            raise ValueError(
+                f"Expected 1 or {size} values of {key}, "
+                f"found {len(values)}: {values}"
+            )
+
+    for index in range(size):
+        member = dict(facets)
+        for key, values in members.items():
+            member[key] = values[index] if len(values) > 1 else values[0]
+        yield member
+
+
+def _split_list(value):
+    """Split a comma separated value read from an ini-style file."""
+    values = [item.strip() for item in value.split(",")]
+    return values if len(values) > 1 else values[0]
+
+
+def extract_suite_ids(content):
+    """
+    Lists the suite IDs of model runs from the content of an ini-style file.
+
+    Checks every section of the file for a "suite_id" key.
+    Sections describing an ensemble give the suite ID of every member.
+
+    Parameters
+    ----------
+    content: list of strings or dict
+        The lines of the ini-style file, or its index of sections
+        as returned by :func:`parse_sections`.
+
+    Returns
+    -------
+    list
+        The list of suite_ids (unquoted).
+
+    Raises
+    ------
+    ValueError
+        If a suite ID is found more than once.
+    """
+    if not isinstance(content, dict):
+        content = parse_sections(content)
+
+    suite_ids = []
+    seen = set()
+    for section in content.values():
+        if "suite_id" not in section:
+            continue
+        facets = {
+            key: _split_list(section[key])
+            for key in ENSEMBLE_FACETS
+            if key in section
+        }
+        for member in expand_ensemble(facets):
+            if member["suite_id"] in seen:
+                raise ValueError(
+                    f"Suite ID {member['suite_id']} found more than once"
+                )
+            seen.add(member["suite_id"])
+            suite_ids.append(member["suite_id"])
 
     print(f"[scrape_ini.py] Suite IDs found: {suite_ids}")
     return suite_ids
@@ -46,7 +266,7 @@ def list_datasets(fp):
     """
     Obtain a string listing the suite_ids from an ini-style file.
 
-    Saves the unquoted value of every line starting "suite_id"
+    Saves the unquoted value of every "suite_id" key
     into a comma-and-space separated string.
 
     Parameters
@@ -59,12 +279,8 @@ def list_datasets(fp):
     str
         The list of suite_ids, in a comma separated string.
     """
-    # Read the file
-    with open(fp, "r") as f:
-        content = f.readlines()
-
     # Get a list of suite IDs
-    datasets = extract_suite_ids(content)
+    datasets = extract_suite_ids(read_sections(fp))
 
     # Write the list as a comma separated string
     datasets_string = ", ".join(datasets)
@@ -76,30 +292,12 @@ def list_datasets(fp):
 def retrieve_value(fp, indicator, key):
     """
     Return the value of a key from the indicated section of an ini-style file.
-    """
-    # Provide a default in case things go wrong
-    value = None
-
-    # Read the file
-    with open(fp, "r") as f:
-        content = f.readlines()
-
-    # Iterate over the lines
-    for index, line in enumerate(content):
-
-        # Look for relevant sections
-        line_to_find = f"[namelist:model_runs({indicator})]"
-        if line.startswith(line_to_find):
 
-            # Look for next line starting with the key
-            next_index = index + 1
-            for next_line in content[next_index:]:
-                if next_line.strip().startswith(key):
-                    # Split the line and take the second part without quotes
-                    value = next_line.split("=")[1].strip().replace('"', "")
-
-                    # Break the inner loop
-                    break
+    Only the ``[namelist:model_runs(<indicator>)]`` section is searched.
+    ``None`` is returned if either the section or the key is missing.
+    """
+    section = read_sections(fp).get(f"namelist:model_runs({indicator})", {})
+    value = section.get(key)
 
     print(f"[scrape_ini.py] Retrieved value: {value}")
     return value
@@ -0,0 +1,507 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Share standardised data between workflows through a site-wide store.
+
+The store holds the restructured output of each model run under its suite
+ID, i.e. ``<store>/<suite_id>/<path relative to ROOT_RESTRUCTURED_DIR>``,
+where the path follows the BADC DRS::
+
+    GCModelDev/{activity}/{institute}/{dataset}/{exp}/{ensemble}/{mip}/
+    {short_name}/{grid}/{version}/{filename}
+
+The files of a model run are indexed by MIP table, variable and year, using
+the date range in each file name, so a workflow can link the years it needs
+that are already in the store and only standardise the others. The same
+indexing finds the years already standardised by an earlier run of the
+workflow in ``ROOT_RESTRUCTURED_DIR``, or saved in ``STANDARDISED_DATA_DIR``,
+so extending the period only standardises the new years.
+"""
+import logging
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+filename = os.path.basename(__file__)
+logger = logging.getLogger(filename)
+
+# The date range at the end of a CMOR file name, e.g. "_199301-200212.nc"
+_DATE_RANGE = re.compile(r"_(\d{4})\d*-(\d{4})\d*\.nc$")
+
+# The number of directories between the top of the store for a model run
+# and each file, i.e. mip_era to version
+_DRS_DEPTH = 10
+
+# The number of directories from the top of the store for a model run to
+# the ensemble member, i.e. mip_era to ensemble
+_ENSEMBLE_DEPTH = 6
+
+
+def parse_years(file_name):
+    """
+    Return the first and last years covered by a CMOR file name.
+
+    Parameters
+    ----------
+    file_name: str
+        The name of the file, e.g.
+        ``tas_Amon_HadGEM3-GC31-LL_amip_r1i1p1f1_gn_199301-200212.nc``.
+
+    Returns
+    -------
+    tuple of int or None
+        The first and last years (inclusive), or None if the file name
+        has no date range (e.g. for fixed fields).
+    """
+    match = _DATE_RANGE.search(file_name)
+    if not match:
+        return None
+    return int(match.group(1)), int(match.group(2))
+
+
+def index_drs_tree(root_dir, dataset_dict):
+    """
+    Index the standardised files of a model run in a BADC DRS tree.
+
+    Only files whose dataset, experiment, ensemble member and grid match
+    those of the model run are indexed, so data standardised with other
+    metadata is never reused.
+
+    Parameters
+    ----------
+    root_dir: str
+        The full path to the directory containing the ``GCModelDev``
+        directory, e.g. ``ROOT_RESTRUCTURED_DIR``.
+    dataset_dict: dict
+        The facets of the model run, from ``model_runs.yml``.
+
+    Returns
+    -------
+    dict
+        A mapping of "MIP_table/variable_name" to a list of
+        ``(root directory, relative path, years)`` tuples, where ``years``
+        is as returned by :func:`parse_years`.
+    """
+    root_dir = str(root_dir)
+    expected = (
+        dataset_dict["model_id"],
+        dataset_dict["experiment_id"],
+        dataset_dict["variant_label"],
+    )
+    index = {}
+    for root, _, files in os.walk(root_dir):
+        relative_dir = Path(root).relative_to(root_dir)
+        if len(relative_dir.parts) != _DRS_DEPTH:
+            continue
+        dataset, exp, ensemble, mip, short_name, grid = relative_dir.parts[3:9]
+        if (dataset, exp, ensemble) != expected:
+            continue
+        if grid != dataset_dict.get("grid", grid):
+            continue
+        for name in sorted(files):
+            index.setdefault(f"{mip}/{short_name}", []).append(
+                (root_dir, str(relative_dir / name), parse_years(name))
+            )
+
+    logger.info(
+        "Found %s variables for %s in %s",
+        len(index),
+        dataset_dict["suite_id"],
+        root_dir,
+    )
+    return index
+
+
+def index_store(store_dir, dataset_dict):
+    """
+    Index the files in the store for a model run.
+
+    Parameters
+    ----------
+    store_dir: str
+        The full path to the store.
+    dataset_dict: dict
+        The facets of the model run, from ``model_runs.yml``.
+
+    Returns
+    -------
+    dict
+        The index, as returned by :func:`index_drs_tree`.
+    """
+    return index_drs_tree(
+        Path(store_dir) / dataset_dict["suite_id"], dataset_dict
+    )
+
+
+def _overlaps(years, other_years):
+    """Return whether two ranges of years, as from ``parse_years``, overlap."""
+    if years is None or other_years is None:
+        return False
+    return years[0] <= other_years[1] and other_years[0] <= years[1]
+
+
+def merge_indexes(*indexes):
+    """
+    Combine indexes of standardised data, in order of preference.
+
+    A file is left out if a file earlier in the same index, or in an
+    earlier index, has the same relative path or covers any of the same
+    years, so the combined index never lists overlapping files.
+
+    Parameters
+    ----------
+    *indexes: dict
+        The indexes, as returned by :func:`index_drs_tree`.
+
+    Returns
+    -------
+    dict
+        The combined index.
+    """
+    merged = {}
+    for index in indexes:
+        for variable, entries in index.items():
+            merged_entries = merged.setdefault(variable, [])
+            for entry in entries:
+                if any(
+                    entry[1] == kept[1] or _overlaps(entry[2], kept[2])
+                    for kept in merged_entries
+                ):
+                    continue
+                merged_entries.append(entry)
+    return merged
+
+
+def stored_years(entries):
+    """
+    Return the set of years covered by the files of a variable in the store.
+
+    Files without a date range are taken to cover every year.
+
+    Parameters
+    ----------
+    entries: list of tuples
+        The ``(root directory, relative path, years)`` of each file of
+        the variable.
+
+    Returns
+    -------
+    set of int or None
+        The years, or None if every year is covered.
+    """
+    years = set()
+    for _, _, file_years in entries:
+        if file_years is None:
+            return None
+        years.update(range(file_years[0], file_years[1] + 1))
+    return years
+
+
+def widen_years(index, variables, years, chunk):
+    """
+    Widen a range of years to cover every file of the variables it overlaps,
+    within a chunk of years.
+
+    A file which covers only some of the years being standardised can't be
+    linked alongside the newly standardised files, so all of its years are
+    standardised again instead of being lost. The years never go outside
+    the chunk, so the chunks never standardise the same years; a file
+    which also covers years outside the chunk is listed instead, so it can
+    be left out of the index and all of its years standardised again by
+    each chunk it covers.
+
+    Parameters
+    ----------
+    index: dict
+        The index of the store, as returned by :func:`index_store`.
+    variables: list of str
+        The variables being standardised, in the format
+        "MIP_table/variable_name:stream".
+    years: tuple of int
+        The first and last years (inclusive) being standardised.
+    chunk: tuple of int
+        The first and last years (inclusive) of the chunk.
+
+    Returns
+    -------
+    tuple
+        The first and last years (inclusive), widened so that no file of
+        the variables within the chunk covers years both inside and outside
+        them, and the set of ``(root directory, relative path, years)`` of
+        the files of the variables which overlap them and go outside the
+        chunk.
+    """
+    first, last = years
+    straddling = set()
+    widened = True
+    while widened:
+        widened = False
+        for streamed_variable in variables:
+            for entry in index.get(streamed_variable.split(":")[0], []):
+                file_years = entry[2]
+                if not _overlaps(file_years, (first, last)):
+                    continue
+                if file_years[0] < chunk[0] or file_years[1] > chunk[1]:
+                    straddling.add(entry)
+                widened_first = max(chunk[0], min(first, file_years[0]))
+                widened_last = min(chunk[1], max(last, file_years[1]))
+                if (widened_first, widened_last) != (first, last):
+                    first, last = widened_first, widened_last
+                    widened = True
+    return (first, last), straddling
+
+
+def _plan_chunk(index, streamed_variables, chunk):
+    """
+    Return the variables and years to standardise for a chunk, as
+    :func:`plan_chunk`, and the stored files which go outside the chunk
+    but overlap those years, as :func:`widen_years`.
+    """
+    missing_variables = []
+    missing_years = set()
+    chunk_years = set(range(chunk[0], chunk[1] + 1))
+    for streamed_variable in streamed_variables:
+        variable = streamed_variable.split(":")[0]
+        years = stored_years(index.get(variable, []))
+        if years is None:
+            continue
+        missing = chunk_years - years
+        if missing:
+            missing_variables.append(streamed_variable)
+            missing_years.update(missing)
+
+    if not missing_years:
+        return [], None, set()
+    years, straddling = widen_years(
+        index,
+        missing_variables,
+        (min(missing_years), max(missing_years)),
+        chunk,
+    )
+    return missing_variables, years, straddling
+
+
+def plan_chunks(index, streamed_variables, chunks):
+    """
+    Work out what to standardise for each chunk of years of a stream.
+
+    A stored file which covers years in more than one chunk, and some of
+    the years a chunk standardises, is not used at all, so every chunk it
+    covers standardises its years again. The chunks are planned again
+    without such files until there are none.
+
+    Parameters
+    ----------
+    index: dict
+        The index of the store, as returned by :func:`index_store`.
+    streamed_variables: list of str
+        The variables, in the format "MIP_table/variable_name:stream".
+    chunks: list of tuples of int
+        The first and last years (inclusive) of each chunk.
+
+    Returns
+    -------
+    list of tuples
+        For each chunk, the variables with years missing from the store,
+        and the first and last years (inclusive) spanning every missing
+        year, within the chunk; or an empty list and None if nothing is
+        missing.
+    """
+    dropped = set()
+    while True:
+        kept = {
+            variable: [entry for entry in entries if entry not in dropped]
+            for variable, entries in index.items()
+        }
+        plans = []
+        straddling = set()
+        for chunk in chunks:
+            variables, years, chunk_straddling = _plan_chunk(
+                kept, streamed_variables, chunk
+            )
+            plans.append((variables, years))
+            straddling.update(chunk_straddling)
+        if not straddling:
+            return plans
+        for entry in sorted(straddling):
+            logger.info(
+                "Standardising %s again, as it covers more than one chunk",
+                entry[1],
+            )
+        dropped.update(straddling)
+
+
+def plan_chunk(index, streamed_variables, chunk):
+    """
+    Work out what to standardise for a single chunk of years.
+
+    Parameters
+    ----------
+    index: dict
+        The index of the store, as returned by :func:`index_store`.
+    streamed_variables: list of str
+        The variables, in the format "MIP_table/variable_name:stream".
+    chunk: tuple of int
+        The first and last years (inclusive) of the chunk.
+
+    Returns
+    -------
+    tuple
+        The variables with years missing from the store, and the first and
+        last years (inclusive) spanning every missing year, as planned by
+        :func:`plan_chunks`; or an empty list and None if nothing is
+        missing.
+    """
+    return plan_chunks(index, streamed_variables, [chunk])[0]
+
+
+def link_stored_files(index, requested, restructured_dir):
+    """
+    Symlink previously standardised files into the restructured directory.
+
+    A file is linked unless it covers any year that is being standardised
+    for the same variable, so the linked and newly standardised files never
+    overlap. Files already in the restructured directory which overlap are
+    removed, as they will be replaced. The index must not list overlapping
+    files, as guaranteed by :func:`merge_indexes`.
+
+    Parameters
+    ----------
+    index: dict
+        The index of previously standardised data, as returned by
+        :func:`index_drs_tree` or :func:`merge_indexes`.
+    requested: dict
+        A mapping of "MIP_table/variable_name" to the set of years which
+        are being standardised for every variable needed by the workflow.
+    restructured_dir: str
+        The full path to the restructured data directory.
+
+    Returns
+    -------
+    int
+        The number of files linked.
+    """
+    linked = 0
+    for variable, requested_years in requested.items():
+        for root_dir, relative_path, years in index.get(variable, []):
+            if years is None:
+                file_years = set()
+                overlap = requested_years
+            else:
+                file_years = set(range(years[0], years[1] + 1))
+                overlap = requested_years & file_years
+            target = Path(restructured_dir) / relative_path
+            in_place = Path(root_dir) == Path(restructured_dir)
+
+            if overlap:
+                if in_place:
+                    logger.info("Removing %s to standardise again", target)
+                    target.unlink()
+                elif not file_years.issubset(requested_years):
+                    logger.warning(
+                        "Not linking %s, which covers some of the years "
+                        "being standardised, so its other years are missing",
+                        relative_path,
+                    )
+                continue
+            if in_place:
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if target.is_symlink() or target.exists():
+                target.unlink()
+            target.symlink_to(Path(root_dir) / relative_path)
+            linked += 1
+
+    logger.info("Linked %s previously standardised files", linked)
+    return linked
+
+
+def match_suite_id(relative_dir, model_runs):
+    """
+    Return the suite ID of the model run a restructured directory belongs to.
+
+    Parameters
+    ----------
+    relative_dir: Path
+        The directory, relative to the restructured data directory,
+        at least as deep as the ensemble member directories.
+    model_runs: dict
+        The facets of each model run, from ``model_runs.yml``.
+
+    Returns
+    -------
+    str or None
+        The suite ID, or None if no model run matches.
+    """
+    if len(relative_dir.parts) < _ENSEMBLE_DEPTH:
+        return None
+    dataset, exp, ensemble = relative_dir.parts[3:6]
+    for suite_id, dataset_dict in model_runs.items():
+        if (
+            dataset_dict["model_id"],
+            dataset_dict["experiment_id"],
+            dataset_dict["variant_label"],
+        ) == (dataset, exp, ensemble):
+            return suite_id
+    return None
+
+
+def publish_to_store(restructured_dir, store_dir, model_runs):
+    """
+    Add newly standardised files in the restructured directory to the store.
+
+    Files already in the store are left alone. Each file is hard linked
+    into the store where possible, otherwise copied, under a temporary name
+    which is then renamed, so other workflows never see part of a file.
+
+    Parameters
+    ----------
+    restructured_dir: str
+        The full path to the restructured data directory.
+    store_dir: str
+        The full path to the store.
+    model_runs: dict
+        The facets of each model run, from ``model_runs.yml``.
+
+    Returns
+    -------
+    int
+        The number of files added to the store.
+    """
+    published = 0
+    for root, dirs, files in os.walk(restructured_dir, followlinks=True):
+        relative_dir = Path(root).relative_to(restructured_dir)
+        suite_id = match_suite_id(relative_dir, model_runs)
+        if suite_id is None:
+            # Don't look through the data of other model runs
+            if len(relative_dir.parts) >= _ENSEMBLE_DEPTH:
+                dirs[:] = []
+            continue
+        if len(relative_dir.parts) != _DRS_DEPTH:
+            continue
+
+        target_dir = Path(store_dir) / suite_id / relative_dir
+        for name in sorted(files):
+            source = Path(root) / name
+            target = target_dir / name
+            if target.exists() or source.resolve().is_relative_to(
+                Path(store_dir).resolve()
+            ):
+                continue
+
+            target_dir.mkdir(parents=True, exist_ok=True)
+            partial = target_dir / f".{name}.{os.getpid()}"
+            try:
+                os.link(source.resolve(), partial)
+            except OSError:
+                shutil.copy2(source, partial)
+            os.replace(partial, target)
+            published += 1
+
+    logger.info("Added %s files to the store", published)
+    return published
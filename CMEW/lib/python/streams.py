@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+List the model output streams which CMEW standardises.
+
+The streams are the keys of ``app/configure_standardise/etc/streams.yml``.
+The Jinja2 in ``flow.cylc`` uses them as the values of the ``stream`` task
+parameter, so that each dataset is standardised by one task per stream.
+Like ``scrape_ini.py``, this module only uses the standard library, as it
+is imported by the Python that runs Cylc.
+"""
+import os
+import re
+
+# A top level key of a YAML mapping, e.g. "apm:"
+_TOP_LEVEL_KEY = re.compile(r"^([^\s#:-][^:]*):\s*(#.*)?$")
+
+
+def read_top_level_keys(content):
+    """
+    List the top level keys of a YAML mapping.
+
+    Parameters
+    ----------
+    content: list of strings
+        The lines of the YAML file.
+
+    Returns
+    -------
+    list
+        The top level keys, in the order they appear.
+    """
+    keys = []
+    for line in content:
+        match = _TOP_LEVEL_KEY.match(line.rstrip())
+        if match:
+            keys.append(match.group(1).strip().strip("\"'"))
+    return keys
+
+
+def list_configured_streams(stream_config_fp):
+    """
+    Obtain a string listing the streams in a stream configuration file.
+
+    Parameters
+    ----------
+    stream_config_fp: str
+        The full path to the file containing
+        the data streams for each variable.
+
+    Returns
+    -------
+    str
+        The list of streams, in a comma separated string.
+    """
+    with open(stream_config_fp, "r") as file_handle:
+        streams = read_top_level_keys(file_handle.readlines())
+    streams_string = ", ".join(streams)
+
+    print(f"[streams.py] Streams found: {streams_string}")
+    return streams_string
+
+
+def stream_file_path(file_path, stream, chunk=None):
+    """
+    Return the path of the per-stream version of a file.
+
+    The stream, and the chunk if given, are appended to the file name,
+    before the extension, e.g. ``request_u-cw673.cfg`` becomes
+    ``request_u-cw673_apm.cfg``, or ``request_u-cw673_apm_1993.cfg``.
+
+    Parameters
+    ----------
+    file_path: str
+        The full path to the file for all streams.
+    stream: str
+        The name of the stream.
+    chunk: int or str, optional
+        The first year of a chunk of years.
+
+    Returns
+    -------
+    str
+        The full path to the file for the stream.
+    """
+    root, extension = os.path.splitext(str(file_path))
+    if chunk is None:
+        return f"{root}_{stream}{extension}"
+    return f"{root}_{stream}_{chunk}{extension}"
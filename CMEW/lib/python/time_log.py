@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Read the resource usage of tasks, recorded by ``/usr/bin/time -v``.
+
+The site environment wrappers (e.g. ``site/metoffice-esmvaltool-env``) run
+each command under ``/usr/bin/time -v``, appending the totals to
+``${CYLC_TASK_LOG_ROOT}.time``, i.e.
+``log/job/<cycle>/<task>/<submit>/job.time`` in the run directory. A job
+which runs several commands through the wrappers, e.g.
+``standardise_model_data``, writes the totals of each in turn, which are
+combined into the usage of the job.
+"""
+import os
+import re
+
+# The name of the file each job writes its resource usage to
+TIME_LOG_NAME = "job.time"
+
+# The labels written by GNU time, with the name and type of each value
+TIME_LOG_FIELDS = {
+    "User time (seconds)": ("user_seconds", float),
+    "System time (seconds)": ("system_seconds", float),
+    "Percent of CPU this job got": ("percent_cpu", int),
+    "Elapsed (wall clock) time (h:mm:ss or m:ss)": ("elapsed_seconds", None),
+    "Maximum resident set size (kbytes)": ("max_rss_kb", int),
+    "Major (requiring I/O) page faults": ("major_page_faults", int),
+    "Minor (reclaiming a frame) page faults": ("minor_page_faults", int),
+    "Voluntary context switches": ("voluntary_context_switches", int),
+    "Involuntary context switches": ("involuntary_context_switches", int),
+    "File system inputs": ("file_system_inputs", int),
+    "File system outputs": ("file_system_outputs", int),
+    "Exit status": ("exit_status", int),
+}
+
+# The fields of a job which are the largest value of any of its commands,
+# rather than the total over its commands
+_MAXIMUM_FIELDS = ("max_rss_kb", "percent_cpu")
+
+# The label of the last line GNU time writes for each command
+_LAST_LABEL = "Exit status"
+
+# A submit number directory, e.g. "01"
+_SUBMIT = re.compile(r"^\d+$")
+
+
+def parse_elapsed(value):
+    """
+    Return the number of seconds in an elapsed time written by GNU time.
+
+    Parameters
+    ----------
+    value: str
+        The elapsed time, e.g. "1:02:03" or "2:03.45".
+
+    Returns
+    -------
+    float
+        The number of seconds, e.g. 3723.0 or 123.45.
+    """
+    seconds = 0.0
+    for part in value.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def parse_time_log(content):
+    """
+    Parse the output of ``/usr/bin/time -v``.
+
+    Parameters
+    ----------
+    content: list of strings
+        The lines of the file.
+
+    Returns
+    -------
+    dict
+        The values of the fields in ``TIME_LOG_FIELDS`` found in the file.
+        Values which GNU time couldn't measure (e.g. "?%") are skipped.
+    """
+    usage = {}
+    for line in content:
+        label, _, value = line.strip().rpartition(": ")
+        if label not in TIME_LOG_FIELDS:
+            continue
+        name, value_type = TIME_LOG_FIELDS[label]
+        value = value.strip().rstrip("%")
+        try:
+            usage[name] = (
+                parse_elapsed(value)
+                if value_type is None
+                else value_type(value)
+            )
+        except ValueError:
+            continue
+    return usage
+
+
+def split_time_log(content):
+    """
+    Split the output of ``/usr/bin/time -v`` for several commands, appended
+    to the same file, into the output for each command.
+
+    Parameters
+    ----------
+    content: list of strings
+        The lines of the file.
+
+    Returns
+    -------
+    list of lists of strings
+        The lines written for each command, each ending with its exit
+        status. Lines after the last exit status are left out.
+    """
+    commands = []
+    lines = []
+    for line in content:
+        lines.append(line)
+        if line.strip().startswith(f"{_LAST_LABEL}:"):
+            commands.append(lines)
+            lines = []
+    return commands
+
+
+def combine_usage(usages):
+    """
+    Combine the resource usage of the commands run by a job.
+
+    The times, page faults, context switches and file system inputs and
+    outputs are summed, as the commands run one after another. The memory
+    and percentage of CPU are the largest of any command, and the exit
+    status is the first which isn't 0.
+
+    Parameters
+    ----------
+    usages: list of dicts
+        The resource usage of each command, as returned by
+        :func:`parse_time_log`.
+
+    Returns
+    -------
+    dict
+        The resource usage of the job.
+    """
+    combined = {}
+    for usage in usages:
+        for name, value in usage.items():
+            if name not in combined:
+                combined[name] = value
+            elif name in _MAXIMUM_FIELDS:
+                combined[name] = max(combined[name], value)
+            elif name == "exit_status":
+                combined[name] = combined[name] or value
+            else:
+                combined[name] += value
+    return combined
+
+
+def read_time_log(fp):
+    """
+    Return the resource usage of a job in the ``.time`` file at ``fp``,
+    combining that of each of its commands.
+    """
+    with open(fp) as file_handle:
+        content = file_handle.readlines()
+    return combine_usage(
+        [parse_time_log(lines) for lines in split_time_log(content)]
+    )
+
+
+def find_time_logs(run_dir):
+    """
+    Lazily find the resource usage of every job of a workflow.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+
+    Yields
+    ------
+    tuple
+        The cycle point, task name, submit number and full path to the
+        ``.time`` file of each job which wrote one.
+    """
+    job_dir = os.path.join(run_dir, "log", "job")
+    for cycle in sorted(os.listdir(job_dir)) if os.path.isdir(job_dir) else []:
+        cycle_dir = os.path.join(job_dir, cycle)
+        for task in sorted(os.listdir(cycle_dir)):
+            task_dir = os.path.join(cycle_dir, task)
+            if not os.path.isdir(task_dir):
+                continue
+            for submit in sorted(os.listdir(task_dir)):
+                fp = os.path.join(task_dir, submit, TIME_LOG_NAME)
+                if _SUBMIT.match(submit) and os.path.isfile(fp):
+                    yield cycle, task, int(submit), fp
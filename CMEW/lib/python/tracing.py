@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Record how long the steps of the CMEW commands take, as a trace which can be
+opened in Perfetto (https://ui.perfetto.dev) or ``chrome://tracing``.
+
+Steps are marked either by decorating a function:
+
+.. code-block:: python
+
+    @traced
+    def update_recipe_file(...):
+        ...
+
+or, for part of a function, with a span:
+
+.. code-block:: python
+
+    with span("merge model runs", path=model_runs_yml_fp):
+        ...
+
+Tracing is turned on by setting the ``CMEW_TRACE`` environment variable to
+"true". The spans are then written, when the command exits, in the Trace
+Event Format to ``<command>-<process ID>.trace.json`` in the job log
+directory of the task, or the current directory outside Cylc. The start of
+each span is the time since the epoch, so the traces of every task, and the
+times Cylc recorded for each job, can be combined into a single timeline;
+see :func:`merge_traces`.
+
+When tracing is off, a traced function costs one extra check when called,
+and a span is a shared context manager which does nothing. Only the
+standard library is used, so that the module can be imported by the Jinja2
+in ``flow.cylc``.
+"""
+import atexit
+import functools
+import glob
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+# The environment variable which turns tracing on
+TRACE_ENV = "CMEW_TRACE"
+
+# The values of ``TRACE_ENV`` which turn tracing on
+TRUE_VALUES = ("true", "1", "yes")
+
+# The suffix of the trace files
+TRACE_SUFFIX = ".trace.json"
+
+# A submit number directory, e.g. "01", rather than the "NN" link to the
+# latest one
+_SUBMIT = re.compile(r"^\d+$")
+
+# The spans recorded by this process, or None if tracing is off
+_events = None
+
+
+def tracing_enabled():
+    """Return whether spans are being recorded."""
+    return _events is not None
+
+
+def trace_path():
+    """Return the full path to the trace file of this process."""
+    command = os.path.basename(sys.argv[0] or "python") or "python"
+    return os.path.join(
+        os.environ.get("CYLC_TASK_LOG_DIR") or os.getcwd(),
+        f"{command}-{os.getpid()}{TRACE_SUFFIX}",
+    )
+
+
+def start_tracing():
+    """
+    Start recording spans, and write them to :func:`trace_path` at exit.
+    """
+    global _events
+    if _events is not None:
+        return
+    # Name the process after the task and command, e.g.
+    # "1/configure_for configure_for"
+    name = os.path.basename(sys.argv[0])
+    if os.environ.get("CYLC_TASK_ID"):
+        name = f"{os.environ['CYLC_TASK_ID']} {name}"
+    _events = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "args": {"name": name},
+        }
+    ]
+    atexit.register(write_trace)
+
+
+def stop_tracing():
+    """Stop recording spans, and return those recorded."""
+    global _events
+    events, _events = _events or [], None
+    atexit.unregister(write_trace)
+    return events
+
+
+def write_trace(path=None):
+    """
+    Write the spans recorded so far to a trace file.
+
+    Parameters
+    ----------
+    path: str, optional
+        The full path to the trace file; by default, :func:`trace_path`.
+    """
+    if not _events:
+        return
+    path = path or trace_path()
+    with open(path, "w") as file_handle:
+        json.dump(
+            {"traceEvents": _events, "displayTimeUnit": "ms"}, file_handle
+        )
+
+
+class _Span:
+    """Record the time taken by the body of a ``with`` statement."""
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.time_ns() // 1000
+        self.counter = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if _events is None:
+            return
+        args = {name: str(value) for name, value in self.args.items()}
+        if exc_type is not None:
+            args["error"] = exc_type.__name__
+        _events.append(
+            {
+                "name": self.name,
+                "cat": self.category,
+                "ph": "X",
+                "ts": self.start,
+                "dur": (time.perf_counter_ns() - self.counter) // 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+
+class _NoSpan:
+    """A span which records nothing, used when tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, category="cmew", **args):
+    """
+    Return a context manager recording the time taken by its body.
+
+    Parameters
+    ----------
+    name: str
+        The name of the step, e.g. "write recipe".
+    category: str, optional
+        The category of the step, e.g. the name of the module.
+    **args
+        Details of the step shown with it in the trace, e.g. file paths.
+    """
+    if _events is None:
+        return _NO_SPAN
+    return _Span(name, category, args)
+
+
+def traced(function):
+    """
+    Record the time taken by each call to a function.
+
+    The span is named after the function, in the category of its module.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _events is None:
+            return function(*args, **kwargs)
+        with _Span(function.__qualname__, function.__module__, {}):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def find_traces(run_dir):
+    """
+    Return the full paths to the trace files written by every job of a
+    workflow.
+
+    Parameters
+    ----------
+    run_dir: str
+        The full path to the run directory of the workflow.
+
+    Returns
+    -------
+    list of strings
+        The trace files, in order of cycle point, task name and submit
+        number. Those of the latest submit of each task are only listed
+        once, not again through its "NN" link.
+    """
+    return sorted(
+        path
+        for path in glob.glob(
+            os.path.join(
+                run_dir, "log", "job", "*", "*", "*", f"*{TRACE_SUFFIX}"
+            )
+        )
+        if _SUBMIT.match(os.path.basename(os.path.dirname(path)))
+    )
+
+
+def merge_traces(trace_paths, events=()):
+    """
+    Combine trace files into a single trace.
+
+    Parameters
+    ----------
+    trace_paths: iterable of strings
+        The full paths to the trace files. Files which can't be read, e.g.
+        those of a job killed while writing them, are skipped.
+    events: iterable of dicts, optional
+        Other events to include, e.g. those of the jobs recorded by Cylc.
+
+    Returns
+    -------
+    dict
+        The combined trace, in the Trace Event Format.
+    """
+    merged = list(events)
+    for path in trace_paths:
+        try:
+            with open(path) as file_handle:
+                merged.extend(json.load(file_handle)["traceEvents"])
+        except (OSError, ValueError, KeyError):
+            continue
+    return {"traceEvents": merged, "displayTimeUnit": "ms"}
+
+
+if os.environ.get(TRACE_ENV, "").strip().lower() in TRUE_VALUES:
+    start_tracing()
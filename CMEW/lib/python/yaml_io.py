@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# (C) Crown Copyright 2026, Met Office.
+# The LICENSE.md file contains full licensing details.
+"""
+Read and write YAML files for the CMEW applications.
+
+The libyaml based ``CSafeLoader`` and ``CSafeDumper`` are used when PyYAML
+has been built with them, falling back to the pure Python implementations
+otherwise. Files are written atomically and parsed files are cached on
+their path and modification time.
+"""
+import copy
+import functools
+import os
+import uuid
+
+import yaml
+
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def safe_load(stream):
+    """
+    Parse a YAML document from a string or an open file.
+
+    Parameters
+    ----------
+    stream: str or file object
+        The YAML content.
+
+    Returns
+    -------
+    object
+        The parsed content.
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(contents, stream=None, sort_keys=True):
+    """
+    Serialise ``contents`` as a block style YAML document.
+
+    Parameters
+    ----------
+    contents: object
+        The content to serialise.
+    stream: file object, optional
+        Where to write the content. If not given, the YAML is returned.
+    sort_keys: bool
+        Whether to sort the keys of dictionaries. If False, keys are written
+        in insertion order.
+
+    Returns
+    -------
+    str or None
+        The YAML document, if ``stream`` was not given.
+    """
+    return yaml.dump(
+        contents,
+        stream,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=sort_keys,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _load_file(file_path, mtime_ns, size):
+    """
+    Parse a YAML file.
+
+    ``mtime_ns`` and ``size`` are only used as part of the cache key, so
+    that the file is parsed again if it changes.
+    """
+    with open(file_path, "r", encoding="utf-8") as file_handle:
+        return safe_load(file_handle)
+
+
+def load_yaml(file_path, use_cache=True):
+    """
+    Return the content of the YAML file at ``file_path``.
+
+    Parsed content is cached on the file path, modification time and size,
+    and a deep copy is returned so callers are free to modify it.
+
+    Parameters
+    ----------
+    file_path: str
+        The full path to the YAML file.
+    use_cache: bool
+        Whether to use, and store, the cached content.
+
+    Returns
+    -------
+    object
+        The content of the YAML file.
+    """
+    file_path = os.path.abspath(file_path)
+    if not use_cache:
+        with open(file_path, "r", encoding="utf-8") as file_handle:
+            return safe_load(file_handle)
+
+    stat = os.stat(file_path)
+    contents = _load_file(file_path, stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(contents)
+
+
+def write_text(text, target_path):
+    """
+    Atomically write ``text`` to the file at ``target_path``.
+
+    The text is written to a temporary file in the same directory, which is
+    then renamed, so ``target_path`` is never left half-written. The
+    temporary file is created with the usual permissions, as the kernel
+    applies the umask to them, so the umask never has to be changed.
+
+    Parameters
+    ----------
+    text: str
+        The text to write.
+    target_path: str
+        The full path to the file.
+    """
+    target_dir, name = os.path.split(os.path.abspath(target_path))
+    temp_path = os.path.join(target_dir, f".{name}.{uuid.uuid4().hex}.tmp")
+    descriptor = os.open(
+        temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666
+    )
+    try:
+        with open(descriptor, "w", encoding="utf-8") as file_handle:
+            file_handle.write(text)
+        os.replace(temp_path, target_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def write_yaml(contents, target_path, sort_keys=True):
+    """
+    Atomically write ``contents`` to the YAML file at ``target_path``.
+
+    Parameters
+    ----------
+    contents: object
+        The content to write.
+    target_path: str
+        The full path to the YAML file.
+    sort_keys: bool
+        Whether to sort the keys of dictionaries. If False, keys are written
+        in insertion order.
+    """
+    write_text(safe_dump(contents, sort_keys=sort_keys), target_path)